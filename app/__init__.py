@@ -54,10 +54,12 @@ def create_app(config_name=None):
         """Inject global variables into templates."""
         from flask_login import current_user
         from app.models import Notification
+        from app.services.fragment_cache import render_project_card
 
         data = {
             'platform_name': 'Solio',
-            'platform_fee_percent': app.config.get('PLATFORM_FEE_PERCENT', 2.5)
+            'platform_fee_percent': app.config.get('PLATFORM_FEE_PERCENT', 2.5),
+            'render_project_card': render_project_card
         }
 
         # Add unread notification count for logged-in users
@@ -74,6 +76,7 @@ def create_app(config_name=None):
 def register_error_handlers(app):
     """Register error handlers."""
     from flask import render_template, jsonify, request
+    from app.utils.pagination import InvalidCursor
 
     @app.errorhandler(400)
     def bad_request(error):
@@ -112,6 +115,11 @@ def register_error_handlers(app):
             return jsonify({'error': 'Internal server error'}), 500
         return render_template('errors/500.html'), 500
 
+    @app.errorhandler(InvalidCursor)
+    def invalid_cursor(error):
+        # Only the JSON list endpoints take cursors
+        return jsonify({'error': 'Invalid cursor'}), 400
+
 
 def register_cli_commands(app):
     """Register CLI commands."""
@@ -121,14 +129,37 @@ def register_cli_commands(app):
     def init_db():
         """Initialize the database."""
         db.create_all()
+        from app.services.search_service import ensure_search_index
+        ensure_search_index()
         click.echo('Database initialized.')
 
+    @app.cli.command('reindex-search')
+    def reindex_search():
+        """Rebuild the project full-text search index."""
+        from app.services.search_service import reindex_projects
+        indexed = reindex_projects()
+        click.echo(f'Indexed {indexed} projects.')
+
+    @app.cli.command('rebuild-trending')
+    def rebuild_trending():
+        """Recompute trending scores from recent donations."""
+        from app.services.trending_service import rebuild_trending_scores
+        scored = rebuild_trending_scores()
+        click.echo(f'Scored {scored} trending projects.')
+
+    @app.cli.command('repair-donation-counts')
+    def repair_donation_counts():
+        """Recompute project donation and donor counts."""
+        from app.services.donation_service import repair_donation_counts as repair
+        corrected = repair()
+        click.echo(f'Corrected counts for {corrected} projects.')
+
     @app.cli.command('cleanup-nonces')
     def cleanup_nonces():
         """Clean up expired wallet nonces."""
-        from app.models import WalletNonce
-        WalletNonce.cleanup_expired()
-        click.echo('Expired nonces cleaned up.')
+        from app.services.nonce_store import get_nonce_store
+        removed = get_nonce_store().cleanup()
+        click.echo(f'Cleaned up {removed} expired nonces.')
 
     @app.cli.command('process-payouts')
     def process_payouts():
@@ -137,6 +168,39 @@ def register_cli_commands(app):
         count = process_pending_payouts()
         click.echo(f'Processed {count} payouts.')
 
+    @app.cli.command('verify-donations')
+    def verify_donations():
+        """Verify pending donations."""
+        from app.services.donation_service import process_pending_donations
+        count = process_pending_donations()
+        click.echo(f'Confirmed {count} donations.')
+
+    @app.cli.command('index-wallet')
+    def index_wallet():
+        """Scan platform wallet history and reconcile donations."""
+        from app.services.indexer_service import index_platform_wallet
+        summary = index_platform_wallet()
+        click.echo(
+            f"Scanned {summary['scanned']} transactions, credited {summary['credited']} "
+            f"donations, {summary['unmatched']} unmatched."
+        )
+
+    @app.cli.command('reconciliation-report')
+    def reconciliation_report():
+        """Show incoming transfers that match no donation."""
+        from app.services.indexer_service import get_reconciliation_report
+        report = get_reconciliation_report()
+        click.echo(f"Cursor: {report['cursor_signature']} (slot {report['cursor_slot']})")
+        click.echo(
+            f"{report['unmatched_count']} unmatched transfers, "
+            f"{report['unmatched_total_sol']} SOL total"
+        )
+        for transfer in report['transfers']:
+            click.echo(
+                f"  {transfer['tx_signature']}  {transfer['amount_sol']} SOL "
+                f"from {transfer['source_wallet']}  [{transfer['reason']}]"
+            )
+
     @app.cli.command('make-admin')
     @click.argument('username')
     def make_admin(username):
@@ -35,6 +35,48 @@ class Config:
         'SOLANA_DEVNET_RPC_URL',
         'https://api.devnet.solana.com'
     )
+    # WebSocket endpoints for subscriptions (derived from the RPC URL if empty)
+    SOLANA_WS_URL = os.environ.get('SOLANA_WS_URL', '')
+    SOLANA_DEVNET_WS_URL = os.environ.get('SOLANA_DEVNET_WS_URL', '')
+    # Optional comma-separated fallback endpoints, tried after the primary URL
+    SOLANA_RPC_FALLBACK_URLS = os.environ.get('SOLANA_RPC_FALLBACK_URLS', '')
+    SOLANA_DEVNET_RPC_FALLBACK_URLS = os.environ.get('SOLANA_DEVNET_RPC_FALLBACK_URLS', '')
+    SOLANA_RPC_TIMEOUT = 30
+    SOLANA_RPC_EJECT_AFTER = 3  # consecutive failures before an endpoint is ejected
+    SOLANA_RPC_EJECT_COOLDOWN = 5  # seconds, doubles on each ejection
+    SOLANA_RPC_POOL_SIZE = int(os.environ.get('SOLANA_RPC_POOL_SIZE', 10))
+    SOLANA_RPC_BATCH_SIZE = 10  # calls per JSON-RPC batch request
+
+    # Donation verification: commitment to wait for and polling deadline
+    SOLANA_VERIFY_COMMITMENT = os.environ.get('SOLANA_VERIFY_COMMITMENT', 'confirmed')
+    SOLANA_VERIFY_TIMEOUT = int(os.environ.get('SOLANA_VERIFY_TIMEOUT', 20))  # seconds
+    SOLANA_VERIFY_INITIAL_DELAY = 0.5  # seconds, doubles up to the max
+    SOLANA_VERIFY_MAX_DELAY = 4
+
+    # Shared blockhash cache: refreshed in the background once older than
+    # BLOCKHASH_REFRESH_SECONDS, refetched before signing once fewer than
+    # BLOCKHASH_MIN_BLOCKS_LEFT blocks remain before its last valid block
+    # height (or past the max age, if the block height can't be read)
+    SOLANA_BLOCKHASH_COMMITMENT = 'finalized'
+    BLOCKHASH_REFRESH_SECONDS = 15
+    BLOCKHASH_MIN_BLOCKS_LEFT = 30
+    BLOCKHASH_MAX_AGE_SECONDS = 30
+
+    # Priority fees for transactions we send (payouts).
+    # Policy: 'dynamic' (percentile of recent fees), 'fixed' or 'none'
+    PRIORITY_FEE_POLICY = os.environ.get('PRIORITY_FEE_POLICY', 'dynamic')
+    PRIORITY_FEE_PERCENTILE = 75
+    PRIORITY_FEE_MICROLAMPORTS = int(os.environ.get('PRIORITY_FEE_MICROLAMPORTS', 10000))  # fixed policy
+    PRIORITY_FEE_MIN_MICROLAMPORTS = 0
+    PRIORITY_FEE_MAX_MICROLAMPORTS = 1_000_000  # caps a full 20-transfer batch at 3,300 lamports
+    PRIORITY_FEE_REFRESH_SECONDS = 10
+
+    # Decoded wallet public keys kept for signature verification (per process)
+    WALLET_KEY_CACHE_SIZE = 4096
+
+    # Finalized transaction cache (in-process LRU, shared via Redis if available)
+    TX_CACHE_MAX_BYTES = 32 * 1024 * 1024
+    TX_CACHE_REDIS_URL = os.environ.get('REDIS_URL', '')
     PLATFORM_WALLET_ADDRESS = os.environ.get('PLATFORM_WALLET_ADDRESS', '')
     PLATFORM_WALLET_SECRET = os.environ.get('PLATFORM_WALLET_SECRET', '')
     PLATFORM_FEE_PERCENT = 2.5
@@ -74,14 +116,58 @@ class Config:
     RATELIMIT_DEFAULT = "200 per day, 50 per hour"
     RATELIMIT_HEADERS_ENABLED = True
 
-    # Wallet auth
+    # Wallet auth. Nonce store: 'redis', 'memory' (single process only) or
+    # 'sql'; empty uses Redis when configured, else the wallet_nonces table
     WALLET_NONCE_EXPIRY_MINUTES = 10
+    WALLET_NONCE_STORE = os.environ.get('WALLET_NONCE_STORE', '')
+    WALLET_NONCE_REDIS_URL = os.environ.get('REDIS_URL', '')
+
+    # Platform wallet indexer
+    INDEXER_BACKFILL_LIMIT = 1000  # signatures scanned on the very first run
+    INDEXER_CHUNK_SIZE = 100
 
     # Payout scheduler
     PAYOUT_CHECK_INTERVAL_MINUTES = 5
-
-    # Price cache
-    SOL_PRICE_CACHE_SECONDS = 60
+    PAYOUT_SUBMIT_WORKERS = 4  # concurrent batch submissions
+    PAYOUT_CONFIRM_TIMEOUT = 60  # seconds to wait for batches to finalize
+    PAYOUT_CHUNK_SIZE = 50  # projects / payouts claimed per round
+    PAYOUT_LEASE_SECONDS = 300  # claim expiry if a worker dies mid-run
+
+    # Donation verification
+    DONATION_VERIFY_WORKERS = int(os.environ.get('DONATION_VERIFY_WORKERS', 4))
+    # scripts/signature_listener.py is running; it settles new donations
+    # instead of the web worker pool
+    SIGNATURE_LISTENER_ENABLED = os.environ.get('SIGNATURE_LISTENER_ENABLED', 'false').lower() == 'true'
+    DONATION_VERIFY_STALE_MINUTES = 10
+
+    # SOL/USD price oracle: median of the listed sources, refreshed in the
+    # background by one worker and shared through Redis or a local file
+    SOL_PRICE_SOURCES = os.environ.get('SOL_PRICE_SOURCES', 'coingecko,coinbase,kraken')
+    SOL_PRICE_CACHE_SECONDS = 60  # refresh after
+    SOL_PRICE_MAX_STALE_SECONDS = 3600  # stop serving a price this old
+    SOL_PRICE_MAX_DEVIATION = 0.05  # drop quotes this far from the median
+    SOL_PRICE_FETCH_TIMEOUT = 5
+    SOL_PRICE_REDIS_URL = os.environ.get('REDIS_URL', '')
+    SOL_PRICE_SHARED_FILE = os.environ.get('SOL_PRICE_SHARED_FILE', '')  # default: temp dir
+    # Price history: samples kept in memory, stored every interval seconds;
+    # lookups use the nearest sample within max gap seconds
+    SOL_PRICE_HISTORY_SIZE = 2880
+    SOL_PRICE_HISTORY_INTERVAL = 300
+    SOL_PRICE_HISTORY_MAX_GAP = 6 * 3600
+
+    # Trending sort: each donation's weight halves every half-life; the
+    # scheduler decays all scores every few minutes
+    TRENDING_HALF_LIFE_HOURS = 24
+    TRENDING_DECAY_MINUTES = 10
+    TRENDING_MIN_SCORE = 0.01  # lower scores drop out of trending
+
+    # Rendered project cards and anonymous homepage, kept in memory per
+    # worker and shared through Redis when configured
+    FRAGMENT_CACHE_ENABLED = True
+    FRAGMENT_CACHE_MAX_BYTES = 8 * 1024 * 1024
+    FRAGMENT_CACHE_CARD_SECONDS = 300
+    FRAGMENT_CACHE_PAGE_SECONDS = 60
+    FRAGMENT_CACHE_REDIS_URL = os.environ.get('REDIS_URL', '')
 
 
 class DevelopmentConfig(Config):
@@ -123,6 +209,14 @@ class TestingConfig(Config):
     WTF_CSRF_ENABLED = False
     USE_DEVNET = True
 
+    # Verify donations inline so tests see the final status
+    DONATION_VERIFY_WORKERS = 0
+    # In-memory SQLite shares one connection across threads
+    PAYOUT_SUBMIT_WORKERS = 1
+    PRIORITY_FEE_POLICY = 'none'
+    WALLET_NONCE_STORE = 'memory'
+    FRAGMENT_CACHE_ENABLED = False
+
 
 config = {
     'development': DevelopmentConfig,
@@ -1,4 +1,7 @@
 """Flask extensions initialization."""
+import math
+import sqlite3
+
 from flask_sqlalchemy import SQLAlchemy
 from flask_login import LoginManager
 from flask_migrate import Migrate
@@ -7,6 +10,8 @@ from flask_wtf.csrf import CSRFProtect
 from flask_limiter import Limiter
 from flask_limiter.util import get_remote_address
 from authlib.integrations.flask_client import OAuth
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
 
 # Database
 db = SQLAlchemy()
@@ -66,3 +71,21 @@ def init_oauth(app):
                 'scope': 'tweet.read users.read offline.access'
             }
         )
+
+
+def _sqlite_power(base, exponent):
+    if base is None or exponent is None:
+        return None
+    return math.pow(base, exponent)
+
+
+@event.listens_for(Engine, 'connect')
+def register_sqlite_functions(dbapi_connection, connection_record):
+    """
+    Add SQL functions SQLite may be built without.
+
+    power() (used by the trending score update) only exists in SQLite
+    3.35+ builds with the math functions enabled.
+    """
+    if isinstance(dbapi_connection, sqlite3.Connection):
+        dbapi_connection.create_function('power', 2, _sqlite_power, deterministic=True)
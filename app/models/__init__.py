@@ -10,6 +10,9 @@ from app.models.category import Category
 from app.models.project_update import ProjectUpdate
 from app.models.comment import Comment
 from app.models.notification import Notification
+from app.models.chain_cursor import ChainCursor
+from app.models.unmatched_transfer import UnmatchedTransfer
+from app.models.price_point import PricePoint
 
 __all__ = [
     'User',
@@ -22,5 +25,8 @@ __all__ = [
     'Category',
     'ProjectUpdate',
     'Comment',
-    'Notification'
+    'Notification',
+    'ChainCursor',
+    'UnmatchedTransfer',
+    'PricePoint'
 ]
@@ -0,0 +1,33 @@
+"""Chain cursor model for incremental blockchain indexing."""
+from datetime import datetime
+
+from app.extensions import db
+
+
+class ChainCursor(db.Model):
+    """Last processed signature for a named chain indexer."""
+
+    __tablename__ = 'chain_cursors'
+
+    id = db.Column(db.Integer, primary_key=True)
+    name = db.Column(db.String(50), unique=True, nullable=False)
+
+    # Newest signature that has been fully processed
+    last_signature = db.Column(db.String(100), nullable=True)
+    last_slot = db.Column(db.BigInteger, nullable=True)
+
+    # Timestamps
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+    def __repr__(self):
+        return f'<ChainCursor {self.name} at {self.last_slot}>'
+
+    @classmethod
+    def get_or_create(cls, name):
+        """Get cursor by name, creating an empty one if needed."""
+        cursor = cls.query.filter_by(name=name).first()
+        if not cursor:
+            cursor = cls(name=name)
+            db.session.add(cursor)
+            db.session.flush()
+        return cursor
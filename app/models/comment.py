@@ -7,6 +7,9 @@ class Comment(db.Model):
     """Comments on projects."""
 
     __tablename__ = 'comments'
+    __table_args__ = (
+        db.Index('ix_comments_project_parent_created', 'project_id', 'parent_id', 'created_at', 'id'),
+    )
 
     id = db.Column(db.Integer, primary_key=True)
     project_id = db.Column(db.Integer, db.ForeignKey('projects.id'), nullable=False, index=True)
@@ -1,23 +1,31 @@
 """Donation model."""
 from datetime import datetime
-from decimal import Decimal
 
 from app.extensions import db
+from app.utils.money import sol_property, percent_of
 
 
 class Donation(db.Model):
     """Donation model for tracking contributions."""
 
     __tablename__ = 'donations'
+    __table_args__ = (
+        # Keyset pagination of a project's / user's confirmed donations
+        db.Index('ix_donations_project_status_created', 'project_id', 'status', 'created_at', 'id'),
+        db.Index('ix_donations_user_status_created', 'user_id', 'status', 'created_at', 'id'),
+    )
 
     id = db.Column(db.Integer, primary_key=True)
     project_id = db.Column(db.Integer, db.ForeignKey('projects.id'), nullable=False, index=True)
     user_id = db.Column(db.Integer, db.ForeignKey('users.id'), nullable=True, index=True)
     reward_tier_id = db.Column(db.Integer, db.ForeignKey('reward_tiers.id'), nullable=True, index=True)
 
-    # Amount
-    amount_sol = db.Column(db.Numeric(18, 9), nullable=False)
-    platform_fee = db.Column(db.Numeric(18, 9), nullable=True)  # Calculated 2.5%
+    # Amount, in lamports
+    amount_lamports = db.Column(db.BigInteger, nullable=False)
+    platform_fee_lamports = db.Column(db.BigInteger, nullable=True)  # Calculated 2.5%
+
+    amount_sol = sol_property('amount_lamports')
+    platform_fee = sol_property('platform_fee_lamports')
 
     # Message from donor
     message = db.Column(db.Text, nullable=True)
@@ -29,11 +37,16 @@ class Donation(db.Model):
     tx_signature = db.Column(db.String(100), unique=True, nullable=False, index=True)
     donor_wallet = db.Column(db.String(44), nullable=False)
 
-    # Status: pending, confirmed, failed
+    # Status: pending, verifying, confirmed, failed
     status = db.Column(db.String(20), default='pending', index=True)
+    error_message = db.Column(db.String(255), nullable=True)
+    # Failed only because it couldn't be verified in time; resubmitting
+    # the signature queues it again
+    retryable = db.Column(db.Boolean, nullable=False, default=False)
 
     # Timestamps
     created_at = db.Column(db.DateTime, default=datetime.utcnow, index=True)
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
     def __repr__(self):
         return f'<Donation {self.amount_sol} SOL to project {self.project_id}>'
@@ -60,7 +73,7 @@ class Donation(db.Model):
 
     def calculate_fee(self, fee_percent=2.5):
         """Calculate platform fee."""
-        self.platform_fee = self.amount_sol * Decimal(str(fee_percent)) / Decimal('100')
+        self.platform_fee_lamports = percent_of(self.amount_lamports, fee_percent)
 
     def to_dict(self, include_email=False):
         """Convert donation to dictionary."""
@@ -2,6 +2,7 @@
 from datetime import datetime
 
 from app.extensions import db
+from app.utils.money import sol_property
 
 
 class Milestone(db.Model):
@@ -12,8 +13,9 @@ class Milestone(db.Model):
     id = db.Column(db.Integer, primary_key=True)
     project_id = db.Column(db.Integer, db.ForeignKey('projects.id'), nullable=False, index=True)
 
-    # Goal amount
-    amount_sol = db.Column(db.Numeric(18, 9), nullable=False)
+    # Goal amount, in lamports
+    amount_lamports = db.Column(db.BigInteger, nullable=False)
+    amount_sol = sol_property('amount_lamports')
 
     # Content
     title = db.Column(db.String(100), nullable=False)
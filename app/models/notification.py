@@ -8,6 +8,9 @@ class Notification(db.Model):
     """In-app notification model."""
 
     __tablename__ = 'notifications'
+    __table_args__ = (
+        db.Index('ix_notifications_user_created', 'user_id', 'created_at', 'id'),
+    )
 
     id = db.Column(db.Integer, primary_key=True)
     user_id = db.Column(db.Integer, db.ForeignKey('users.id'), nullable=False, index=True)
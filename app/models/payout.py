@@ -2,6 +2,7 @@
 from datetime import datetime
 
 from app.extensions import db
+from app.utils.money import sol_property
 
 
 class Payout(db.Model):
@@ -12,19 +13,33 @@ class Payout(db.Model):
     id = db.Column(db.Integer, primary_key=True)
     project_id = db.Column(db.Integer, db.ForeignKey('projects.id'), nullable=False, index=True)
 
-    # Amounts
-    total_raised = db.Column(db.Numeric(18, 9), nullable=False)
-    platform_fee = db.Column(db.Numeric(18, 9), nullable=False)  # 2.5%
-    net_amount = db.Column(db.Numeric(18, 9), nullable=False)  # 97.5%
+    # Amounts, in lamports
+    total_raised_lamports = db.Column(db.BigInteger, nullable=False)
+    platform_fee_lamports = db.Column(db.BigInteger, nullable=False)  # 2.5%
+    net_amount_lamports = db.Column(db.BigInteger, nullable=False)  # 97.5%
+
+    total_raised = sol_property('total_raised_lamports')
+    platform_fee = sol_property('platform_fee_lamports')
+    net_amount = sol_property('net_amount_lamports')
 
     # Transaction details
     recipient_wallet = db.Column(db.String(44), nullable=False)
-    tx_signature = db.Column(db.String(100), nullable=True, unique=True)
+    # Several payouts can share one batched transaction
+    tx_signature = db.Column(db.String(100), nullable=True, index=True)
+    # Signed transaction (base64), stored before broadcast so it can be
+    # re-sent or checked after a crash
+    signed_tx = db.Column(db.Text, nullable=True)
+    last_valid_block_height = db.Column(db.BigInteger, nullable=True)
 
-    # Status: pending, processing, completed, failed
+    # Status: pending, signed, processing, completed, failed
     status = db.Column(db.String(20), default='pending', index=True)
     error_message = db.Column(db.Text, nullable=True)
 
+    # Worker claim on a pending payout; expires so a crashed worker's
+    # claims are picked up again
+    lease_owner = db.Column(db.String(64), nullable=True, index=True)
+    lease_expires_at = db.Column(db.DateTime, nullable=True)
+
     # Timestamps
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
     completed_at = db.Column(db.DateTime, nullable=True)
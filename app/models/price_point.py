@@ -0,0 +1,15 @@
+"""SOL/USD price history model."""
+from app.extensions import db
+
+
+class PricePoint(db.Model):
+    """A sampled SOL/USD price."""
+
+    __tablename__ = 'price_points'
+
+    id = db.Column(db.Integer, primary_key=True)
+    timestamp = db.Column(db.DateTime, unique=True, nullable=False, index=True)  # UTC
+    price_usd = db.Column(db.Float, nullable=False)
+
+    def __repr__(self):
+        return f'<PricePoint {self.price_usd} at {self.timestamp}>'
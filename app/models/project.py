@@ -1,15 +1,28 @@
 """Project model."""
 from datetime import datetime
-from decimal import Decimal
 import re
 
 from app.extensions import db
+from app.utils.money import sol_property
+
+# Columns the public listings sort by. Each gets an index led by the
+# listing filters, with and without the category, so every sort is an
+# index range scan.
+LISTING_SORT_COLUMNS = ('created_at', 'raised_lamports', 'end_date', 'funded_ratio', 'trending_score')
 
 
 class Project(db.Model):
     """Project/campaign model for crowdfunding."""
 
     __tablename__ = 'projects'
+    __table_args__ = tuple(
+        index
+        for column in LISTING_SORT_COLUMNS
+        for index in (
+            db.Index(f'ix_projects_listing_{column}', 'is_draft', 'status', column, 'id'),
+            db.Index(f'ix_projects_category_listing_{column}', 'is_draft', 'status', 'category_id', column, 'id'),
+        )
+    )
 
     id = db.Column(db.Integer, primary_key=True)
     user_id = db.Column(db.Integer, db.ForeignKey('users.id'), nullable=False, index=True)
@@ -24,9 +37,26 @@ class Project(db.Model):
     images = db.Column(db.JSON, default=list)  # List of image URLs
     video_url = db.Column(db.String(500), nullable=True)
 
-    # Funding
-    goal_sol = db.Column(db.Numeric(18, 9), nullable=False)
-    raised_sol = db.Column(db.Numeric(18, 9), default=Decimal('0'))
+    # Funding, in lamports (goal_sol / raised_sol give SOL)
+    goal_lamports = db.Column(db.BigInteger, nullable=False)
+    raised_lamports = db.Column(db.BigInteger, nullable=False, default=0)
+
+    goal_sol = sol_property('goal_lamports')
+    raised_sol = sol_property('raised_lamports')
+
+    # Confirmed donations and distinct donor wallets, kept up to date by
+    # confirm_donation (flask repair-donation-counts recomputes them)
+    donation_count = db.Column(db.Integer, nullable=False, default=0)
+    donor_count = db.Column(db.Integer, nullable=False, default=0)
+
+    # raised / goal, stored for the funded sort; kept in step with the
+    # amounts by confirm_donation and update_funded_ratio
+    funded_ratio = db.Column(db.Float, nullable=False, default=0)
+
+    # Decayed donation velocity for the trending sort, valued as of
+    # trending_at (see trending_service)
+    trending_score = db.Column(db.Float, nullable=False, default=0)
+    trending_at = db.Column(db.DateTime, nullable=True)
 
     # Timeline
     end_date = db.Column(db.DateTime, nullable=False)
@@ -51,7 +81,7 @@ class Project(db.Model):
     project_youtube = db.Column(db.String(255), nullable=True)
 
     # Timestamps
-    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    created_at = db.Column(db.DateTime, nullable=False, default=datetime.utcnow)
     updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
     # Relationships
@@ -109,17 +139,14 @@ class Project(db.Model):
     @property
     def progress_percent(self):
         """Calculate funding progress percentage."""
-        if self.goal_sol == 0:
-            return 0
-        percent = (self.raised_sol / self.goal_sol) * 100
-        return min(float(percent), 100)  # Cap at 100 for display
+        return min(self.total_progress_percent, 100)  # Cap at 100 for display
 
     @property
     def total_progress_percent(self):
         """Calculate total funding progress (can exceed 100%)."""
-        if self.goal_sol == 0:
+        if not self.goal_lamports:
             return 0
-        return float((self.raised_sol / self.goal_sol) * 100)
+        return (self.raised_lamports or 0) * 100 / self.goal_lamports
 
     @property
     def time_remaining(self):
@@ -128,11 +155,6 @@ class Project(db.Model):
             return None
         return self.end_date - datetime.utcnow()
 
-    @property
-    def donation_count(self):
-        """Get number of confirmed donations."""
-        return self.donations.filter_by(status='confirmed').count()
-
     @property
     def primary_image(self):
         """Get the first image as primary."""
@@ -144,17 +166,30 @@ class Project(db.Model):
         """Recalculate raised amount from confirmed donations."""
         from app.models.donation import Donation
         total = db.session.query(
-            db.func.sum(Donation.amount_sol)
+            db.func.sum(Donation.amount_lamports)
         ).filter(
             Donation.project_id == self.id,
             Donation.status == 'confirmed'
         ).scalar()
-        self.raised_sol = total or Decimal('0')
+        self.raised_lamports = int(total or 0)
+        self.update_funded_ratio()
+
+    def update_funded_ratio(self):
+        """Recalculate funded_ratio after raised or goal amount changed."""
+        if not self.goal_lamports:
+            self.funded_ratio = 0.0
+        else:
+            self.funded_ratio = (self.raised_lamports or 0) / self.goal_lamports
+
+    @staticmethod
+    def funded_ratio_of(raised, goal):
+        """SQL expression for raised / goal, for bulk updates of funded_ratio."""
+        return db.case((goal > 0, db.cast(raised, db.Float) / goal), else_=0.0)
 
     def check_milestones(self):
         """Check and update milestone status based on raised amount."""
         for milestone in self.milestones:
-            if not milestone.reached and self.raised_sol >= milestone.amount_sol:
+            if not milestone.reached and (self.raised_lamports or 0) >= milestone.amount_lamports:
                 milestone.reached = True
                 milestone.reached_at = datetime.utcnow()
 
@@ -174,6 +209,7 @@ class Project(db.Model):
             'status': self.status,
             'is_active': self.is_active,
             'donation_count': self.donation_count,
+            'donor_count': self.donor_count,
             'project_website': self.project_website,
             'project_twitter': self.project_twitter,
             'project_telegram': self.project_telegram,
@@ -1,8 +1,8 @@
 """Reward Tier model for project rewards/perks."""
 from datetime import datetime
-from decimal import Decimal
 
 from app.extensions import db
+from app.utils.money import sol_property
 
 
 class RewardTier(db.Model):
@@ -16,7 +16,8 @@ class RewardTier(db.Model):
     # Tier info
     title = db.Column(db.String(100), nullable=False)
     description = db.Column(db.Text, nullable=True)
-    min_amount_sol = db.Column(db.Numeric(18, 9), nullable=False)
+    min_amount_lamports = db.Column(db.BigInteger, nullable=False)
+    min_amount_sol = sol_property('min_amount_lamports')
 
     # Limits (optional)
     max_claims = db.Column(db.Integer, nullable=True)  # None = unlimited
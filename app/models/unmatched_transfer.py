@@ -0,0 +1,50 @@
+"""Unmatched transfer model for donation reconciliation."""
+from datetime import datetime
+
+from app.extensions import db
+from app.utils.money import lamports_to_sol
+
+
+class UnmatchedTransfer(db.Model):
+    """Incoming platform wallet transfer with no matching donation."""
+
+    __tablename__ = 'unmatched_transfers'
+
+    id = db.Column(db.Integer, primary_key=True)
+
+    # Blockchain data
+    tx_signature = db.Column(db.String(100), unique=True, nullable=False, index=True)
+    source_wallet = db.Column(db.String(44), nullable=False)
+    lamports = db.Column(db.BigInteger, nullable=False)
+    slot = db.Column(db.BigInteger, nullable=True)
+    block_time = db.Column(db.DateTime, nullable=True)
+
+    # Why it didn't match: no_donation, amount_mismatch, sender_mismatch,
+    # untracked_credit (balance rose without a system transfer)
+    reason = db.Column(db.String(30), nullable=False)
+    donation_id = db.Column(db.Integer, db.ForeignKey('donations.id'), nullable=True)
+
+    # Set once an admin has dealt with it
+    resolved = db.Column(db.Boolean, default=False, index=True)
+
+    # Timestamps
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+
+    def __repr__(self):
+        return f'<UnmatchedTransfer {self.lamports} lamports from {self.source_wallet}>'
+
+    def to_dict(self):
+        """Convert unmatched transfer to dictionary."""
+        return {
+            'id': self.id,
+            'tx_signature': self.tx_signature,
+            'source_wallet': self.source_wallet,
+            'amount_sol': format(lamports_to_sol(self.lamports), 'f'),
+            'lamports': self.lamports,
+            'slot': self.slot,
+            'block_time': self.block_time.isoformat() if self.block_time else None,
+            'reason': self.reason,
+            'donation_id': self.donation_id,
+            'resolved': self.resolved,
+            'created_at': self.created_at.isoformat() if self.created_at else None
+        }
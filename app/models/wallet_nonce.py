@@ -10,6 +10,8 @@ class WalletNonce(db.Model):
 
     __tablename__ = 'wallet_nonces'
 
+    MESSAGE_TEMPLATE = "Sign this message to authenticate with Solio.\n\nNonce: {nonce}"
+
     id = db.Column(db.Integer, primary_key=True)
     wallet_address = db.Column(db.String(44), nullable=False, index=True)
     nonce = db.Column(db.String(64), nullable=False, unique=True)
@@ -42,7 +44,7 @@ class WalletNonce(db.Model):
     @property
     def message_to_sign(self):
         """Get the message that should be signed by the wallet."""
-        return f"Sign this message to authenticate with Solio.\n\nNonce: {self.nonce}"
+        return self.MESSAGE_TEMPLATE.format(nonce=self.nonce)
 
     def mark_used(self):
         """Mark nonce as used."""
@@ -5,6 +5,7 @@ from flask_login import login_required, current_user
 
 from app.extensions import db
 from app.models import Project, User, Donation
+from app.services.fragment_cache import get_fragment_cache, invalidate_pages
 
 admin_bp = Blueprint('admin', __name__)
 
@@ -82,6 +83,7 @@ def ban_project(project_id):
     else:
         project.status = 'banned'
         db.session.commit()
+        invalidate_pages()
         flash(f'Project "{project.title}" has been banned.', 'success')
 
     return redirect(url_for('admin.projects'))
@@ -99,6 +101,7 @@ def unban_project(project_id):
     else:
         project.status = 'active'
         db.session.commit()
+        invalidate_pages()
         flash(f'Project "{project.title}" has been unbanned.', 'success')
 
     return redirect(url_for('admin.projects'))
@@ -125,6 +128,7 @@ def delete_project(project_id):
     project_title = project.title
     db.session.delete(project)
     db.session.commit()
+    invalidate_pages()
 
     flash(f'Project "{project_title}" has been deleted.', 'success')
     return redirect(url_for('admin.projects'))
@@ -161,3 +165,38 @@ def toggle_admin(user_id):
     status = 'granted' if user.is_admin else 'revoked'
     flash(f'Admin status for {user.username} has been {status}.', 'success')
     return redirect(url_for('admin.users'))
+
+
+@admin_bp.route('/rpc-stats')
+@login_required
+@admin_required
+def rpc_stats():
+    """Per-method Solana RPC latency and endpoint health for this process."""
+    from app.services.solana_service import get_rpc_client
+    from app.services.tx_cache import get_tx_cache
+    from app.services.blockhash_cache import get_blockhash_cache
+    from app.services.priority_fees import get_priority_fee_estimator
+    from app.services.signature_verifier import get_signature_verifier
+    from app.services.price_service import get_price_oracle
+    client = get_rpc_client()
+    return jsonify({
+        'rpc_url': client.rpc_url,
+        'endpoints': client.health(),
+        'methods': client.stats(),
+        'tx_cache': get_tx_cache().stats(),
+        'blockhash_cache': get_blockhash_cache().stats(),
+        'priority_fees': get_priority_fee_estimator().stats(),
+        'wallet_keys': get_signature_verifier().stats(),
+        'sol_price': get_price_oracle().stats(),
+        'fragment_cache': get_fragment_cache().stats()
+    })
+
+
+@admin_bp.route('/reconciliation')
+@login_required
+@admin_required
+def reconciliation():
+    """Incoming platform wallet transfers that match no donation."""
+    from app.services.indexer_service import get_reconciliation_report
+    include_resolved = request.args.get('include_resolved', 'false').lower() == 'true'
+    return jsonify(get_reconciliation_report(include_resolved=include_resolved))
@@ -6,8 +6,9 @@ from flask_login import login_user, logout_user, login_required, current_user
 from werkzeug.security import generate_password_hash
 
 from app.extensions import db, oauth, limiter, csrf
-from app.models import User, WalletNonce
+from app.models import User
 from app.services.email_service import send_verification_email, send_password_reset_email
+from app.services.nonce_store import get_nonce_store, message_to_sign
 from app.utils.validators import validate_email, validate_password, validate_username
 
 auth_bp = Blueprint('auth', __name__)
@@ -341,20 +342,15 @@ def wallet_nonce():
         if not wallet_address or len(wallet_address) != 44:
             return jsonify({'error': 'Invalid wallet address'}), 400
 
-        # Clean up old nonces for this wallet
-        WalletNonce.query.filter_by(wallet_address=wallet_address).delete()
-
-        # Generate new nonce
-        nonce = WalletNonce.generate(
+        # Replaces any earlier nonce for this wallet
+        nonce = get_nonce_store().issue(
             wallet_address,
-            expiry_minutes=current_app.config.get('WALLET_NONCE_EXPIRY_MINUTES', 10)
+            ttl_seconds=current_app.config.get('WALLET_NONCE_EXPIRY_MINUTES', 10) * 60
         )
-        db.session.add(nonce)
-        db.session.commit()
 
         return jsonify({
-            'nonce': nonce.nonce,
-            'message': nonce.message_to_sign
+            'nonce': nonce,
+            'message': message_to_sign(nonce)
         })
 
     except Exception as e:
@@ -381,22 +377,14 @@ def wallet_verify():
         if not all([wallet_address, signature, nonce]):
             return jsonify({'error': 'Missing required data'}), 400
 
-        # Find and validate nonce
-        wallet_nonce = WalletNonce.query.filter_by(
-            wallet_address=wallet_address,
-            nonce=nonce
-        ).first()
-
-        if not wallet_nonce or not wallet_nonce.is_valid:
-            return jsonify({'error': 'Invalid or expired nonce'}), 400
-
         # Verify signature
-        message = wallet_nonce.message_to_sign
+        message = message_to_sign(nonce)
         if not verify_wallet_signature(wallet_address, message, signature):
             return jsonify({'error': 'Invalid signature'}), 400
 
-        # Mark nonce as used
-        wallet_nonce.mark_used()
+        # Use up the nonce; fails if it was never issued, expired or replayed
+        if not get_nonce_store().consume(wallet_address, nonce):
+            return jsonify({'error': 'Invalid or expired nonce'}), 400
 
         # Find or create user
         user = User.query.filter_by(wallet_address=wallet_address).first()
@@ -1,14 +1,16 @@
 """Donation routes."""
 from decimal import Decimal
 
-from flask import Blueprint, render_template, request, jsonify, current_app
+from flask import Blueprint, render_template, request, jsonify, url_for
 from flask_login import login_required, current_user
+from sqlalchemy.exc import IntegrityError
 
 from app.extensions import db, limiter
 from app.models import Project, Donation, RewardTier
-from app.services.solana_service import verify_transaction
-from app.services.notification_service import notify_new_donation, notify_milestone_reached
+from app.services.verification_queue import enqueue_verification
 from app.utils.validators import validate_sol_amount
+from app.utils.money import sol_to_lamports, lamports_to_sol
+from app.utils.pagination import paginate_request
 
 donations_bp = Blueprint('donations', __name__)
 
@@ -17,7 +19,10 @@ donations_bp = Blueprint('donations', __name__)
 @limiter.limit("30 per minute")
 def verify_donation():
     """
-    Verify a donation transaction on Solana blockchain.
+    Queue a donation transaction for verification on Solana blockchain.
+
+    Returns 202 with a status URL; poll it until the status is
+    'confirmed' or 'failed'.
 
     Expected JSON payload:
     {
@@ -58,24 +63,29 @@ def verify_donation():
     # Check for duplicate transaction
     existing = Donation.query.filter_by(tx_signature=tx_signature).first()
     if existing:
+        # Let clients retry a submission that is still being verified
+        if existing.status in ('pending', 'verifying') and existing.project_id == project.id:
+            return _pending_response(existing)
+        # A donation given up on may have landed since; check again. One
+        # that failed for good keeps its failure.
+        if existing.status == 'failed' and existing.project_id == project.id:
+            if not existing.retryable:
+                return jsonify({
+                    'error': existing.error_message or 'Transaction verification failed',
+                    'status': 'failed'
+                }), 400
+            requeued = Donation.query.filter_by(id=existing.id, status='failed', retryable=True).update(
+                {'status': 'pending', 'error_message': None, 'retryable': False},
+                synchronize_session=False
+            )
+            db.session.commit()
+            if requeued:
+                enqueue_verification(existing.id)
+            db.session.refresh(existing)
+            return _pending_response(existing)
         return jsonify({'error': 'Transaction already processed'}), 400
 
-    # Verify transaction on blockchain
-    platform_wallet = current_app.config['PLATFORM_WALLET_ADDRESS']
-
-    verification_result = verify_transaction(
-        tx_signature=tx_signature,
-        expected_recipient=platform_wallet,
-        expected_amount_sol=Decimal(str(amount_sol)),
-        expected_sender=donor_wallet
-    )
-
-    if not verification_result['success']:
-        return jsonify({
-            'error': verification_result.get('error', 'Transaction verification failed')
-        }), 400
-
-    # Validate and process reward tier if provided
+    # Validate reward tier if provided
     reward_tier = None
     if reward_tier_id:
         reward_tier = RewardTier.query.get(reward_tier_id)
@@ -83,12 +93,12 @@ def verify_donation():
             return jsonify({'error': 'Invalid reward tier'}), 400
         if not reward_tier.is_available:
             return jsonify({'error': 'This reward tier is sold out'}), 400
-        if Decimal(str(amount_sol)) < reward_tier.min_amount_sol:
+        if sol_to_lamports(amount_sol) < reward_tier.min_amount_lamports:
             return jsonify({'error': f'Minimum amount for this reward is {reward_tier.min_amount_sol} SOL'}), 400
         if not donor_email:
             return jsonify({'error': 'Email is required for reward delivery'}), 400
 
-    # Create donation record
+    # Record pending donation; the chain check runs in the background
     donation = Donation(
         project_id=project_id,
         user_id=current_user.id if current_user.is_authenticated else None,
@@ -98,69 +108,72 @@ def verify_donation():
         donor_email=donor_email,
         tx_signature=tx_signature,
         donor_wallet=donor_wallet,
-        status='confirmed'
+        status='pending'
     )
-    donation.calculate_fee(current_app.config['PLATFORM_FEE_PERCENT'])
 
     db.session.add(donation)
+    try:
+        db.session.commit()
+    except IntegrityError:
+        # Same signature submitted concurrently
+        db.session.rollback()
+        return jsonify({'error': 'Transaction already processed'}), 400
 
-    # Update reward tier claimed count if applicable
-    if reward_tier:
-        reward_tier.claim()
-
-    # Update project raised amount
-    project.raised_sol = (project.raised_sol or Decimal('0')) + donation.amount_sol
-
-    # Check and update milestones
-    newly_reached_milestones = []
-    for milestone in project.milestones:
-        if not milestone.reached and project.raised_sol >= milestone.amount_sol:
-            milestone.reached = True
-            from datetime import datetime
-            milestone.reached_at = datetime.utcnow()
-            newly_reached_milestones.append(milestone)
+    enqueue_verification(donation.id)
 
-    db.session.commit()
+    return _pending_response(donation)
 
-    # Send notifications (after commit)
-    try:
-        notify_new_donation(donation)
-        for milestone in newly_reached_milestones:
-            notify_milestone_reached(project, milestone)
-    except Exception as e:
-        # Don't fail the donation if notification fails
-        current_app.logger.error(f'Notification error: {e}')
 
+def _pending_response(donation):
+    """Build the 202 response pointing clients at the status endpoint."""
     return jsonify({
         'success': True,
-        'donation': donation.to_dict(),
-        'project': {
+        'status': donation.status,
+        'donation_id': donation.id,
+        'status_url': url_for('donations.donation_status', donation_id=donation.id)
+    }), 202
+
+
+@donations_bp.route('/<int:donation_id>/status')
+@limiter.limit("120 per minute")
+def donation_status(donation_id):
+    """Get verification status of a donation."""
+    donation = Donation.query.get_or_404(donation_id)
+    project = donation.project
+
+    data = {'status': donation.status}
+
+    if donation.status == 'failed':
+        data['error'] = donation.error_message or 'Transaction verification failed'
+    elif donation.status == 'confirmed':
+        data['donation'] = donation.to_dict()
+        data['project'] = {
             'raised_sol': str(project.raised_sol),
             'progress_percent': project.progress_percent,
             'donation_count': project.donation_count
         }
-    })
+
+    return jsonify(data)
 
 
 @donations_bp.route('/my')
 @login_required
 def my_donations():
     """Get current user's donations."""
-    page = request.args.get('page', 1, type=int)
     per_page = 20
+    query = current_user.donations.filter_by(status='confirmed')
+
+    if request.is_json or request.args.get('format') == 'json':
+        items, pagination = paginate_request(
+            query, [Donation.created_at.desc(), Donation.id.desc()], per_page
+        )
+        return jsonify({'donations': [d.to_dict() for d in items], **pagination})
 
-    pagination = current_user.donations.filter_by(status='confirmed').order_by(
+    page = request.args.get('page', 1, type=int)
+    pagination = query.order_by(
         Donation.created_at.desc()
     ).paginate(page=page, per_page=per_page, error_out=False)
 
-    if request.is_json or request.args.get('format') == 'json':
-        return jsonify({
-            'donations': [d.to_dict() for d in pagination.items],
-            'total': pagination.total,
-            'pages': pagination.pages,
-            'current_page': page
-        })
-
     return render_template(
         'profile/my_donations.html',
         donations=pagination.items,
@@ -173,19 +186,17 @@ def project_donations(project_id):
     """Get donations for a specific project."""
     project = Project.query.get_or_404(project_id)
 
-    page = request.args.get('page', 1, type=int)
     per_page = min(request.args.get('per_page', 50, type=int), 100)
 
-    pagination = project.donations.filter_by(status='confirmed').order_by(
-        Donation.created_at.desc()
-    ).paginate(page=page, per_page=per_page, error_out=False)
+    # The stored counter is the exact total, no need to count
+    items, pagination = paginate_request(
+        project.donations.filter_by(status='confirmed'),
+        [Donation.created_at.desc(), Donation.id.desc()],
+        per_page,
+        count=lambda: project.donation_count
+    )
 
-    return jsonify({
-        'donations': [d.to_dict() for d in pagination.items],
-        'total': pagination.total,
-        'pages': pagination.pages,
-        'current_page': page
-    })
+    return jsonify({'donations': [d.to_dict() for d in items], **pagination})
 
 
 @donations_bp.route('/stats')
@@ -197,9 +208,9 @@ def donation_stats():
         Donation.status == 'confirmed'
     ).scalar()
 
-    total_raised = db.session.query(func.sum(Donation.amount_sol)).filter(
+    total_raised = db.session.query(func.sum(Donation.amount_lamports)).filter(
         Donation.status == 'confirmed'
-    ).scalar() or Decimal('0')
+    ).scalar()
 
     total_projects = db.session.query(func.count(Project.id)).filter(
         Project.status.in_(['active', 'ended'])
@@ -207,6 +218,6 @@ def donation_stats():
 
     return jsonify({
         'total_donations': total_donations,
-        'total_raised_sol': str(total_raised),
+        'total_raised_sol': str(lamports_to_sol(total_raised)),
         'total_projects': total_projects
     })
@@ -2,6 +2,7 @@
 from flask import Blueprint, render_template
 
 from app.models import Project
+from app.services.fragment_cache import HOMEPAGE_KEY, page_cacheable, render_cached_page
 
 main_bp = Blueprint('main', __name__)
 
@@ -9,18 +10,33 @@ main_bp = Blueprint('main', __name__)
 @main_bp.route('/')
 def index():
     """Homepage with featured projects."""
+    # Anonymous visitors share one cached copy
+    if page_cacheable():
+        return render_cached_page(HOMEPAGE_KEY, _render_index)
+    return _render_index()
+
+
+def _render_index():
+    # Get projects with the most recent donation activity
+    trending_projects = Project.query.filter_by(is_draft=False, status='active').filter(
+        Project.trending_score > 0
+    ).order_by(
+        Project.trending_score.desc(), Project.id.desc()
+    ).limit(6).all()
+
     # Get active projects, ordered by raised amount (most funded first)
-    featured_projects = Project.query.filter_by(status='active').order_by(
-        Project.raised_sol.desc()
+    featured_projects = Project.query.filter_by(is_draft=False, status='active').order_by(
+        Project.raised_lamports.desc(), Project.id.desc()
     ).limit(6).all()
 
     # Get newest projects
-    newest_projects = Project.query.filter_by(status='active').order_by(
-        Project.created_at.desc()
+    newest_projects = Project.query.filter_by(is_draft=False, status='active').order_by(
+        Project.created_at.desc(), Project.id.desc()
     ).limit(6).all()
 
     return render_template(
         'index.html',
+        trending_projects=trending_projects,
         featured_projects=featured_projects,
         newest_projects=newest_projects
     )
@@ -4,6 +4,7 @@ from flask_login import login_required, current_user
 
 from app.extensions import db
 from app.models import Notification
+from app.utils.pagination import paginate_request
 
 notifications_bp = Blueprint('notifications', __name__)
 
@@ -30,22 +31,21 @@ def list_notifications():
 @login_required
 def api_list():
     """API endpoint for notifications list."""
-    page = request.args.get('page', 1, type=int)
     per_page = min(request.args.get('per_page', 20, type=int), 50)
     unread_only = request.args.get('unread_only', 'false').lower() == 'true'
 
-    query = current_user.notifications.order_by(Notification.created_at.desc())
+    query = current_user.notifications
 
     if unread_only:
         query = query.filter_by(is_read=False)
 
-    pagination = query.paginate(page=page, per_page=per_page, error_out=False)
+    items, pagination = paginate_request(
+        query, [Notification.created_at.desc(), Notification.id.desc()], per_page
+    )
 
     return jsonify({
-        'notifications': [n.to_dict() for n in pagination.items],
-        'total': pagination.total,
-        'pages': pagination.pages,
-        'current_page': page,
+        'notifications': [n.to_dict() for n in items],
+        **pagination,
         'unread_count': Notification.get_unread_count(current_user.id)
     })
 
@@ -6,6 +6,8 @@ from app.extensions import db
 from app.models import User, Project, Donation
 from app.services.storage_service import upload_image
 from app.utils.validators import validate_username, validate_url, validate_wallet_address
+from app.services.price_history import usd_total
+from app.utils.money import lamports_to_sol
 
 profile_bp = Blueprint('profile', __name__)
 
@@ -30,12 +32,30 @@ def dashboard():
     ).limit(10).all()
 
     # Stats (only count published projects)
-    total_raised = sum(
-        p.raised_sol for p in projects if p.raised_sol
-    )
-    total_donated = sum(
-        d.amount_sol for d in current_user.donations.filter_by(status='confirmed').all()
-    )
+    total_raised = lamports_to_sol(sum(
+        p.raised_lamports for p in projects if p.raised_lamports
+    ))
+    total_donated = lamports_to_sol(db.session.query(
+        db.func.sum(Donation.amount_lamports)
+    ).filter(
+        Donation.user_id == current_user.id,
+        Donation.status == 'confirmed'
+    ).scalar())
+
+    # USD at the time of each donation
+    total_raised_usd = usd_total(db.session.query(
+        Donation.amount_lamports, Donation.created_at
+    ).join(Project).filter(
+        Project.user_id == current_user.id,
+        Project.is_draft.is_(False),
+        Donation.status == 'confirmed'
+    ))
+    total_donated_usd = usd_total(db.session.query(
+        Donation.amount_lamports, Donation.created_at
+    ).filter(
+        Donation.user_id == current_user.id,
+        Donation.status == 'confirmed'
+    ))
 
     return render_template(
         'profile/dashboard.html',
@@ -43,7 +63,9 @@ def dashboard():
         draft_projects=draft_projects,
         recent_donations=recent_donations,
         total_raised=total_raised,
-        total_donated=total_donated
+        total_donated=total_donated,
+        total_raised_usd=total_raised_usd,
+        total_donated_usd=total_donated_usd
     )
 
 
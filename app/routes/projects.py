@@ -12,10 +12,35 @@ from app.utils.validators import (
     validate_sol_amount, validate_url, sanitize_html
 )
 from app.utils.decorators import owner_required
+from app.utils.pagination import paginate_request
+from app.services.search_service import apply_search, highlight, index_project
+from app.services.fragment_cache import invalidate_pages
 
 projects_bp = Blueprint('projects', __name__)
 
 
+def _listing_order(query, sort: str, rank=None) -> tuple:
+    """
+    Get the ordering for a listing sort.
+
+    Each ordering ends with the id, so cursors have a unique position
+    and the listing indexes on the project model serve it.
+    Returns (query, order_by clauses).
+    """
+    if sort == 'relevance' and rank is not None:
+        return query, [rank, Project.created_at.desc(), Project.id.desc()]
+    if sort == 'popular':
+        return query, [Project.raised_lamports.desc(), Project.id.desc()]
+    if sort == 'ending_soon':
+        query = query.filter(Project.end_date > datetime.utcnow())
+        return query, [Project.end_date.asc(), Project.id.asc()]
+    if sort == 'funded':
+        return query, [Project.funded_ratio.desc(), Project.id.desc()]
+    if sort == 'trending':
+        return query, [Project.trending_score.desc(), Project.id.desc()]
+    return query, [Project.created_at.desc(), Project.id.desc()]
+
+
 @projects_bp.route('/')
 def list_projects():
     """List all active projects with filters."""
@@ -23,10 +48,11 @@ def list_projects():
     per_page = 12
 
     # Filters
-    sort = request.args.get('sort', 'newest')  # newest, popular, ending_soon, funded
+    search_query = request.args.get('q', '').strip()
+    # newest, popular, ending_soon, funded, trending, relevance (default when searching)
+    sort = request.args.get('sort', 'relevance' if search_query else 'newest')
     status = request.args.get('status', 'active')
     category_slug = request.args.get('category', '')
-    search_query = request.args.get('q', '').strip()
 
     # Get all categories for filter UI
     categories = Category.query.order_by(Category.sort_order).all()
@@ -48,33 +74,23 @@ def list_projects():
             query = query.filter_by(category_id=current_category.id)
 
     # Search filter
+    rank = None
     if search_query:
-        search_term = f'%{search_query}%'
-        query = query.filter(
-            db.or_(
-                Project.title.ilike(search_term),
-                Project.description.ilike(search_term)
-            )
-        )
+        query, rank = apply_search(query, search_query)
 
     # Sorting
-    if sort == 'newest':
-        query = query.order_by(Project.created_at.desc())
-    elif sort == 'popular':
-        query = query.order_by(Project.raised_sol.desc())
-    elif sort == 'ending_soon':
-        query = query.filter(Project.end_date > datetime.utcnow())
-        query = query.order_by(Project.end_date.asc())
-    elif sort == 'funded':
-        query = query.order_by(
-            (Project.raised_sol / Project.goal_sol).desc()
-        )
+    query, order_by = _listing_order(query, sort, rank)
+    pagination = query.order_by(*order_by).paginate(page=page, per_page=per_page, error_out=False)
 
-    pagination = query.paginate(page=page, per_page=per_page, error_out=False)
+    highlights = {}
+    if search_query:
+        for project in pagination.items:
+            highlights[project.id] = highlight(project, search_query)
 
     return render_template(
         'projects/list.html',
         projects=pagination.items,
+        highlights=highlights,
         pagination=pagination,
         current_sort=sort,
         current_status=status,
@@ -267,6 +283,8 @@ def create():
                     pass  # Skip invalid tiers
 
         db.session.commit()
+        index_project(project)
+        invalidate_pages()
 
         if save_as_draft:
             flash('Project saved as draft. You can publish it later from your dashboard.', 'info')
@@ -308,6 +326,7 @@ def edit(id):
 
             if validate_sol_amount(goal_sol):
                 project.goal_sol = Decimal(str(goal_sol))
+                project.update_funded_ratio()
 
             try:
                 end_date = datetime.fromisoformat(end_date_str)
@@ -317,6 +336,8 @@ def edit(id):
                 pass
 
         db.session.commit()
+        index_project(project)
+        invalidate_pages()
 
         flash('Project updated.', 'success')
         return redirect(url_for('projects.detail', slug=project.slug))
@@ -344,6 +365,7 @@ def publish(id):
 
     project.is_draft = False
     db.session.commit()
+    invalidate_pages()
 
     flash('Project published successfully! It is now visible to everyone.', 'success')
     return redirect(url_for('projects.detail', slug=project.slug))
@@ -366,6 +388,7 @@ def unpublish(id):
 
     project.is_draft = True
     db.session.commit()
+    invalidate_pages()
 
     flash('Project unpublished. It is now a draft.', 'info')
     return redirect(url_for('projects.detail', slug=project.slug))
@@ -384,6 +407,7 @@ def cancel(id):
 
     project.status = 'cancelled'
     db.session.commit()
+    invalidate_pages()
 
     flash('Project cancelled.', 'info')
     return redirect(url_for('profile.dashboard'))
@@ -490,6 +514,7 @@ def upload_image(id):
         project.images = images
 
         db.session.commit()
+        invalidate_pages()
 
         if request.is_json:
             return jsonify({'success': True, 'url': image_url})
@@ -516,6 +541,7 @@ def delete_image(id, index):
         images.pop(index)
         project.images = images
         db.session.commit()
+        invalidate_pages()
 
         return jsonify({'success': True})
 
@@ -527,14 +553,13 @@ def delete_image(id, index):
 @projects_bp.route('/api/list')
 def api_list():
     """API endpoint for project list."""
-    page = request.args.get('page', 1, type=int)
     per_page = min(request.args.get('per_page', 12, type=int), 50)
-    sort = request.args.get('sort', 'newest')
+    search_query = request.args.get('q', '').strip()
+    sort = request.args.get('sort', 'relevance' if search_query else 'newest')
     status = request.args.get('status', 'active')
     category_slug = request.args.get('category', '')
-    search_query = request.args.get('q', '').strip()
 
-    query = Project.query
+    query = Project.query.filter_by(is_draft=False)
 
     if status == 'active':
         query = query.filter_by(status='active')
@@ -548,31 +573,22 @@ def api_list():
             query = query.filter_by(category_id=category.id)
 
     # Search filter
+    rank = None
     if search_query:
-        search_term = f'%{search_query}%'
-        query = query.filter(
-            db.or_(
-                Project.title.ilike(search_term),
-                Project.description.ilike(search_term)
-            )
-        )
+        query, rank = apply_search(query, search_query)
 
-    if sort == 'newest':
-        query = query.order_by(Project.created_at.desc())
-    elif sort == 'popular':
-        query = query.order_by(Project.raised_sol.desc())
-    elif sort == 'ending_soon':
-        query = query.filter(Project.end_date > datetime.utcnow())
-        query = query.order_by(Project.end_date.asc())
+    query, order_by = _listing_order(query, sort, rank)
+    items, pagination = paginate_request(query, order_by, per_page)
 
-    pagination = query.paginate(page=page, per_page=per_page, error_out=False)
+    projects = []
+    for project in items:
+        data = project.to_dict()
+        if search_query:
+            snippet = highlight(project, search_query)
+            data['highlight'] = str(snippet) if snippet else None
+        projects.append(data)
 
-    return jsonify({
-        'projects': [p.to_dict() for p in pagination.items],
-        'total': pagination.total,
-        'pages': pagination.pages,
-        'current_page': page
-    })
+    return jsonify({'projects': projects, **pagination})
 
 
 @projects_bp.route('/api/<slug>')
@@ -631,6 +647,8 @@ def api_create():
 
     db.session.add(project)
     db.session.commit()
+    index_project(project)
+    invalidate_pages()
 
     return jsonify({
         'success': True,
@@ -813,17 +831,16 @@ def delete_comment(id, cid):
 def api_comments(id):
     """Get comments for a project (API)."""
     project = Project.query.get_or_404(id)
-    page = request.args.get('page', 1, type=int)
     per_page = min(request.args.get('per_page', 20, type=int), 50)
 
     # Get top-level comments only
-    pagination = project.comments.filter_by(parent_id=None).order_by(
-        Comment.created_at.desc()
-    ).paginate(page=page, per_page=per_page, error_out=False)
+    items, pagination = paginate_request(
+        project.comments.filter_by(parent_id=None),
+        [Comment.created_at.desc(), Comment.id.desc()],
+        per_page
+    )
 
     return jsonify({
-        'comments': [c.to_dict(include_replies=True) for c in pagination.items],
-        'total': pagination.total,
-        'pages': pagination.pages,
-        'current_page': page
+        'comments': [c.to_dict(include_replies=True) for c in items],
+        **pagination
     })
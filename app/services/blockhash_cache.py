@@ -0,0 +1,149 @@
+"""Shared recent-blockhash provider for transaction builders."""
+import threading
+import time
+from typing import Optional
+
+from flask import current_app
+
+from app.utils.singleton import process_singleton
+
+
+class BlockhashCache:
+    """
+    Caches the latest blockhash with its lastValidBlockHeight.
+
+    A blockhash stays usable for ~150 blocks, so builders can sign
+    against a cached one instead of paying a getLatestBlockhash round
+    trip per transaction. Before handing out the cached entry, the
+    current block height is checked against its lastValidBlockHeight:
+    with fewer than min_blocks_left blocks to go it is refetched
+    synchronously. When the height can't be read, entries older than
+    max_age seconds are refetched instead. Once an entry is older than
+    refresh_after seconds a background refresh is started while the
+    cached value is still handed out.
+    """
+
+    def __init__(self, app, fetch, block_height, refresh_after: float = 15.0,
+                 max_age: float = 30.0, min_blocks_left: int = 30):
+        self.app = app
+        self.fetch = fetch
+        self.block_height = block_height
+        self.refresh_after = refresh_after
+        self.max_age = max_age
+        self.min_blocks_left = min_blocks_left
+
+        self._current = None
+        self._fetched_at = 0.0
+        self._refreshing = False
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.misses = 0
+        self.refreshes = 0
+        self.invalidations = 0
+
+    def get(self) -> Optional[dict]:
+        """
+        Get a usable blockhash.
+
+        Returns dict with 'blockhash' and 'last_valid_block_height', or None.
+        """
+        with self._lock:
+            current = self._current
+            age = time.monotonic() - self._fetched_at
+
+        if current is not None and self._still_valid(current, age):
+            with self._lock:
+                self.hits += 1
+                start_refresh = age >= self.refresh_after and not self._refreshing
+                if start_refresh:
+                    self._refreshing = True
+
+            if start_refresh:
+                threading.Thread(
+                    target=self._background_refresh,
+                    name='blockhash-refresh',
+                    daemon=True
+                ).start()
+            return dict(current)
+
+        with self._lock:
+            self.misses += 1
+        return self.refresh()
+
+    def _still_valid(self, current: dict, age: float) -> bool:
+        height = self.block_height()
+        if height is None:
+            return age < self.max_age
+        return height + self.min_blocks_left <= current['last_valid_block_height']
+
+    def refresh(self) -> Optional[dict]:
+        """Fetch a new blockhash now and cache it."""
+        latest = self.fetch()
+        if not latest:
+            return None
+
+        with self._lock:
+            self._current = latest
+            self._fetched_at = time.monotonic()
+            self.refreshes += 1
+        return dict(latest)
+
+    def _background_refresh(self):
+        with self.app.app_context():
+            try:
+                self.refresh()
+            except Exception as e:
+                current_app.logger.error(f"Blockhash refresh error: {e}")
+            finally:
+                with self._lock:
+                    self._refreshing = False
+
+    def invalidate(self, blockhash: str = None):
+        """
+        Drop the cached blockhash.
+
+        With a blockhash given, only drop it if it is still the cached
+        one, so a fresher value fetched meanwhile is kept.
+        """
+        with self._lock:
+            if self._current is None:
+                return
+            if blockhash is None or self._current['blockhash'] == blockhash:
+                self._current = None
+                self.invalidations += 1
+
+    def stats(self) -> dict:
+        """Get cache counters and the current entry."""
+        with self._lock:
+            return {
+                'blockhash': self._current['blockhash'] if self._current else None,
+                'last_valid_block_height': (
+                    self._current['last_valid_block_height'] if self._current else None
+                ),
+                'age_seconds': (
+                    round(time.monotonic() - self._fetched_at, 2) if self._current else None
+                ),
+                'hits': self.hits,
+                'misses': self.misses,
+                'refreshes': self.refreshes,
+                'invalidations': self.invalidations
+            }
+
+
+@process_singleton
+def get_blockhash_cache() -> BlockhashCache:
+    """Get the process-wide blockhash cache."""
+    from app.services.solana_service import get_block_height, get_latest_blockhash
+
+    commitment = current_app.config.get('SOLANA_BLOCKHASH_COMMITMENT', 'finalized')
+    return BlockhashCache(
+        current_app._get_current_object(),
+        lambda: get_latest_blockhash(commitment),
+        # The confirmed height runs ahead of the finalized one, so it
+        # errs towards refetching
+        lambda: get_block_height('confirmed'),
+        refresh_after=current_app.config.get('BLOCKHASH_REFRESH_SECONDS', 15),
+        max_age=current_app.config.get('BLOCKHASH_MAX_AGE_SECONDS', 30),
+        min_blocks_left=current_app.config.get('BLOCKHASH_MIN_BLOCKS_LEFT', 30)
+    )
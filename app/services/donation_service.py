@@ -0,0 +1,293 @@
+"""Donation service for verifying and confirming donations."""
+from contextlib import nullcontext
+from datetime import datetime, timedelta
+
+from flask import current_app, has_request_context
+
+from app.extensions import db
+from app.models import Project, Donation, RewardTier
+from app.services.solana_service import verify_transaction, get_transaction_statuses
+from app.services.notification_service import notify_new_donation, notify_milestone_reached
+from app.services.trending_service import trending_update
+from app.services.fragment_cache import invalidate_pages
+
+
+def _url_context():
+    """
+    Context in which url_for works.
+
+    Background workers and the cron sweeper have no request, so build
+    notification links against BASE_URL instead.
+    """
+    if has_request_context():
+        return nullcontext()
+    return current_app.test_request_context(
+        base_url=current_app.config.get('BASE_URL', 'http://localhost:5000')
+    )
+
+
+def _give_up_cutoff() -> datetime:
+    """
+    Creation time before which a donation that still can't be verified
+    is failed: its blockhash has long expired, so it will never land.
+    """
+    stale_after = current_app.config.get('DONATION_VERIFY_STALE_MINUTES', 10)
+    return datetime.utcnow() - timedelta(minutes=stale_after * 6)
+
+
+def claim_donation(donation_id: int, status: str = 'pending') -> bool:
+    """
+    Atomically move a donation from status (pending) to verifying.
+
+    Only one worker can win the claim, so the web pool and the cron
+    sweeper never verify the same donation twice.
+    """
+    claimed = Donation.query.filter_by(
+        id=donation_id,
+        status=status
+    ).update({'status': 'verifying'}, synchronize_session=False)
+    db.session.commit()
+    return claimed == 1
+
+
+def fail_pending_donation(donation_id: int, error: str, retryable: bool = False) -> bool:
+    """
+    Fail a pending donation.
+
+    retryable marks a donation given up on rather than known to be
+    wrong, so a resubmission may queue it again.
+    Returns True if this call failed it.
+    """
+    if not claim_donation(donation_id):
+        return False
+
+    Donation.query.filter_by(id=donation_id).update({
+        'status': 'failed',
+        'error_message': error,
+        'retryable': retryable
+    }, synchronize_session=False)
+    db.session.commit()
+    return True
+
+
+def release_donation(donation_id: int, error: str):
+    """Put a claimed donation back in the queue to be verified again later."""
+    Donation.query.filter_by(id=donation_id, status='verifying').update({
+        'status': 'pending',
+        'error_message': error
+    }, synchronize_session=False)
+    db.session.commit()
+
+
+def verify_pending_donation(donation_id: int) -> bool:
+    """
+    Verify a pending donation on chain and confirm or fail it.
+
+    Only a failed transaction or a transfer that doesn't match fails the
+    donation. If the transaction can't be found yet or the RPC errors,
+    it goes back to pending for the sweeper to retry, until it is older
+    than the give-up time.
+
+    Returns True if the donation was confirmed.
+    """
+    if not claim_donation(donation_id):
+        return False
+
+    donation = Donation.query.get(donation_id)
+    if not donation:
+        return False
+
+    try:
+        verification_result = verify_transaction(
+            tx_signature=donation.tx_signature,
+            expected_recipient=current_app.config['PLATFORM_WALLET_ADDRESS'],
+            expected_lamports=donation.amount_lamports,
+            expected_sender=donation.donor_wallet
+        )
+    except Exception as e:
+        current_app.logger.error(f"Donation {donation_id} verification error: {e}")
+        verification_result = {'success': False, 'error': 'Transaction processing error', 'retryable': True}
+
+    if (not verification_result['success'] and verification_result.get('retryable')
+            and donation.created_at >= _give_up_cutoff()):
+        release_donation(donation_id, verification_result.get('error'))
+        current_app.logger.info(
+            f"Donation {donation_id} not verified yet: {verification_result.get('error')}"
+        )
+        return False
+
+    if not verification_result['success']:
+        donation.status = 'failed'
+        donation.error_message = verification_result.get('error', 'Transaction verification failed')
+        donation.retryable = bool(verification_result.get('retryable'))
+        db.session.commit()
+        current_app.logger.warning(
+            f"Donation {donation_id} failed verification: {donation.error_message}"
+        )
+        return False
+
+    confirm_donation(donation)
+    return True
+
+
+def confirm_donation(donation: Donation) -> list:
+    """
+    Mark a verified donation as confirmed and credit the project.
+
+    Updates raised amount, reward tier claims and milestones in one
+    transaction, then sends notifications.
+    Returns the list of newly reached milestones.
+    """
+    project = donation.project
+
+    donation.status = 'confirmed'
+    donation.error_message = None
+    donation.retryable = False
+    donation.calculate_fee(current_app.config['PLATFORM_FEE_PERCENT'])
+
+    # Update reward tier claimed count if applicable
+    if donation.reward_tier_id:
+        RewardTier.query.filter_by(id=donation.reward_tier_id).update(
+            {'claimed_count': RewardTier.claimed_count + 1},
+            synchronize_session=False
+        )
+
+    # First confirmed donation from this wallet to the project?
+    new_donor = not db.session.query(Donation.query.filter(
+        Donation.project_id == project.id,
+        Donation.donor_wallet == donation.donor_wallet,
+        Donation.status == 'confirmed',
+        Donation.id != donation.id
+    ).exists()).scalar()
+
+    # Update project totals in SQL so concurrent workers don't lose updates
+    raised = db.func.coalesce(Project.raised_lamports, 0) + donation.amount_lamports
+    Project.query.filter_by(id=project.id).update({
+        'raised_lamports': raised,
+        'funded_ratio': Project.funded_ratio_of(raised, Project.goal_lamports),
+        'donation_count': Project.donation_count + 1,
+        'donor_count': Project.donor_count + (1 if new_donor else 0),
+        **trending_update(donation.amount_lamports)
+    }, synchronize_session=False)
+    db.session.flush()
+    db.session.refresh(project)
+
+    # Check and update milestones
+    newly_reached_milestones = []
+    for milestone in project.milestones:
+        if not milestone.reached and project.raised_lamports >= milestone.amount_lamports:
+            milestone.reached = True
+            milestone.reached_at = datetime.utcnow()
+            newly_reached_milestones.append(milestone)
+
+    db.session.commit()
+    invalidate_pages()
+
+    # Send notifications (after commit)
+    try:
+        with _url_context():
+            notify_new_donation(donation)
+            for milestone in newly_reached_milestones:
+                notify_milestone_reached(project, milestone)
+    except Exception as e:
+        # Don't fail the donation if notification fails
+        current_app.logger.error(f'Notification error: {e}')
+
+    return newly_reached_milestones
+
+
+def process_pending_donations(limit: int = 50) -> int:
+    """
+    Verify donations that are still waiting in the queue.
+    Called by the scheduler to pick up work lost by a restarted web worker.
+
+    Returns number of donations confirmed.
+    """
+    stale_after = current_app.config.get('DONATION_VERIFY_STALE_MINUTES', 10)
+    stale_cutoff = datetime.utcnow() - timedelta(minutes=stale_after)
+    give_up_cutoff = _give_up_cutoff()
+
+    # Release donations whose worker died mid-verification
+    Donation.query.filter(
+        Donation.status == 'verifying',
+        Donation.updated_at < stale_cutoff
+    ).update({'status': 'pending'}, synchronize_session=False)
+    db.session.commit()
+
+    # Leave fresh donations to the web worker pool. Least recently tried
+    # first: a retry bumps updated_at, so donations that keep coming back
+    # don't crowd out newer ones.
+    grace_cutoff = datetime.utcnow() - timedelta(minutes=1)
+    pending = db.session.query(Donation.id, Donation.tx_signature, Donation.created_at).filter(
+        Donation.status == 'pending',
+        Donation.created_at < grace_cutoff
+    ).order_by(Donation.updated_at.asc(), Donation.id.asc()).limit(limit).all()
+
+    if not pending:
+        return 0
+
+    # One bulk status lookup instead of a full verification per donation.
+    # Swept donations can be older than the RPC node's recent status
+    # cache, so search the full history before treating one as not found.
+    statuses = get_transaction_statuses(
+        [row.tx_signature for row in pending],
+        search_history=True
+    )
+
+    confirmed = 0
+    not_landed = []
+    for row in pending:
+        # Lookup failed - check again on the next sweep
+        if row.tx_signature not in statuses:
+            continue
+        status = statuses[row.tx_signature]
+
+        if status == 'failed':
+            fail_pending_donation(row.id, 'Transaction failed')
+            continue
+
+        if status is None:
+            # Not landed yet - check again on the next sweep. Its blockhash
+            # has long expired by the give-up time, so it never will.
+            if row.created_at < give_up_cutoff:
+                fail_pending_donation(row.id, 'Transaction not found', retryable=True)
+            else:
+                not_landed.append(row.id)
+            continue
+
+        if verify_pending_donation(row.id):
+            confirmed += 1
+
+    if not_landed:
+        # Mark them as tried so the next sweep reaches other donations first
+        Donation.query.filter(
+            Donation.id.in_(not_landed),
+            Donation.status == 'pending'
+        ).update({'updated_at': datetime.utcnow()}, synchronize_session=False)
+        db.session.commit()
+
+    return confirmed
+
+
+def repair_donation_counts() -> int:
+    """
+    Recompute every project's donation and donor counts.
+
+    confirm_donation maintains them incrementally; this fixes any drift
+    (donations changed by hand, two first donations from one wallet
+    confirmed concurrently) in a single UPDATE.
+    Returns number of projects corrected.
+    """
+    confirmed = db.and_(Donation.project_id == Project.id, Donation.status == 'confirmed')
+    donations = db.select(db.func.count(Donation.id)).where(confirmed).scalar_subquery()
+    donors = db.select(db.func.count(db.distinct(Donation.donor_wallet))).where(confirmed).scalar_subquery()
+
+    corrected = Project.query.filter(db.or_(
+        Project.donation_count != donations,
+        Project.donor_count != donors
+    )).update({
+        'donation_count': donations,
+        'donor_count': donors
+    }, synchronize_session=False)
+    db.session.commit()
+    return corrected
@@ -0,0 +1,233 @@
+"""Cache of rendered HTML: project cards and pages for anonymous visitors."""
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Optional
+
+from flask import current_app, request, session
+from flask_login import current_user
+from flask_wtf.csrf import generate_csrf
+from markupsafe import Markup
+
+from app.utils.redis import connect_redis
+from app.utils.singleton import process_singleton
+
+# Stands in for the visitor's CSRF token in cached pages
+CSRF_PLACEHOLDER = '__solio_csrf_token__'
+
+# Cached pages, dropped by invalidate_pages()
+HOMEPAGE_KEY = 'page:index'
+
+
+class FragmentCache:
+    """
+    LRU cache of rendered HTML with a time-to-live per entry.
+
+    Entries are evicted least-recently-used once the total size of
+    cached HTML exceeds max_bytes. When a Redis client is given it is
+    used as a shared second tier, so invalidations and renders in one
+    worker reach the others.
+    """
+
+    REDIS_PREFIX = 'solio:fragment:'
+
+    def __init__(self, max_bytes: int = 8 * 1024 * 1024, redis_client=None):
+        self.max_bytes = max_bytes
+        self.redis = redis_client
+
+        self._entries = OrderedDict()  # key -> (expires_at, html)
+        self._size = 0
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.redis_hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: str) -> Optional[str]:
+        """Get cached HTML, or None."""
+        now = time.time()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] <= now:
+                self._remove(key)
+                entry = None
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[1]
+
+        if self.redis is not None:
+            try:
+                raw = self.redis.get(self.REDIS_PREFIX + key)
+                ttl = self.redis.ttl(self.REDIS_PREFIX + key) if raw is not None else None
+            except Exception as e:
+                current_app.logger.warning(f"Fragment cache Redis error: {e}")
+                raw = None
+            if raw is not None:
+                html = raw.decode('utf-8') if isinstance(raw, bytes) else raw
+                if ttl and ttl > 0:
+                    self._store(key, html, ttl)
+                with self._lock:
+                    self.redis_hits += 1
+                return html
+
+        with self._lock:
+            self.misses += 1
+        return None
+
+    def set(self, key: str, html: str, ttl: float):
+        """Cache HTML for ttl seconds."""
+        self._store(key, html, ttl)
+
+        if self.redis is not None:
+            try:
+                self.redis.set(self.REDIS_PREFIX + key, html, ex=max(1, int(ttl)))
+            except Exception as e:
+                current_app.logger.warning(f"Fragment cache Redis error: {e}")
+
+    def delete(self, key: str):
+        """Drop an entry here and in Redis."""
+        with self._lock:
+            self._remove(key)
+
+        if self.redis is not None:
+            try:
+                self.redis.delete(self.REDIS_PREFIX + key)
+            except Exception as e:
+                current_app.logger.warning(f"Fragment cache Redis error: {e}")
+
+    def _remove(self, key: str):
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._size -= len(entry[1])
+
+    def _store(self, key: str, html: str, ttl: float):
+        size = len(html)
+        if size > self.max_bytes:
+            return
+
+        with self._lock:
+            self._remove(key)
+            self._entries[key] = (time.time() + ttl, html)
+            self._size += size
+
+            while self._size > self.max_bytes:
+                _, (_, evicted) = self._entries.popitem(last=False)
+                self._size -= len(evicted)
+                self.evictions += 1
+
+    def clear(self):
+        """Drop all in-process entries."""
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+
+    def stats(self) -> dict:
+        """Get hit/miss counters and memory use."""
+        with self._lock:
+            return {
+                'entries': len(self._entries),
+                'bytes': self._size,
+                'max_bytes': self.max_bytes,
+                'hits': self.hits,
+                'redis_hits': self.redis_hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'redis': self.redis is not None
+            }
+
+
+@process_singleton
+def get_fragment_cache() -> FragmentCache:
+    """Get the process-wide fragment cache."""
+    return FragmentCache(
+        max_bytes=current_app.config.get('FRAGMENT_CACHE_MAX_BYTES', 8 * 1024 * 1024),
+        redis_client=connect_redis(
+            current_app.config.get('FRAGMENT_CACHE_REDIS_URL', ''),
+            purpose='fragment cache'
+        )
+    )
+
+
+def _card_key(project) -> str:
+    # Edits bump updated_at and donations donation_count, so a changed
+    # project gets a new key; the days left change the card daily
+    if project.is_ended:
+        remaining = 'ended'
+    else:
+        remaining = project.time_remaining.days if project.time_remaining else 0
+    updated = project.updated_at.timestamp() if project.updated_at else 0
+    return f'card:{project.id}:{updated}:{project.donation_count}:{remaining}'
+
+
+def _render_card(project) -> str:
+    # Straight from the Jinja environment: render_template would run the
+    # context processors, and their unread notification query, per card
+    return current_app.jinja_env.get_template('components/project_card.html').render(project=project)
+
+
+def render_project_card(project) -> Markup:
+    """
+    Render a project card, from cache when this version was seen before.
+
+    Creator and category changes are picked up once the entry expires
+    after FRAGMENT_CACHE_CARD_SECONDS.
+    """
+    if not current_app.config.get('FRAGMENT_CACHE_ENABLED', True):
+        return Markup(_render_card(project))
+
+    cache = get_fragment_cache()
+    key = _card_key(project)
+
+    html = cache.get(key)
+    if html is None:
+        html = _render_card(project)
+        cache.set(key, html, current_app.config.get('FRAGMENT_CACHE_CARD_SECONDS', 300))
+    return Markup(html)
+
+
+def page_cacheable() -> bool:
+    """Check whether the current request may get a shared cached page."""
+    return (
+        current_app.config.get('FRAGMENT_CACHE_ENABLED', True)
+        and request.method == 'GET'
+        and not request.args
+        and not current_user.is_authenticated
+        and not session.get('_flashes')
+    )
+
+
+def render_cached_page(key: str, render: Callable[[], str], ttl: float = None) -> str:
+    """
+    Render a page for an anonymous visitor, from cache when possible.
+
+    The visitor's CSRF token is swapped for a placeholder before the
+    page is cached and back in when it is served. Only call this when
+    page_cacheable() is True.
+    """
+    cache = get_fragment_cache()
+    token = generate_csrf()
+
+    html = cache.get(key)
+    if html is not None:
+        return html.replace(CSRF_PLACEHOLDER, token)
+
+    html = render()
+    if ttl is None:
+        ttl = current_app.config.get('FRAGMENT_CACHE_PAGE_SECONDS', 60)
+    cache.set(key, html.replace(token, CSRF_PLACEHOLDER), ttl)
+    return html
+
+
+def invalidate_pages():
+    """
+    Drop cached pages after a project or its donations changed.
+
+    Without Redis other workers keep their copy until it expires after
+    FRAGMENT_CACHE_PAGE_SECONDS.
+    """
+    try:
+        get_fragment_cache().delete(HOMEPAGE_KEY)
+    except Exception as e:
+        current_app.logger.error(f"Fragment cache invalidation error: {e}")
@@ -0,0 +1,164 @@
+"""Platform wallet indexer that reconciles donations from chain history."""
+from datetime import datetime
+
+from flask import current_app
+
+from app.extensions import db
+from app.models import Donation, ChainCursor, UnmatchedTransfer
+from app.services.solana_service import get_signatures_for_address, get_parsed_transactions
+from app.services.donation_service import claim_donation, confirm_donation
+from app.services.tx_parser import AMOUNT_TOLERANCE_LAMPORTS, find_transfers_many, balance_delta
+from app.utils.money import lamports_to_sol
+
+CURSOR_NAME = 'platform_wallet'
+
+
+def _new_signatures(wallet: str, until: str, backfill_limit: int) -> list:
+    """
+    Page through getSignaturesForAddress back to the cursor.
+
+    Without a cursor only the newest backfill_limit signatures are taken.
+    Returns signature infos oldest first.
+    """
+    collected = []
+    before = None
+
+    while until or len(collected) < backfill_limit:
+        limit = 1000 if until else min(1000, backfill_limit - len(collected))
+        page = get_signatures_for_address(wallet, until=until, before=before, limit=limit)
+        if page is None:
+            raise RuntimeError('getSignaturesForAddress failed')
+        if not page:
+            break
+        collected.extend(page)
+        before = page[-1]['signature']
+
+    collected.reverse()
+    return collected
+
+
+def _record_unmatched(signature: str, source: str, lamports: int, info: dict,
+                      reason: str, donation_id: int = None):
+    if UnmatchedTransfer.query.filter_by(tx_signature=signature).first():
+        return
+
+    block_time = info.get('blockTime')
+    db.session.add(UnmatchedTransfer(
+        tx_signature=signature,
+        source_wallet=source,
+        lamports=lamports,
+        slot=info.get('slot'),
+        block_time=datetime.utcfromtimestamp(block_time) if block_time else None,
+        reason=reason,
+        donation_id=donation_id
+    ))
+
+
+def _reconcile(signature: str, tx: dict, transfers: list, info: dict, wallet: str, summary: dict):
+    """Match one finalized transaction against donations."""
+    if not transfers:
+        # SOL can also arrive without a system transfer (e.g. a closed
+        # account's rent); record it so the report still adds up
+        delta = balance_delta(tx, wallet)
+        if delta and delta > 0:
+            _record_unmatched(signature, '', delta, info, 'untracked_credit')
+            summary['unmatched'] += 1
+        return
+
+    donation = Donation.query.filter_by(tx_signature=signature).first()
+
+    if donation is None:
+        for transfer in transfers:
+            _record_unmatched(signature, transfer.source, transfer.lamports, info, 'no_donation')
+        summary['unmatched'] += 1
+        return
+
+    # Failed donations are checked too: the finalized transfer overrides
+    # a verification that failed it wrongly
+    if donation.status not in ('pending', 'failed'):
+        return
+
+    expected = donation.amount_lamports
+    for transfer in transfers:
+        if (transfer.source == donation.donor_wallet
+                and abs(transfer.lamports - expected) <= AMOUNT_TOLERANCE_LAMPORTS):
+            # Chain already proves the transfer, so skip verify_transaction
+            if claim_donation(donation.id, status=donation.status):
+                confirm_donation(Donation.query.get(donation.id))
+                summary['credited'] += 1
+            return
+
+    transfer = transfers[0]
+    reason = 'sender_mismatch' if transfer.source != donation.donor_wallet else 'amount_mismatch'
+    _record_unmatched(signature, transfer.source, transfer.lamports, info, reason, donation_id=donation.id)
+    summary['unmatched'] += 1
+
+
+def index_platform_wallet() -> dict:
+    """
+    Scan new platform wallet transactions since the persisted cursor.
+
+    Credits pending or failed donations whose transfer is found on chain
+    (e.g. the donor closed the tab before /donations/verify returned, or
+    verification gave up on a transaction that landed late) and records
+    transfers that match no donation for the reconciliation report.
+
+    Returns summary dict with scanned, credited and unmatched counts.
+    """
+    wallet = current_app.config.get('PLATFORM_WALLET_ADDRESS', '')
+    summary = {'scanned': 0, 'credited': 0, 'unmatched': 0}
+
+    if not wallet:
+        current_app.logger.error("Platform wallet address not configured")
+        return summary
+
+    cursor = ChainCursor.get_or_create(CURSOR_NAME)
+    db.session.commit()
+
+    backfill_limit = current_app.config.get('INDEXER_BACKFILL_LIMIT', 1000)
+    infos = _new_signatures(wallet, cursor.last_signature, backfill_limit)
+
+    chunk_size = current_app.config.get('INDEXER_CHUNK_SIZE', 100)
+    for i in range(0, len(infos), chunk_size):
+        chunk = infos[i:i + chunk_size]
+        landed = [info['signature'] for info in chunk if info.get('err') is None]
+        transactions = get_parsed_transactions(landed)
+        incoming = find_transfers_many(transactions, destination=wallet)
+
+        for info in chunk:
+            signature = info['signature']
+            if info.get('err') is None:
+                tx = transactions.get(signature)
+                if tx is None:
+                    # Leave the cursor here and retry on the next run
+                    db.session.commit()
+                    current_app.logger.warning(f"Indexer could not fetch {signature}, stopping")
+                    return summary
+                _reconcile(signature, tx, incoming.get(signature, []), info, wallet, summary)
+
+            cursor.last_signature = signature
+            cursor.last_slot = info.get('slot')
+            summary['scanned'] += 1
+
+        db.session.commit()
+
+    return summary
+
+
+def get_reconciliation_report(include_resolved: bool = False) -> dict:
+    """Get unmatched incoming transfers for review."""
+    query = UnmatchedTransfer.query
+    if not include_resolved:
+        query = query.filter_by(resolved=False)
+
+    transfers = query.order_by(UnmatchedTransfer.slot.desc()).all()
+    total_lamports = sum(t.lamports for t in transfers)
+    cursor = ChainCursor.query.filter_by(name=CURSOR_NAME).first()
+
+    return {
+        'cursor_signature': cursor.last_signature if cursor else None,
+        'cursor_slot': cursor.last_slot if cursor else None,
+        'unmatched_count': len(transfers),
+        'unmatched_total_sol': str(lamports_to_sol(total_lamports)),
+        'transfers': [t.to_dict() for t in transfers]
+    }
@@ -0,0 +1,159 @@
+"""Storage for wallet login nonces."""
+import abc
+import secrets
+import threading
+import time
+from datetime import datetime
+
+from flask import current_app
+
+from app.extensions import db
+from app.models import WalletNonce
+from app.utils.redis import connect_redis
+from app.utils.singleton import process_singleton
+
+
+def message_to_sign(nonce: str) -> str:
+    """Get the message a wallet signs to log in with a nonce."""
+    return WalletNonce.MESSAGE_TEMPLATE.format(nonce=nonce)
+
+
+class NonceStore(abc.ABC):
+    """
+    One outstanding login nonce per wallet.
+
+    issue() replaces any earlier nonce for the wallet; consume() succeeds
+    at most once per issued nonce and only before it expires.
+    """
+
+    @abc.abstractmethod
+    def issue(self, wallet_address: str, ttl_seconds: int) -> str:
+        """Create a nonce for a wallet, replacing any earlier one."""
+
+    @abc.abstractmethod
+    def consume(self, wallet_address: str, nonce: str) -> bool:
+        """Atomically use up a nonce. Returns True if it was valid."""
+
+    def cleanup(self) -> int:
+        """Drop expired nonces. Returns number removed (if known)."""
+        return 0
+
+
+class MemoryNonceStore(NonceStore):
+    """
+    Process-local store, for tests and single-process development.
+
+    Nonces issued by one gunicorn worker can't be consumed by another,
+    so don't use it with several workers.
+    """
+
+    def __init__(self):
+        self._nonces = {}  # wallet address -> (nonce, expires at)
+        self._lock = threading.Lock()
+
+    def issue(self, wallet_address: str, ttl_seconds: int) -> str:
+        nonce = secrets.token_hex(32)
+        with self._lock:
+            self._nonces[wallet_address] = (nonce, time.monotonic() + ttl_seconds)
+        return nonce
+
+    def consume(self, wallet_address: str, nonce: str) -> bool:
+        with self._lock:
+            current = self._nonces.get(wallet_address)
+            if current is None or current[0] != nonce:
+                return False
+            del self._nonces[wallet_address]
+        return time.monotonic() < current[1]
+
+    def cleanup(self) -> int:
+        now = time.monotonic()
+        with self._lock:
+            expired = [wallet for wallet, (_, expires) in self._nonces.items() if expires <= now]
+            for wallet in expired:
+                del self._nonces[wallet]
+        return len(expired)
+
+
+class RedisNonceStore(NonceStore):
+    """
+    Redis-backed store shared by all workers.
+
+    Nonces are keys with a TTL, so Redis expires them and no cleanup
+    job is needed.
+    """
+
+    REDIS_PREFIX = 'solio:nonce:'
+
+    # Delete the key only if it still holds the presented nonce
+    CONSUME_SCRIPT = """
+    if redis.call('get', KEYS[1]) == ARGV[1] then
+        return redis.call('del', KEYS[1])
+    end
+    return 0
+    """
+
+    def __init__(self, redis_client):
+        self.redis = redis_client
+        self._consume = redis_client.register_script(self.CONSUME_SCRIPT)
+
+    def issue(self, wallet_address: str, ttl_seconds: int) -> str:
+        nonce = secrets.token_hex(32)
+        self.redis.set(self.REDIS_PREFIX + wallet_address, nonce, ex=ttl_seconds)
+        return nonce
+
+    def consume(self, wallet_address: str, nonce: str) -> bool:
+        return self._consume(keys=[self.REDIS_PREFIX + wallet_address], args=[nonce]) == 1
+
+
+class SqlNonceStore(NonceStore):
+    """Store backed by the wallet_nonces table, used when Redis isn't configured."""
+
+    def issue(self, wallet_address: str, ttl_seconds: int) -> str:
+        WalletNonce.query.filter_by(wallet_address=wallet_address).delete()
+        wallet_nonce = WalletNonce.generate(wallet_address, expiry_minutes=ttl_seconds / 60)
+        db.session.add(wallet_nonce)
+        db.session.commit()
+        return wallet_nonce.nonce
+
+    def consume(self, wallet_address: str, nonce: str) -> bool:
+        used = WalletNonce.query.filter(
+            WalletNonce.wallet_address == wallet_address,
+            WalletNonce.nonce == nonce,
+            WalletNonce.used.is_(False),
+            WalletNonce.expires_at > datetime.utcnow()
+        ).update({'used': True}, synchronize_session=False)
+        db.session.commit()
+        return used == 1
+
+    def cleanup(self) -> int:
+        removed = WalletNonce.query.filter(
+            WalletNonce.expires_at < datetime.utcnow()
+        ).delete()
+        db.session.commit()
+        return removed
+
+
+@process_singleton
+def get_nonce_store() -> NonceStore:
+    """
+    Get the process-wide nonce store.
+
+    WALLET_NONCE_STORE picks 'redis', 'memory' or 'sql'. Left empty,
+    Redis is used when WALLET_NONCE_REDIS_URL is set and reachable by
+    the client library, otherwise the wallet_nonces table.
+    """
+    backend = current_app.config.get('WALLET_NONCE_STORE', '')
+    redis_client = None
+    if backend in ('', 'redis'):
+        redis_client = connect_redis(
+            current_app.config.get('WALLET_NONCE_REDIS_URL', ''),
+            purpose='wallet nonces'
+        )
+
+    if redis_client is not None:
+        return RedisNonceStore(redis_client)
+    if backend == 'memory':
+        return MemoryNonceStore()
+    if backend == 'redis':
+        current_app.logger.warning("Redis nonce store not available, using SQL")
+    return SqlNonceStore()
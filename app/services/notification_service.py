@@ -87,7 +87,7 @@ def notify_project_ended(project):
         user_id=project.user_id,
         type='project_ended',
         title=f'Project ended: {project.title}',
-        message=f'Your project raised {project.raised_sol} SOL from {project.donation_count} donors.',
+        message=f'Your project raised {project.raised_sol} SOL from {project.donor_count} donors.',
         link=url_for('projects.detail', slug=project.slug),
         project_id=project.id
     )
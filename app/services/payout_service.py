@@ -1,13 +1,37 @@
 """Payout service for processing creator payments."""
-from datetime import datetime
-from decimal import Decimal
+import base64
+import os
+import socket
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from typing import Optional
 
 from flask import current_app
 
 from app.extensions import db
 from app.models import Project, Payout
-from app.services.solana_service import send_sol, get_transaction_status
+from app.services.solana_service import (
+    sign_and_send, send_raw_transaction, build_transfer_transaction, pack_transfers,
+    get_transaction_statuses, get_block_height
+)
+from app.services.blockhash_cache import get_blockhash_cache
+from app.services.priority_fees import get_compute_unit_price
 from app.services.email_service import send_payout_notification
+from app.services.donation_service import _url_context
+from app.services.price_history import usd_total
+from app.utils.money import percent_of, lamports_to_sol
+
+# Smallest payout worth sending (0.001 SOL), well above the transaction fee
+MIN_PAYOUT_LAMPORTS = 1_000_000
+
+# Payout lifecycle:
+#   pending    -> record created, nothing signed yet
+#   signed     -> transaction and signature stored, broadcast not acknowledged
+#   processing -> broadcast accepted, waiting for finalization
+#   completed / failed
+SUBMITTED_STATUSES = ('signed', 'processing')
 
 
 def process_pending_payouts():
@@ -15,118 +39,519 @@ def process_pending_payouts():
     Process all pending payouts for ended projects.
     Called by scheduler every 5 minutes.
 
+    Safe to run from several cron workers at once: projects and payouts
+    are claimed in bounded chunks (skipping rows another worker has
+    locked on PostgreSQL, through atomic conditional updates and payout
+    leases everywhere), so no project is ever paid twice. Each step is
+    committed before the next one starts, so a crash at any point
+    leaves payouts in a state reconcile_payouts can resume from.
+
     Returns number of payouts processed.
     """
-    processed = 0
+    chunk_size = current_app.config.get('PAYOUT_CHUNK_SIZE', 50)
+
+    # Resume anything an earlier (possibly crashed) run left in flight
+    processed = reconcile_payouts()
+
+    # Create payout records for ended projects
+    while True:
+        projects = _lock_candidates(
+            Project.query.filter(
+                Project.status == 'active',
+                Project.end_date < datetime.utcnow(),
+                Project.payout_status == 'pending',
+                Project.raised_lamports > 0
+            ).order_by(Project.id),
+            chunk_size
+        )
+        if not projects:
+            break
+
+        for project in projects:
+            if not _claim_project(project):
+                # Another worker got there first
+                continue
+
+            # Check if creator has wallet address
+            if not project.creator.wallet_address:
+                current_app.logger.warning(
+                    f"Project {project.id} creator has no wallet address"
+                )
+            else:
+                prepare_payout(project)
+
+            db.session.commit()
+
+    # Sign and send pending payouts chunk by chunk
+    submitted = False
+    while True:
+        owner = _lease_owner()
+        payouts = claim_pending_payouts(owner, chunk_size)
+        if not payouts:
+            break
+
+        try:
+            progressed = submit_payouts(payouts, owner)
+        except Exception as e:
+            # Unsigned payouts stay pending, signed ones are reconciled
+            current_app.logger.error(f"Payout submission error: {e}")
+            db.session.rollback()
+            progressed = 0
+        finally:
+            release_payout_leases(owner)
+
+        submitted = submitted or progressed > 0
+        if not progressed:
+            # Nothing moved (e.g. no blockhash), try again next run
+            break
+
+    if submitted:
+        processed += confirm_submitted_payouts(
+            timeout=current_app.config.get('PAYOUT_CONFIRM_TIMEOUT', 60)
+        )
 
-    # Find ended projects that need payout
-    projects = Project.query.filter(
-        Project.status == 'active',
-        Project.end_date < datetime.utcnow(),
-        Project.payout_status == 'pending',
-        Project.raised_sol > 0
-    ).all()
+    return processed
 
-    for project in projects:
-        # Mark project as ended
-        project.status = 'ended'
 
-        # Check if creator has wallet address
-        if not project.creator.wallet_address:
-            current_app.logger.warning(
-                f"Project {project.id} creator has no wallet address"
-            )
-            continue
+def _lock_candidates(query, limit: int) -> list:
+    """
+    Get up to limit rows to claim.
+
+    On PostgreSQL rows locked by another worker's claim are skipped
+    rather than waited on. Elsewhere callers rely on the conditional
+    update in the claim itself.
+    """
+    if db.engine.dialect.name == 'postgresql':
+        query = query.with_for_update(skip_locked=True)
+    return query.limit(limit).all()
+
+
+def _claim_project(project: Project) -> bool:
+    """Atomically mark an eligible project as ended so one worker owns it."""
+    claimed = Project.query.filter_by(
+        id=project.id,
+        status='active',
+        payout_status='pending'
+    ).update({'status': 'ended'}, synchronize_session=False)
+    project.status = 'ended'
+    return claimed == 1
+
+
+def _lease_owner() -> str:
+    """Unique token identifying one claim."""
+    return f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"[:64]
+
 
-        # Create payout record
-        success = process_single_payout(project)
-        if success:
-            processed += 1
+def _lease_is_free():
+    return db.or_(
+        Payout.lease_expires_at.is_(None),
+        Payout.lease_expires_at < datetime.utcnow()
+    )
 
+
+def claim_pending_payouts(owner: str, limit: int) -> list:
+    """
+    Lease up to limit pending payouts to owner.
+
+    Returns the claimed payouts.
+    """
+    candidates = _lock_candidates(
+        Payout.query.filter(
+            Payout.status == 'pending',
+            _lease_is_free()
+        ).order_by(Payout.id),
+        limit
+    )
+    if not candidates:
+        db.session.commit()
+        return []
+
+    lease_seconds = current_app.config.get('PAYOUT_LEASE_SECONDS', 300)
+    Payout.query.filter(
+        Payout.id.in_([payout.id for payout in candidates]),
+        Payout.status == 'pending',
+        _lease_is_free()
+    ).update({
+        'lease_owner': owner,
+        'lease_expires_at': datetime.utcnow() + timedelta(seconds=lease_seconds)
+    }, synchronize_session=False)
+    db.session.commit()
+
+    return Payout.query.filter_by(
+        lease_owner=owner,
+        status='pending'
+    ).order_by(Payout.id).all()
+
+
+def release_payout_leases(owner: str):
+    """Give back payouts owner claimed but did not get to sign."""
+    Payout.query.filter_by(
+        lease_owner=owner,
+        status='pending'
+    ).update({
+        'lease_owner': None,
+        'lease_expires_at': None
+    }, synchronize_session=False)
     db.session.commit()
-    return processed
 
 
-def process_single_payout(project: Project) -> bool:
+def prepare_payout(project: Project) -> Optional[Payout]:
     """
-    Process payout for a single project.
+    Create a pending payout record for a project.
 
-    Returns True if successful.
+    Returns the payout, or None if the project can't be paid out yet.
     """
-    try:
-        platform_fee_percent = current_app.config.get('PLATFORM_FEE_PERCENT', 2.5)
-        platform_secret = current_app.config.get('PLATFORM_WALLET_SECRET', '')
+    platform_fee_percent = current_app.config.get('PLATFORM_FEE_PERCENT', 2.5)
 
-        if not platform_secret:
-            current_app.logger.error("Platform wallet secret not configured")
-            return False
+    if not current_app.config.get('PLATFORM_WALLET_SECRET', ''):
+        current_app.logger.error("Platform wallet secret not configured")
+        return None
 
-        # Calculate amounts
-        total_raised = project.raised_sol or Decimal('0')
-        platform_fee = total_raised * Decimal(str(platform_fee_percent)) / Decimal('100')
-        net_amount = total_raised - platform_fee
+    # Calculate amounts
+    total_raised = project.raised_lamports or 0
+    platform_fee = percent_of(total_raised, platform_fee_percent)
+    net_amount = total_raised - platform_fee
 
-        # Minimum payout check (need to cover transaction fee ~0.000005 SOL)
-        if net_amount < Decimal('0.001'):
-            current_app.logger.warning(
-                f"Project {project.id} net amount too small: {net_amount}"
-            )
-            return False
-
-        # Create payout record
-        payout = Payout(
-            project_id=project.id,
-            total_raised=total_raised,
-            platform_fee=platform_fee,
-            net_amount=net_amount,
-            recipient_wallet=project.creator.wallet_address,
-            status='processing'
+    # Minimum payout check (need to cover transaction fee ~0.000005 SOL)
+    if net_amount < MIN_PAYOUT_LAMPORTS:
+        current_app.logger.warning(
+            f"Project {project.id} net amount too small: {lamports_to_sol(net_amount)}"
         )
-        db.session.add(payout)
-        db.session.flush()
+        return None
+
+    # Create payout record
+    payout = Payout(
+        project_id=project.id,
+        total_raised_lamports=total_raised,
+        platform_fee_lamports=platform_fee,
+        net_amount_lamports=net_amount,
+        recipient_wallet=project.creator.wallet_address,
+        status='pending'
+    )
+    db.session.add(payout)
+    db.session.flush()
+
+    project.payout_status = 'processing'
+    return payout
+
+
+def _submit_batch(app, sender_keypair, owner: str, payout_ids: list, transfers: list,
+                  compute_unit_price: Optional[int]) -> dict:
+    """
+    Sign and broadcast one batch from a worker thread.
 
-        project.payout_status = 'processing'
+    The signed transaction is committed as 'signed' before every
+    broadcast attempt, so its signature is never lost. Nothing is sent
+    unless owner still holds the lease on every payout in the batch.
+    """
+    def persist(tx, latest):
+        updated = Payout.query.filter(
+            Payout.id.in_(payout_ids),
+            Payout.lease_owner == owner,
+            Payout.status.in_(['pending', 'signed'])
+        ).update({
+            'status': 'signed',
+            'tx_signature': str(tx.signatures[0]),
+            'signed_tx': base64.b64encode(bytes(tx)).decode('utf-8'),
+            'last_valid_block_height': latest['last_valid_block_height']
+        }, synchronize_session=False)
+        if updated != len(payout_ids):
+            db.session.rollback()
+            raise RuntimeError('Payout lease lost, batch not sent')
+        db.session.commit()
+
+    with app.app_context():
+        try:
+            return sign_and_send(
+                lambda blockhash: build_transfer_transaction(
+                    sender_keypair, transfers, blockhash, compute_unit_price
+                ),
+                on_signed=persist
+            )
+        except Exception as e:
+            app.logger.error(f"Payout batch error: {e}")
+            db.session.rollback()
+            return {'success': False, 'error': str(e)}
+        finally:
+            db.session.remove()
 
-        # Send SOL to creator
-        result = send_sol(
-            recipient=project.creator.wallet_address,
-            amount_sol=net_amount,
-            sender_secret=platform_secret
-        )
 
-        if result['success']:
-            payout.tx_signature = result['signature']
-            payout.status = 'completed'
-            payout.completed_at = datetime.utcnow()
-            project.payout_status = 'completed'
-            project.payout_tx = result['signature']
+def submit_payouts(payouts: list, owner: str) -> int:
+    """
+    Pack pending payouts leased to owner into multi-transfer
+    transactions and send them.
 
+    Batches are signed against the shared cached blockhash and sent
+    concurrently. Accepted payouts move to 'processing' until
+    confirm_submitted_payouts sees the transaction land.
+
+    Returns number of payouts that left 'pending'.
+    """
+    from solders.keypair import Keypair
+    from solders.pubkey import Pubkey
+
+    app = current_app._get_current_object()
+    sender_keypair = Keypair.from_base58_string(app.config['PLATFORM_WALLET_SECRET'])
+
+    latest = get_blockhash_cache().get()
+    if not latest:
+        current_app.logger.error("Failed to get blockhash, payouts left pending")
+        return 0
+
+    valid = []
+    for payout in payouts:
+        try:
+            Pubkey.from_string(payout.recipient_wallet)
+            valid.append(payout)
+        except ValueError:
+            _fail_payout(payout, 'Invalid recipient wallet')
+
+    transfers = [
+        (payout.recipient_wallet, payout.net_amount_lamports)
+        for payout in valid
+    ]
+    # One fee estimate for the whole run keeps batch sizes consistent
+    price = get_compute_unit_price()
+    packed = pack_transfers(sender_keypair, transfers, latest['blockhash'], price)
+
+    # Batches are consecutive slices of payouts
+    batches = []
+    offset = 0
+    for group, _ in packed:
+        batch_payouts = valid[offset:offset + len(group)]
+        batches.append((batch_payouts, [payout.id for payout in batch_payouts], group))
+        offset += len(group)
+
+    # Release our transaction before workers write to the same rows
+    db.session.commit()
+
+    max_workers = app.config.get('PAYOUT_SUBMIT_WORKERS', 4)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        results = list(executor.map(
+            lambda batch: _submit_batch(app, sender_keypair, owner, batch[1], batch[2], price),
+            batches
+        ))
+
+    # Workers committed through their own sessions
+    db.session.expire_all()
+
+    for (batch_payouts, _, _), result in zip(batches, results):
+        if result['success']:
+            for payout in batch_payouts:
+                payout.status = 'processing'
             current_app.logger.info(
-                f"Payout successful for project {project.id}: {result['signature']}"
+                f"Payout batch of {len(batch_payouts)} sent: {result['signature']}"
+            )
+        elif result.get('rejected'):
+            # The node refused it, so it was never forwarded
+            for payout in batch_payouts:
+                _fail_payout(payout, result.get('error', 'Unknown error'))
+        else:
+            current_app.logger.warning(
+                f"Payout batch of {len(batch_payouts)} not acknowledged "
+                f"({result.get('error')}), left for reconciliation"
             )
 
-            # Send email notification
-            try:
-                send_payout_notification(project, payout)
-            except Exception as e:
-                current_app.logger.error(f"Failed to send payout email: {e}")
+    db.session.commit()
+    return sum(1 for payout in payouts if payout.status != 'pending')
 
-            return True
-        else:
-            payout.status = 'failed'
-            payout.error_message = result.get('error', 'Unknown error')
-            project.payout_status = 'failed'
 
-            current_app.logger.error(
-                f"Payout failed for project {project.id}: {result.get('error')}"
+def confirm_submitted_payouts(timeout: float = 0) -> int:
+    """
+    Check submitted payouts in bulk and complete or fail them.
+
+    Polls until every submitted payout is settled or timeout seconds
+    pass (a single check when timeout is 0).
+
+    Returns number of payouts completed.
+    """
+    deadline = time.monotonic() + timeout
+    completed = 0
+
+    while True:
+        payouts = Payout.query.filter(
+            Payout.status.in_(SUBMITTED_STATUSES),
+            Payout.tx_signature.isnot(None)
+        ).all()
+        if not payouts:
+            break
+
+        statuses = get_transaction_statuses([p.tx_signature for p in payouts])
+        for payout in payouts:
+            status = statuses.get(payout.tx_signature)
+            if status == 'confirmed':
+                if _complete_payout(payout):
+                    completed += 1
+            elif status == 'failed':
+                _fail_payout(payout, 'Transaction failed')
+        db.session.commit()
+
+        if time.monotonic() >= deadline:
+            break
+        time.sleep(2)
+
+    return completed
+
+
+def reconcile_payouts() -> int:
+    """
+    Resume payouts left signed or processing by an earlier run.
+
+    Landed transactions are completed or failed. A transaction the
+    cluster has not seen is re-sent while its blockhash is still valid
+    (same signature, so it can only land once). Once the finalized
+    block height is past its last valid height it can never land, and
+    the payout goes back to pending to be signed again.
+
+    Returns number of payouts completed.
+    """
+    payouts = Payout.query.filter(
+        Payout.status.in_(SUBMITTED_STATUSES),
+        Payout.tx_signature.isnot(None)
+    ).all()
+    if not payouts:
+        return 0
+
+    # Read the height before the statuses: if it is already past a
+    # transaction's last valid height, "not found" below is final
+    height = get_block_height('finalized')
+    statuses = get_transaction_statuses(
+        [p.tx_signature for p in payouts],
+        search_history=True
+    )
+
+    completed = 0
+    resend = {}
+    for payout in payouts:
+        if payout.tx_signature not in statuses:
+            # Lookup failed, try again next run
+            continue
+
+        status = statuses[payout.tx_signature]
+        if status == 'confirmed':
+            if _complete_payout(payout):
+                completed += 1
+        elif status == 'failed':
+            _fail_payout(payout, 'Transaction failed')
+        elif status is None:
+            expired = (
+                height is not None
+                and payout.last_valid_block_height is not None
+                and height > payout.last_valid_block_height
             )
-            return False
+            if expired:
+                current_app.logger.warning(
+                    f"Payout {payout.id} transaction {payout.tx_signature} expired, re-signing"
+                )
+                # Conditional on the signature, so a worker that already
+                # re-signed it isn't overwritten
+                Payout.query.filter(
+                    Payout.id == payout.id,
+                    Payout.tx_signature == payout.tx_signature,
+                    Payout.status.in_(SUBMITTED_STATUSES)
+                ).update({
+                    'status': 'pending',
+                    'tx_signature': None,
+                    'signed_tx': None,
+                    'last_valid_block_height': None,
+                    'lease_owner': None,
+                    'lease_expires_at': None
+                }, synchronize_session=False)
+            elif payout.signed_tx:
+                resend[payout.tx_signature] = payout.signed_tx
+
+    db.session.commit()
+
+    for signature, signed_tx in resend.items():
+        result = send_raw_transaction(signed_tx)
+        if not result['success']:
+            current_app.logger.warning(f"Re-sending payout {signature} failed: {result.get('error')}")
+
+    return completed
+
+
+def _complete_payout(payout: Payout) -> bool:
+    """
+    Mark a payout and its project as paid and notify the creator.
 
+    Returns False if another worker already settled it.
+    """
+    project = payout.project
+    completed_at = datetime.utcnow()
+
+    claimed = Payout.query.filter(
+        Payout.id == payout.id,
+        Payout.status.in_(SUBMITTED_STATUSES)
+    ).update({
+        'status': 'completed',
+        'completed_at': completed_at
+    }, synchronize_session=False)
+    if not claimed:
+        return False
+
+    payout.status = 'completed'
+    payout.completed_at = completed_at
+    project.payout_status = 'completed'
+    project.payout_tx = payout.tx_signature
+
+    current_app.logger.info(
+        f"Payout successful for project {project.id}: {payout.tx_signature}"
+    )
+
+    # Don't hold the row locks while talking to the mail server
+    db.session.commit()
+
+    # Send email notification
+    try:
+        with _url_context():
+            send_payout_notification(project, payout)
     except Exception as e:
-        current_app.logger.error(f"Payout error for project {project.id}: {e}")
-        project.payout_status = 'failed'
+        current_app.logger.error(f"Failed to send payout email: {e}")
+
+    return True
+
+
+def _fail_payout(payout: Payout, error: str):
+    """Mark a payout and its project as failed."""
+    payout.status = 'failed'
+    payout.error_message = error
+    payout.project.payout_status = 'failed'
+
+    current_app.logger.error(
+        f"Payout failed for project {payout.project_id}: {error}"
+    )
+
+
+def process_single_payout(project: Project) -> bool:
+    """
+    Process payout for a single project.
+
+    Returns True if the payout was sent.
+    """
+    payout = prepare_payout(project)
+    if not payout:
         return False
 
+    # Lease it up front so a concurrent scheduler run leaves it alone
+    owner = _lease_owner()
+    payout.lease_owner = owner
+    payout.lease_expires_at = datetime.utcnow() + timedelta(
+        seconds=current_app.config.get('PAYOUT_LEASE_SECONDS', 300)
+    )
+    db.session.commit()
+
+    try:
+        submit_payouts([payout], owner)
+    except Exception as e:
+        # Left pending (or signed) for the scheduler to pick up
+        current_app.logger.error(f"Payout error for project {project.id}: {e}")
+        db.session.rollback()
+    finally:
+        release_payout_leases(owner)
+
+    confirm_submitted_payouts()
+    return payout.status in ('processing', 'completed')
+
 
 def retry_failed_payout(project_id: int) -> dict:
     """
@@ -168,27 +593,35 @@ def get_payout_summary():
         Payout.status == 'completed'
     ).scalar()
 
-    total_paid_out = db.session.query(func.sum(Payout.net_amount)).filter(
+    total_paid_out = db.session.query(func.sum(Payout.net_amount_lamports)).filter(
         Payout.status == 'completed'
-    ).scalar() or Decimal('0')
+    ).scalar() or 0
 
-    total_fees = db.session.query(func.sum(Payout.platform_fee)).filter(
+    total_fees = db.session.query(func.sum(Payout.platform_fee_lamports)).filter(
         Payout.status == 'completed'
-    ).scalar() or Decimal('0')
+    ).scalar() or 0
 
     pending_payouts = db.session.query(func.count(Payout.id)).filter(
-        Payout.status.in_(['pending', 'processing'])
+        Payout.status.in_(['pending', 'signed', 'processing'])
     ).scalar()
 
     failed_payouts = db.session.query(func.count(Payout.id)).filter(
         Payout.status == 'failed'
     ).scalar()
 
+    # Valued at the SOL price when each payout completed
+    total_paid_out_usd = usd_total(db.session.query(
+        Payout.net_amount_lamports, Payout.completed_at
+    ).filter(
+        Payout.status == 'completed'
+    ))
+
     return {
         'total_payouts': total_payouts,
         'completed_payouts': completed_payouts,
-        'total_paid_out_sol': str(total_paid_out),
-        'total_fees_sol': str(total_fees),
+        'total_paid_out_sol': str(lamports_to_sol(total_paid_out)),
+        'total_paid_out_usd': round(total_paid_out_usd, 2) if total_paid_out_usd is not None else None,
+        'total_fees_sol': str(lamports_to_sol(total_fees)),
         'pending_payouts': pending_payouts,
         'failed_payouts': failed_payouts
     }
@@ -0,0 +1,229 @@
+"""SOL/USD price history for valuing amounts at past times."""
+import bisect
+import threading
+from array import array
+from datetime import datetime, timedelta
+from typing import Iterable, Optional
+
+from flask import current_app
+from sqlalchemy.exc import IntegrityError
+
+from app.extensions import db
+from app.models import PricePoint
+from app.utils.money import lamports_to_sol
+from app.utils.singleton import process_singleton
+
+_EPOCH = datetime(1970, 1, 1)
+
+
+def _to_timestamp(when: datetime) -> float:
+    """Seconds since the epoch for a naive UTC datetime."""
+    return (when - _EPOCH).total_seconds()
+
+
+def _pick(before: Optional[tuple], after: Optional[tuple], at: float, max_gap: float) -> Optional[float]:
+    """
+    Choose the price for time at from its neighbouring samples.
+
+    The sample at or before at wins; the next one is only used when
+    there is no earlier sample within max_gap seconds.
+    """
+    if before is not None and at - before[0] <= max_gap:
+        return before[1]
+    if after is not None and after[0] - at <= max_gap:
+        return after[1]
+    return None
+
+
+class PriceRing:
+    """
+    Fixed-size ring buffer of (timestamp, price) samples in time order.
+
+    Timestamps and prices live in two preallocated float arrays, so a
+    full day of minute samples costs ~23 KB and lookups are a binary
+    search over the logical order.
+    """
+
+    def __init__(self, capacity: int = 2880):
+        self.capacity = capacity
+        self._timestamps = array('d', [0.0]) * capacity
+        self._prices = array('d', [0.0]) * capacity
+        self._start = 0
+        self._count = 0
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return self._count
+
+    def _slot(self, index: int) -> int:
+        return (self._start + index) % self.capacity
+
+    def append(self, timestamp: float, price: float) -> bool:
+        """Add a sample newer than the last one. Returns False if it isn't."""
+        with self._lock:
+            if self._count and timestamp <= self._timestamps[self._slot(self._count - 1)]:
+                return False
+
+            if self._count < self.capacity:
+                slot = self._slot(self._count)
+                self._count += 1
+            else:
+                # Full: overwrite the oldest sample
+                slot = self._start
+                self._start = (self._start + 1) % self.capacity
+
+            self._timestamps[slot] = timestamp
+            self._prices[slot] = price
+            return True
+
+    def first_timestamp(self) -> Optional[float]:
+        with self._lock:
+            return self._timestamps[self._start] if self._count else None
+
+    def neighbours(self, timestamp: float) -> tuple:
+        """Get the samples at or before and after timestamp (each or None)."""
+        with self._lock:
+            low, high = 0, self._count
+            while low < high:
+                middle = (low + high) // 2
+                if self._timestamps[self._slot(middle)] <= timestamp:
+                    low = middle + 1
+                else:
+                    high = middle
+
+            before = after = None
+            if low > 0:
+                slot = self._slot(low - 1)
+                before = (self._timestamps[slot], self._prices[slot])
+            if low < self._count:
+                slot = self._slot(low)
+                after = (self._timestamps[slot], self._prices[slot])
+            return before, after
+
+
+class PriceHistory:
+    """
+    Price samples from the price oracle: recent ones in a PriceRing,
+    older ones in the price_points table.
+
+    The table is downsampled to one row per store_interval seconds.
+    Times the ring covers are answered from memory, the rest with one
+    range query per lookup batch.
+    """
+
+    def __init__(self, capacity: int = 2880, store_interval: float = 300.0, max_gap: float = 21600.0):
+        self.ring = PriceRing(capacity)
+        self.store_interval = store_interval
+        self.max_gap = max_gap
+
+    def load(self):
+        """Fill the ring with the newest stored samples."""
+        points = PricePoint.query.order_by(
+            PricePoint.timestamp.desc()
+        ).limit(self.ring.capacity).all()
+
+        for point in reversed(points):
+            self.ring.append(_to_timestamp(point.timestamp), point.price_usd)
+
+    def record(self, timestamp: float, price: float, store: bool = False):
+        """
+        Add a sample.
+
+        With store, also write it to the table unless the newest stored
+        sample is less than store_interval seconds older.
+        """
+        self.ring.append(timestamp, price)
+        if not store:
+            return
+
+        when = datetime.utcfromtimestamp(timestamp)
+        last = db.session.query(db.func.max(PricePoint.timestamp)).scalar()
+        if last is not None and (when - last).total_seconds() < self.store_interval:
+            return
+
+        db.session.add(PricePoint(timestamp=when, price_usd=price))
+        try:
+            db.session.commit()
+        except IntegrityError:
+            db.session.rollback()
+
+    def price_at(self, when: datetime) -> Optional[float]:
+        """Get the SOL/USD price at a (naive UTC) time, or None if unknown."""
+        return self.prices_at([when])[0]
+
+    def prices_at(self, whens: list) -> list:
+        """Get the SOL/USD price at each of several times (None where unknown)."""
+        timestamps = [_to_timestamp(when) if when else None for when in whens]
+        prices = [None] * len(timestamps)
+
+        ring_start = self.ring.first_timestamp()
+        missing = []
+        for index, timestamp in enumerate(timestamps):
+            if timestamp is None:
+                continue
+            if ring_start is not None and timestamp >= ring_start:
+                before, after = self.ring.neighbours(timestamp)
+                prices[index] = _pick(before, after, timestamp, self.max_gap)
+            else:
+                missing.append(index)
+
+        if missing:
+            low = min(whens[index] for index in missing) - timedelta(seconds=self.max_gap)
+            high = max(whens[index] for index in missing) + timedelta(seconds=self.max_gap)
+            rows = db.session.query(PricePoint.timestamp, PricePoint.price_usd).filter(
+                PricePoint.timestamp.between(low, high)
+            ).order_by(PricePoint.timestamp).all()
+
+            stored = [_to_timestamp(row.timestamp) for row in rows]
+            for index in missing:
+                position = bisect.bisect_right(stored, timestamps[index])
+                before = (stored[position - 1], rows[position - 1].price_usd) if position else None
+                after = (stored[position], rows[position].price_usd) if position < len(rows) else None
+                prices[index] = _pick(before, after, timestamps[index], self.max_gap)
+
+        return prices
+
+
+@process_singleton
+def get_price_history() -> PriceHistory:
+    """Get the process-wide price history, loading recent samples on first use."""
+    history = PriceHistory(
+        capacity=current_app.config.get('SOL_PRICE_HISTORY_SIZE', 2880),
+        store_interval=current_app.config.get('SOL_PRICE_HISTORY_INTERVAL', 300),
+        max_gap=current_app.config.get('SOL_PRICE_HISTORY_MAX_GAP', 21600)
+    )
+    try:
+        history.load()
+    except Exception as e:
+        current_app.logger.error(f"Price history load error: {e}")
+    return history
+
+
+def price_at(when: datetime) -> Optional[float]:
+    """Get the SOL/USD price at a past (naive UTC) time."""
+    return get_price_history().price_at(when)
+
+
+def usd_total(rows: Iterable[tuple]) -> Optional[float]:
+    """
+    Value lamport amounts at the time each was made.
+
+    Args:
+        rows: (lamports, datetime) tuples
+
+    Returns the USD total, or None if any amount is from a time with no
+    known price: a total that silently leaves amounts out would read as
+    the full figure.
+    """
+    rows = list(rows)
+    if not rows:
+        return 0.0
+
+    prices = get_price_history().prices_at([when for _, when in rows])
+    if any(price is None for price in prices):
+        return None
+
+    return sum(
+        float(lamports_to_sol(lamports)) * price
+        for (lamports, _), price in zip(rows, prices)
+    )
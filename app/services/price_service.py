@@ -1,58 +1,399 @@
 """Price service for SOL/USD conversion."""
+import json
+import os
+import statistics
+import tempfile
+import threading
 import time
-from typing import Optional
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import Callable, Optional
 
 import requests
 from flask import current_app
 
-# Simple in-memory cache
-_price_cache = {
-    'price': None,
-    'timestamp': 0
+from app.services.price_history import get_price_history, price_at
+from app.utils.redis import connect_redis
+from app.utils.singleton import process_singleton
+
+try:
+    import fcntl
+except ImportError:  # Windows development
+    fcntl = None
+
+
+# ============== Sources ==============
+
+def _fetch_coingecko(timeout: float) -> Optional[float]:
+    response = requests.get(
+        'https://api.coingecko.com/api/v3/simple/price',
+        params={'ids': 'solana', 'vs_currencies': 'usd'},
+        timeout=timeout
+    )
+    response.raise_for_status()
+    return response.json().get('solana', {}).get('usd')
+
+
+def _fetch_coinbase(timeout: float) -> Optional[float]:
+    response = requests.get('https://api.coinbase.com/v2/prices/SOL-USD/spot', timeout=timeout)
+    response.raise_for_status()
+    return response.json().get('data', {}).get('amount')
+
+
+def _fetch_kraken(timeout: float) -> Optional[float]:
+    response = requests.get(
+        'https://api.kraken.com/0/public/Ticker',
+        params={'pair': 'SOLUSD'},
+        timeout=timeout
+    )
+    response.raise_for_status()
+    for ticker in (response.json().get('result') or {}).values():
+        return ticker['c'][0]  # last trade price
+    return None
+
+
+def _fetch_binance(timeout: float) -> Optional[float]:
+    response = requests.get(
+        'https://api.binance.com/api/v3/ticker/price',
+        params={'symbol': 'SOLUSDT'},
+        timeout=timeout
+    )
+    response.raise_for_status()
+    return response.json().get('price')
+
+
+# Name -> fetch(timeout) returning the SOL/USD price, enabled by SOL_PRICE_SOURCES
+PRICE_SOURCES = {
+    'coingecko': _fetch_coingecko,
+    'coinbase': _fetch_coinbase,
+    'kraken': _fetch_kraken,
+    'binance': _fetch_binance,
 }
 
 
-def get_sol_price() -> Optional[float]:
+def register_price_source(name: str, fetch: Callable[[float], Optional[float]]):
+    """Add a price source that can be enabled in SOL_PRICE_SOURCES."""
+    PRICE_SOURCES[name] = fetch
+
+
+def aggregate_prices(prices: dict, max_deviation: float = 0.05) -> Optional[float]:
     """
-    Get current SOL/USD price.
+    Combine quotes from several sources into one price.
 
-    Uses CoinGecko API with caching.
+    Quotes further than max_deviation (fraction) from the median are
+    dropped as outliers and the median of the rest is returned.
     """
-    cache_seconds = current_app.config.get('SOL_PRICE_CACHE_SECONDS', 60)
+    if not prices:
+        return None
 
-    # Check cache
-    if _price_cache['price'] and (time.time() - _price_cache['timestamp']) < cache_seconds:
-        return _price_cache['price']
+    median = statistics.median(prices.values())
+    kept = [price for price in prices.values() if abs(price - median) <= median * max_deviation]
+    return statistics.median(kept) if kept else median
 
-    try:
-        response = requests.get(
-            'https://api.coingecko.com/api/v3/simple/price',
-            params={
-                'ids': 'solana',
-                'vs_currencies': 'usd'
-            },
-            timeout=10
-        )
-        response.raise_for_status()
-        data = response.json()
 
-        price = data.get('solana', {}).get('usd')
+# ============== Shared storage ==============
 
-        if price:
-            _price_cache['price'] = price
-            _price_cache['timestamp'] = time.time()
-            return price
+class RedisPriceStore:
+    """Latest price shared through Redis."""
 
-    except Exception as e:
-        current_app.logger.error(f"Price fetch error: {e}")
+    KEY = 'solio:sol_price'
+    LOCK_KEY = 'solio:sol_price:lock'
 
-    # Return cached price even if expired, or None
-    return _price_cache['price']
+    def __init__(self, redis_client):
+        self.redis = redis_client
 
+    def read(self) -> Optional[dict]:
+        raw = self.redis.get(self.KEY)
+        return json.loads(raw) if raw else None
 
-def sol_to_usd(sol_amount: float) -> Optional[float]:
-    """Convert SOL amount to USD."""
-    price = get_sol_price()
+    def write(self, entry: dict):
+        self.redis.set(self.KEY, json.dumps(entry))
+
+    def acquire(self, ttl: float) -> bool:
+        return bool(self.redis.set(self.LOCK_KEY, '1', nx=True, ex=max(1, int(ttl))))
+
+    def release(self):
+        self.redis.delete(self.LOCK_KEY)
+
+
+class FilePriceStore:
+    """
+    Latest price shared through a local file, for workers on one host.
+
+    Writes go to a temporary file that is renamed over the old one, so
+    readers never see a partial entry. The refresh lock is a flock on a
+    separate file, released automatically if the holder dies.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock_file = None
+
+    def read(self) -> Optional[dict]:
+        try:
+            with open(self.path) as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def write(self, entry: dict):
+        directory = os.path.dirname(self.path) or '.'
+        fd, tmp_path = tempfile.mkstemp(dir=directory, prefix='.sol-price-')
+        with os.fdopen(fd, 'w') as f:
+            json.dump(entry, f)
+        os.replace(tmp_path, self.path)
+
+    def acquire(self, ttl: float) -> bool:
+        if fcntl is None:
+            return True
+        lock_file = open(self.path + '.lock', 'w')
+        try:
+            fcntl.flock(lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            lock_file.close()
+            return False
+        self._lock_file = lock_file
+        return True
+
+    def release(self):
+        if self._lock_file is not None:
+            self._lock_file.close()  # closing drops the flock
+            self._lock_file = None
+
+
+# ============== Oracle ==============
+
+class PriceOracle:
+    """
+    SOL/USD price served from memory and refreshed in the background.
+
+    Readers always get the last known price immediately. Once it is
+    older than refresh_after seconds a background refresh starts; the
+    refresh first looks at the shared store, and only the worker that
+    wins the shared lock queries the sources, so one fetch serves every
+    worker. Prices older than max_stale seconds are not served.
+
+    on_update(entry, fetched) is called for every newer entry this
+    process sees; fetched is True in the worker that fetched it.
+    """
+
+    def __init__(self, app, sources: dict, shared=None, refresh_after: float = 60.0,
+                 max_stale: float = 3600.0, max_deviation: float = 0.05, fetch_timeout: float = 5.0,
+                 on_update=None):
+        self.app = app
+        self.sources = sources
+        self.shared = shared
+        self.refresh_after = refresh_after
+        self.max_stale = max_stale
+        self.max_deviation = max_deviation
+        self.fetch_timeout = fetch_timeout
+        self.on_update = on_update
+
+        self._entry = None  # {'price', 'timestamp', 'sources'}
+        self._refreshing = False
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+        self.fetches = 0
+        self.errors = 0
+
+    def get(self) -> Optional[dict]:
+        """
+        Get the latest price entry without blocking on the network.
+
+        Returns dict with 'price', 'timestamp' and 'sources', or None.
+        """
+        with self._lock:
+            entry = self._entry
+            age = time.time() - entry['timestamp'] if entry else None
+
+            if entry is not None and age < self.refresh_after:
+                self.hits += 1
+                return entry
+
+            start_refresh = not self._refreshing
+            if start_refresh:
+                self._refreshing = True
+
+        if entry is None and self.shared is not None:
+            # Cold worker: another one has probably fetched already
+            entry = self._adopt(self._read_shared())
+            if entry is not None and time.time() - entry['timestamp'] < self.refresh_after:
+                with self._lock:
+                    if start_refresh:
+                        self._refreshing = False
+                    self.hits += 1
+                return entry
+
+        if start_refresh:
+            threading.Thread(
+                target=self._background_refresh,
+                name='sol-price-refresh',
+                daemon=True
+            ).start()
+
+        with self._lock:
+            if entry is not None and time.time() - entry['timestamp'] < self.max_stale:
+                self.stale_hits += 1
+                return entry
+            self.misses += 1
+            return None
+
+    def refresh(self) -> Optional[dict]:
+        """Bring the price up to date, fetching from the sources if needed."""
+        if self.shared is None:
+            return self._adopt(self._fetch_entry(), fetched=True)
+
+        entry = self._adopt(self._read_shared())
+        if entry is not None and time.time() - entry['timestamp'] < self.refresh_after:
+            return entry
+
+        if not self.shared.acquire(self.fetch_timeout * 2):
+            # Another worker is fetching; its result is picked up next time
+            return entry
+
+        try:
+            fetched = self._fetch_entry()
+            if fetched is not None:
+                self.shared.write(fetched)
+                entry = self._adopt(fetched, fetched=True)
+        finally:
+            self.shared.release()
+        return entry
+
+    def _background_refresh(self):
+        with self.app.app_context():
+            try:
+                self.refresh()
+            except Exception as e:
+                current_app.logger.error(f"Price refresh error: {e}")
+            finally:
+                with self._lock:
+                    self._refreshing = False
+
+    def _read_shared(self) -> Optional[dict]:
+        try:
+            return self.shared.read()
+        except Exception as e:
+            current_app.logger.warning(f"Shared price read error: {e}")
+            return None
+
+    def _adopt(self, entry: Optional[dict], fetched: bool = False) -> Optional[dict]:
+        """Keep entry if it is newer than ours. Returns the current entry."""
+        with self._lock:
+            newer = entry and (self._entry is None or entry['timestamp'] > self._entry['timestamp'])
+            if newer:
+                self._entry = entry
+            current = self._entry
+
+        if newer and self.on_update is not None:
+            try:
+                self.on_update(entry, fetched)
+            except Exception as e:
+                current_app.logger.error(f"Price update hook error: {e}")
+        return current
+
+    def _fetch_entry(self) -> Optional[dict]:
+        """Query all sources concurrently and aggregate their quotes."""
+        def fetch(name):
+            with self.app.app_context():
+                try:
+                    price = float(self.sources[name](self.fetch_timeout))
+                except Exception as e:
+                    current_app.logger.warning(f"Price source {name} error: {e}")
+                    return None
+                return price if price > 0 else None
+
+        names = list(self.sources)
+        with ThreadPoolExecutor(max_workers=max(1, len(names))) as executor:
+            results = list(executor.map(fetch, names))
+        prices = {name: price for name, price in zip(names, results) if price}
+
+        with self._lock:
+            self.fetches += 1
+            if not prices:
+                self.errors += 1
+
+        price = aggregate_prices(prices, self.max_deviation)
+        if price is None:
+            current_app.logger.error("Price fetch error: no source returned a price")
+            return None
+
+        return {'price': price, 'timestamp': time.time(), 'sources': prices}
+
+    def stats(self) -> dict:
+        """Get the current price and counters for monitoring."""
+        with self._lock:
+            entry = self._entry
+            return {
+                'price': entry['price'] if entry else None,
+                'age_seconds': round(time.time() - entry['timestamp'], 2) if entry else None,
+                'sources': entry['sources'] if entry else {},
+                'shared': type(self.shared).__name__ if self.shared else None,
+                'hits': self.hits,
+                'stale_hits': self.stale_hits,
+                'misses': self.misses,
+                'fetches': self.fetches,
+                'errors': self.errors
+            }
+
+
+def _shared_store():
+    redis_client = connect_redis(current_app.config.get('SOL_PRICE_REDIS_URL', ''), purpose='SOL price')
+    if redis_client is not None:
+        return RedisPriceStore(redis_client)
+
+    path = current_app.config.get('SOL_PRICE_SHARED_FILE') or os.path.join(
+        tempfile.gettempdir(), 'solio-sol-price.json'
+    )
+    return FilePriceStore(path)
+
+
+def _record_history(entry: dict, fetched: bool):
+    # Every worker keeps the samples in memory, the fetching one stores them
+    get_price_history().record(entry['timestamp'], entry['price'], store=fetched)
+
+
+@process_singleton
+def get_price_oracle() -> PriceOracle:
+    """Get the process-wide price oracle."""
+    names = [
+        name.strip()
+        for name in current_app.config.get('SOL_PRICE_SOURCES', 'coingecko').split(',')
+        if name.strip()
+    ]
+    unknown = [name for name in names if name not in PRICE_SOURCES]
+    if unknown:
+        current_app.logger.warning(f"Unknown price sources ignored: {', '.join(unknown)}")
+
+    return PriceOracle(
+        current_app._get_current_object(),
+        {name: PRICE_SOURCES[name] for name in names if name in PRICE_SOURCES},
+        shared=_shared_store(),
+        refresh_after=current_app.config.get('SOL_PRICE_CACHE_SECONDS', 60),
+        max_stale=current_app.config.get('SOL_PRICE_MAX_STALE_SECONDS', 3600),
+        max_deviation=current_app.config.get('SOL_PRICE_MAX_DEVIATION', 0.05),
+        fetch_timeout=current_app.config.get('SOL_PRICE_FETCH_TIMEOUT', 5),
+        on_update=_record_history
+    )
+
+
+def get_sol_price() -> Optional[float]:
+    """
+    Get current SOL/USD price.
+
+    Served from the price oracle, which never blocks on the sources;
+    None until a first price is known.
+    """
+    entry = get_price_oracle().get()
+    return entry['price'] if entry else None
+
+
+def sol_to_usd(sol_amount: float, at: datetime = None) -> Optional[float]:
+    """Convert SOL amount to USD, at the current price or the price at a past time."""
+    price = price_at(at) if at else get_sol_price()
     if price:
         return sol_amount * price
     return None
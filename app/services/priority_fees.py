@@ -0,0 +1,121 @@
+"""Rolling priority fee estimate for transactions we send."""
+import threading
+import time
+from collections import OrderedDict
+from typing import Optional
+
+from flask import current_app
+
+from app.utils.singleton import process_singleton
+
+
+class PriorityFeeEstimator:
+    """
+    Tracks recent prioritization fees and suggests a compute unit price.
+
+    getRecentPrioritizationFees returns the minimum fee paid per slot
+    for the last ~150 slots touching the given accounts. Samples are
+    merged by slot into a rolling window, so the estimate moves smoothly
+    instead of jumping with every response, and are refetched at most
+    every refresh_seconds.
+    """
+
+    def __init__(self, fetch, percentile: float = 75, window: int = 300,
+                 refresh_seconds: float = 10.0, min_price: int = 0, max_price: int = 1_000_000):
+        self.fetch = fetch
+        self.percentile = percentile
+        self.window = window
+        self.refresh_seconds = refresh_seconds
+        self.min_price = min_price
+        self.max_price = max_price
+
+        self._samples = OrderedDict()  # slot -> micro-lamports per compute unit
+        self._fetched_at = 0.0
+        self._lock = threading.Lock()
+
+        self.refreshes = 0
+        self.errors = 0
+
+    def _refresh(self):
+        samples = self.fetch()
+        if samples is None:
+            with self._lock:
+                self.errors += 1
+                # Keep serving the old window, retry after the interval
+                self._fetched_at = time.monotonic()
+            return
+
+        with self._lock:
+            for sample in sorted(samples, key=lambda s: s['slot']):
+                self._samples[sample['slot']] = sample['prioritizationFee']
+                self._samples.move_to_end(sample['slot'])
+            while len(self._samples) > self.window:
+                self._samples.popitem(last=False)
+            self._fetched_at = time.monotonic()
+            self.refreshes += 1
+
+    def estimate(self) -> int:
+        """Get the suggested compute unit price in micro-lamports."""
+        if time.monotonic() - self._fetched_at >= self.refresh_seconds:
+            self._refresh()
+
+        with self._lock:
+            fees = sorted(self._samples.values())
+
+        if not fees:
+            return self.min_price
+
+        index = min(len(fees) - 1, int(len(fees) * self.percentile / 100))
+        return max(self.min_price, min(fees[index], self.max_price))
+
+    def stats(self) -> dict:
+        """Get the current window and estimate for monitoring."""
+        with self._lock:
+            fees = sorted(self._samples.values())
+            age = time.monotonic() - self._fetched_at if self._fetched_at else None
+
+        return {
+            'samples': len(fees),
+            'min': fees[0] if fees else None,
+            'median': fees[len(fees) // 2] if fees else None,
+            'max': fees[-1] if fees else None,
+            'percentile': self.percentile,
+            'age_seconds': round(age, 2) if age is not None else None,
+            'refreshes': self.refreshes,
+            'errors': self.errors
+        }
+
+
+@process_singleton
+def get_priority_fee_estimator() -> PriorityFeeEstimator:
+    """Get the process-wide priority fee estimator."""
+    from app.services.solana_service import get_recent_prioritization_fees
+
+    # Fees paid by transactions write-locking the platform wallet
+    wallet = current_app.config.get('PLATFORM_WALLET_ADDRESS', '')
+    accounts = [wallet] if wallet else []
+
+    return PriorityFeeEstimator(
+        lambda: get_recent_prioritization_fees(accounts),
+        percentile=current_app.config.get('PRIORITY_FEE_PERCENTILE', 75),
+        refresh_seconds=current_app.config.get('PRIORITY_FEE_REFRESH_SECONDS', 10),
+        min_price=current_app.config.get('PRIORITY_FEE_MIN_MICROLAMPORTS', 0),
+        max_price=current_app.config.get('PRIORITY_FEE_MAX_MICROLAMPORTS', 1_000_000)
+    )
+
+
+def get_compute_unit_price() -> Optional[int]:
+    """
+    Get the compute unit price to attach under the configured policy.
+
+    PRIORITY_FEE_POLICY is 'dynamic' (rolling estimate), 'fixed'
+    (PRIORITY_FEE_MICROLAMPORTS) or 'none'. Returns None when no
+    compute budget instructions should be added.
+    """
+    policy = current_app.config.get('PRIORITY_FEE_POLICY', 'dynamic')
+
+    if policy == 'none':
+        return None
+    if policy == 'fixed':
+        return current_app.config.get('PRIORITY_FEE_MICROLAMPORTS', 0)
+    return get_priority_fee_estimator().estimate()
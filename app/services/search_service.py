@@ -0,0 +1,274 @@
+"""Full-text project search."""
+import html
+import re
+from typing import Optional
+
+from flask import current_app
+from markupsafe import Markup, escape
+from sqlalchemy import inspect, text
+
+from app.extensions import db
+from app.models import Project
+
+# PostgreSQL: weighted tsvector column on projects with a GIN index.
+# SQLite: FTS5 table keyed by project id (rowid), stemmed by porter.
+# Each has an unstemmed twin (search_words / project_search_words) for
+# prefix-matching the word still being typed: "runn" is not a prefix of
+# the stem "run", but it is of "running".
+# Other databases fall back to ILIKE.
+# The columns and tables are created by a migration, and kept out of
+# autogenerate in migrations/env.py.
+SEARCH_CONFIG = 'english'
+WORDS_CONFIG = 'simple'
+FTS_TABLE = 'project_search'
+FTS_WORDS_TABLE = 'project_search_words'
+
+_TAG_RE = re.compile(r'<[^>]+>')
+_TERM_RE = re.compile(r'\w+', re.UNICODE)
+
+# Engine URLs whose index is known to exist
+_ready = set()
+
+
+def _plain_text(value: Optional[str]) -> str:
+    """Strip tags and entities from sanitized description HTML."""
+    return html.unescape(_TAG_RE.sub(' ', value or ''))
+
+
+def _terms(search_query: str) -> list:
+    return _TERM_RE.findall(search_query.lower())[:10]
+
+
+def _highlight_stem(term: str) -> str:
+    # Rough stand-in for the index's stemming, so "runs" marks "running"
+    for suffix in ('ing', 'es', 'ed', 's'):
+        if term.endswith(suffix) and len(term) - len(suffix) >= 3:
+            return term[:-len(suffix)]
+    return term
+
+
+def _dialect() -> str:
+    return db.engine.dialect.name
+
+
+def ensure_search_index():
+    """
+    Create the search columns/tables and indexes if they don't exist.
+
+    Only for databases made with create_all (flask init-db); migrated
+    databases get them from the search index revision.
+    """
+    dialect = _dialect()
+
+    with db.engine.begin() as conn:
+        if dialect == 'postgresql':
+            for column in ('search_vector', 'search_words'):
+                conn.execute(text(f'ALTER TABLE projects ADD COLUMN IF NOT EXISTS {column} tsvector'))
+                conn.execute(text(
+                    f'CREATE INDEX IF NOT EXISTS ix_projects_{column} '
+                    f'ON projects USING GIN ({column})'
+                ))
+        elif dialect == 'sqlite':
+            conn.execute(text(
+                f"CREATE VIRTUAL TABLE IF NOT EXISTS {FTS_TABLE} "
+                f"USING fts5(title, body, tokenize='porter unicode61')"
+            ))
+            conn.execute(text(
+                f"CREATE VIRTUAL TABLE IF NOT EXISTS {FTS_WORDS_TABLE} "
+                f"USING fts5(title, body, tokenize='unicode61')"
+            ))
+
+
+def search_available() -> bool:
+    """Check whether the full-text index exists for this database."""
+    key = str(db.engine.url)
+    if key in _ready:
+        return True
+
+    dialect = _dialect()
+    inspector = inspect(db.engine)
+    if dialect == 'postgresql':
+        columns = {column['name'] for column in inspector.get_columns('projects')}
+        available = 'search_words' in columns
+    elif dialect == 'sqlite':
+        available = inspector.has_table(FTS_WORDS_TABLE)
+    else:
+        return False
+
+    # Only a positive result is cached, so the index is picked up as soon
+    # as the migration or init-db creates it
+    if available:
+        _ready.add(key)
+    return available
+
+
+def _index_rows(conn, projects):
+    dialect = _dialect()
+    for project in projects:
+        params = {'id': project.id, 'title': project.title or '', 'body': _plain_text(project.description)}
+        if dialect == 'postgresql':
+            conn.execute(text(
+                'UPDATE projects SET search_vector = '
+                f"setweight(to_tsvector('{SEARCH_CONFIG}', :title), 'A') || "
+                f"setweight(to_tsvector('{SEARCH_CONFIG}', :body), 'B'), "
+                f"search_words = to_tsvector('{WORDS_CONFIG}', :title || ' ' || :body) "
+                'WHERE id = :id'
+            ), params)
+        else:
+            for table in (FTS_TABLE, FTS_WORDS_TABLE):
+                conn.execute(text(f'DELETE FROM {table} WHERE rowid = :id'), params)
+                conn.execute(text(
+                    f'INSERT INTO {table} (rowid, title, body) VALUES (:id, :title, :body)'
+                ), params)
+
+
+def index_project(project: Project):
+    """
+    Update a project's search entry after its title or description changed.
+
+    Call after the project is committed. Indexing errors are logged,
+    not raised, so saving a project never fails because of search.
+    """
+    if not search_available():
+        return
+    try:
+        with db.engine.begin() as conn:
+            _index_rows(conn, [project])
+    except Exception as e:
+        current_app.logger.error(f"Search index error for project {project.id}: {e}")
+
+
+def reindex_projects(batch_size: int = 500) -> int:
+    """
+    Rebuild the search index for all projects.
+
+    Returns number of projects indexed.
+    """
+    if not search_available():
+        return 0
+
+    if _dialect() == 'sqlite':
+        with db.engine.begin() as conn:
+            conn.execute(text(f'DELETE FROM {FTS_TABLE}'))
+            conn.execute(text(f'DELETE FROM {FTS_WORDS_TABLE}'))
+
+    indexed = 0
+    last_id = 0
+    while True:
+        projects = Project.query.filter(Project.id > last_id).order_by(Project.id).limit(batch_size).all()
+        if not projects:
+            break
+        with db.engine.begin() as conn:
+            _index_rows(conn, projects)
+        indexed += len(projects)
+        last_id = projects[-1].id
+        db.session.expunge_all()
+
+    return indexed
+
+
+def apply_search(query, search_query: str):
+    """
+    Filter a Project query to matches for search_query.
+
+    Terms are stemmed and all of them must match. The last one may also
+    be a partial word, matched as an unstemmed prefix ("solan" finds
+    "Solana", "runn" finds "running").
+
+    Returns (query, rank) where rank is an expression to order by for
+    best matches first, or None when falling back to ILIKE.
+    """
+    terms = _terms(search_query)
+    if not terms:
+        return query, None
+
+    if not search_available():
+        search_term = f'%{search_query}%'
+        return query.filter(db.or_(
+            Project.title.ilike(search_term),
+            Project.description.ilike(search_term)
+        )), None
+
+    complete, partial = terms[:-1], terms[-1]
+
+    if _dialect() == 'postgresql':
+        tsquery = db.func.to_tsquery(SEARCH_CONFIG, ' & '.join(f'{term}:*' for term in terms))
+        prefix = db.func.to_tsquery(WORDS_CONFIG, f'{partial}:*')
+        search_vector = db.literal_column('projects.search_vector')
+        search_words = db.literal_column('projects.search_words')
+
+        prefix_match = search_words.op('@@')(prefix)
+        if complete:
+            prefix_match = db.and_(
+                search_vector.op('@@')(db.func.to_tsquery(SEARCH_CONFIG, ' & '.join(complete))),
+                prefix_match
+            )
+        return (
+            query.filter(db.or_(search_vector.op('@@')(tsquery), prefix_match)),
+            db.func.greatest(
+                db.func.ts_rank_cd(search_vector, tsquery),
+                db.func.ts_rank_cd(search_words, prefix)
+            ).desc()
+        )
+
+    # FTS5: quoted terms, implicitly ANDed; bm25 is lower for better
+    # matches, title weighted over body. A project matches either on the
+    # stemmed table alone or on the complete words there plus the
+    # partial word in the unstemmed table.
+    params = {
+        'match': ' '.join(f'"{term}"*' for term in terms),
+        'prefix': f'"{partial}"*',
+    }
+    prefix_sql = (
+        f'SELECT rowid, bm25({FTS_WORDS_TABLE}, 10.0, 1.0) AS rank '
+        f'FROM {FTS_WORDS_TABLE} WHERE {FTS_WORDS_TABLE} MATCH :prefix'
+    )
+    if complete:
+        prefix_sql += f' AND rowid IN (SELECT rowid FROM {FTS_TABLE} WHERE {FTS_TABLE} MATCH :complete)'
+        params['complete'] = ' '.join(f'"{term}"' for term in complete)
+
+    matches = text(
+        f'SELECT rowid AS project_id, MIN(rank) AS rank FROM ('
+        f'SELECT rowid, bm25({FTS_TABLE}, 10.0, 1.0) AS rank '
+        f'FROM {FTS_TABLE} WHERE {FTS_TABLE} MATCH :match '
+        f'UNION ALL {prefix_sql}'
+        f') GROUP BY rowid'
+    ).bindparams(**params).columns(project_id=db.Integer, rank=db.Float).subquery('search_matches')
+
+    return query.join(matches, matches.c.project_id == Project.id), matches.c.rank.asc()
+
+
+def highlight(project: Project, search_query: str, width: int = 160) -> Optional[Markup]:
+    """
+    Get a plain-text description snippet around the first match, with
+    matched words wrapped in <mark>.
+
+    Returns None if no term appears in the description.
+    """
+    terms = _terms(search_query)
+    if not terms:
+        return None
+
+    body = ' '.join(_plain_text(project.description).split())
+    stems = '|'.join(re.escape(_highlight_stem(term)) for term in terms)
+    pattern = re.compile(r'\b(' + stems + r')\w*', re.IGNORECASE)
+
+    first = pattern.search(body)
+    if not first:
+        return None
+
+    start = max(0, first.start() - width // 3)
+    end = min(len(body), start + width)
+    snippet = body[start:end]
+
+    parts = []
+    position = 0
+    for match in pattern.finditer(snippet):
+        parts.append(escape(snippet[position:match.start()]))
+        parts.append(Markup('<mark>%s</mark>') % match.group(0))
+        position = match.end()
+    parts.append(escape(snippet[position:]))
+
+    prefix = '…' if start > 0 else ''
+    suffix = '…' if end < len(body) else ''
+    return Markup(prefix) + Markup('').join(parts) + Markup(suffix)
@@ -0,0 +1,194 @@
+"""WebSocket listener that confirms donations as soon as the cluster does."""
+import asyncio
+import itertools
+import json
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+
+import websockets
+
+logger = logging.getLogger(__name__)
+
+
+class SignatureListener:
+    """
+    Multiplexes signatureSubscribe for every pending donation over one
+    Solana WebSocket connection.
+
+    Pending donations are picked up from the database every
+    refresh_interval seconds. When the cluster reports a signature, the
+    donation is confirmed (or failed) through donation_service, so the
+    usual claim prevents double crediting if a web worker got there
+    first. Donations older than max_age_minutes are left to the cron
+    sweeper.
+    """
+
+    def __init__(self, app, ws_url: str, commitment: str = 'confirmed',
+                 refresh_interval: float = 5, max_age_minutes: int = 60, workers: int = 4):
+        self.app = app
+        self.ws_url = ws_url
+        self.commitment = commitment
+        self.refresh_interval = refresh_interval
+        self.max_age_minutes = max_age_minutes
+
+        self.executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='signature-listener')
+
+        self._ids = itertools.count(1)
+        self._requests = {}       # request id -> signature
+        self._subscriptions = {}  # subscription id -> signature
+        self._watched = {}        # signature -> donation id
+        self._tasks = set()
+        self._stopping = False
+
+    # ----- database work (runs in executor threads) -----
+
+    def _in_app_context(self, fn, *args):
+        from app.extensions import db
+
+        with self.app.app_context():
+            try:
+                return fn(*args)
+            finally:
+                db.session.remove()
+
+    def _load_pending(self) -> dict:
+        """Get pending donations as {signature: donation id}."""
+        from app.extensions import db
+        from app.models import Donation
+
+        cutoff = datetime.utcnow() - timedelta(minutes=self.max_age_minutes)
+        rows = db.session.query(Donation.id, Donation.tx_signature).filter(
+            Donation.status == 'pending',
+            Donation.created_at >= cutoff
+        ).all()
+        return {row.tx_signature: row.id for row in rows}
+
+    def _settle(self, donation_id: int, err):
+        """Confirm or fail a donation the cluster has reported on."""
+        from app.services.donation_service import verify_pending_donation, fail_pending_donation
+
+        if err:
+            if fail_pending_donation(donation_id, 'Transaction failed'):
+                logger.info(f'Donation {donation_id} failed on chain')
+        elif verify_pending_donation(donation_id):
+            logger.info(f'Donation {donation_id} confirmed via subscription')
+
+    async def _run_db(self, fn, *args):
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.executor, self._in_app_context, fn, *args)
+
+    # ----- WebSocket protocol -----
+
+    async def _send(self, ws, method: str, params: list) -> int:
+        request_id = next(self._ids)
+        await ws.send(json.dumps({
+            "jsonrpc": "2.0",
+            "id": request_id,
+            "method": method,
+            "params": params
+        }))
+        return request_id
+
+    async def _subscribe(self, ws, signature: str, donation_id: int):
+        self._watched[signature] = donation_id
+        request_id = await self._send(ws, "signatureSubscribe", [
+            signature,
+            {"commitment": self.commitment}
+        ])
+        self._requests[request_id] = signature
+
+    async def _unsubscribe(self, ws, subscription_id: int):
+        signature = self._subscriptions.pop(subscription_id, None)
+        self._watched.pop(signature, None)
+        await self._send(ws, "signatureUnsubscribe", [subscription_id])
+
+    async def _refresh(self, ws):
+        """Subscribe new pending donations and drop ones settled elsewhere."""
+        pending = await self._run_db(self._load_pending)
+
+        for signature, donation_id in pending.items():
+            if signature not in self._watched:
+                await self._subscribe(ws, signature, donation_id)
+
+        for subscription_id, signature in list(self._subscriptions.items()):
+            if signature not in pending:
+                await self._unsubscribe(ws, subscription_id)
+
+    async def _refresh_loop(self, ws):
+        while True:
+            try:
+                await self._refresh(ws)
+            except websockets.ConnectionClosed:
+                raise
+            except Exception as e:
+                logger.error(f'Pending donation refresh error: {e}')
+            await asyncio.sleep(self.refresh_interval)
+
+    async def _handle(self, message: dict):
+        # Subscription acknowledgements
+        if 'id' in message and message['id'] in self._requests:
+            signature = self._requests.pop(message['id'])
+            if 'result' in message:
+                self._subscriptions[message['result']] = signature
+            else:
+                logger.warning(f'signatureSubscribe rejected for {signature}: {message.get("error")}')
+                self._watched.pop(signature, None)
+            return
+
+        if message.get('method') != 'signatureNotification':
+            return
+
+        params = message.get('params', {})
+        # signatureSubscribe is one-shot: the server drops it after notifying
+        signature = self._subscriptions.pop(params.get('subscription'), None)
+        donation_id = self._watched.pop(signature, None)
+        if donation_id is None:
+            return
+
+        value = params.get('result', {}).get('value') or {}
+        task = asyncio.create_task(self._run_db(self._settle, donation_id, value.get('err')))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _session(self, ws):
+        refresher = asyncio.create_task(self._refresh_loop(ws))
+        try:
+            async for raw in ws:
+                try:
+                    message = json.loads(raw)
+                except ValueError:
+                    continue
+                await self._handle(message)
+        finally:
+            refresher.cancel()
+
+    def _reset(self):
+        """Forget subscriptions; they don't survive a reconnect."""
+        self._requests.clear()
+        self._subscriptions.clear()
+        self._watched.clear()
+
+    async def run_async(self):
+        """Connect and listen, reconnecting with backoff until stopped."""
+        delay = 1
+        while not self._stopping:
+            try:
+                async with websockets.connect(self.ws_url, ping_interval=20) as ws:
+                    logger.info(f'Signature listener connected to {self.ws_url}')
+                    delay = 1
+                    await self._session(ws)
+            except (OSError, websockets.WebSocketException) as e:
+                logger.warning(f'Signature listener connection error: {e}')
+
+            self._reset()
+            if not self._stopping:
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, 60)
+
+    def run(self):
+        """Run the listener until interrupted."""
+        asyncio.run(self.run_async())
+
+    def stop(self):
+        self._stopping = True
@@ -0,0 +1,175 @@
+"""Ed25519 signature verification for wallet login."""
+import base64
+import binascii
+import string
+import threading
+from collections import OrderedDict
+from typing import Iterable, Optional
+
+import base58
+from flask import current_app
+from nacl.exceptions import BadSignatureError
+from nacl.signing import VerifyKey
+
+from app.utils.singleton import process_singleton
+
+PUBLIC_KEY_LENGTH = 32
+SIGNATURE_LENGTH = 64
+
+_BASE58_CHARS = frozenset(base58.alphabet.decode())
+_BASE64_CHARS = frozenset(string.ascii_letters + string.digits + '+/-_=')
+_HEX_CHARS = frozenset(string.hexdigits)
+
+
+def _decode_base64(signature: str) -> Optional[bytes]:
+    padded = signature.rstrip('=').replace('-', '+').replace('_', '/')
+    padded += '=' * (-len(padded) % 4)
+    try:
+        decoded = base64.b64decode(padded, validate=True)
+    except binascii.Error:
+        return None
+    return decoded if len(decoded) == SIGNATURE_LENGTH else None
+
+
+def decode_signature(signature: str) -> Optional[bytes]:
+    """
+    Decode a 64-byte signature sent as hex, base58 or base64.
+
+    The encoding is picked from the length and alphabet instead of
+    trying decoders until one doesn't raise: hex is exactly 128 hex
+    digits, base58 of 64 bytes is at most 88 characters from its
+    alphabet, anything else is treated as (possibly URL-safe or
+    unpadded) base64.
+
+    Returns the signature bytes, or None if it is not a valid signature.
+    """
+    if not signature or len(signature) > 2 * SIGNATURE_LENGTH:
+        return None
+
+    if signature.endswith('=='):
+        # Standard padded base64, the most common wallet encoding
+        return _decode_base64(signature)
+
+    chars = set(signature)
+
+    if len(signature) == 2 * SIGNATURE_LENGTH and chars <= _HEX_CHARS:
+        return bytes.fromhex(signature)
+
+    if len(signature) <= 88 and chars <= _BASE58_CHARS:
+        decoded = base58.b58decode(signature)
+        # Unpadded base64 can happen to use only base58 characters; a
+        # valid Ed25519 signature has the top 3 bits of S clear
+        if len(decoded) == SIGNATURE_LENGTH and not decoded[-1] & 0xE0:
+            return decoded
+
+    if not chars <= _BASE64_CHARS:
+        return None
+
+    return _decode_base64(signature)
+
+
+def decode_public_key(wallet_address: str) -> Optional[bytes]:
+    """Decode a base58 wallet address, or None if it is not a 32-byte key."""
+    if not wallet_address or len(wallet_address) > 44 or not set(wallet_address) <= _BASE58_CHARS:
+        return None
+    decoded = base58.b58decode(wallet_address)
+    return decoded if len(decoded) == PUBLIC_KEY_LENGTH else None
+
+
+class SignatureVerifier:
+    """
+    Verifies wallet signatures, keeping decoded VerifyKeys in an LRU.
+
+    Decoding the address and building the VerifyKey is repeated work
+    for every login attempt from the same wallet (retries, several
+    tabs, reconnects), so keys are cached by address. Invalid
+    addresses are never cached.
+    """
+
+    def __init__(self, max_keys: int = 4096):
+        self.max_keys = max_keys
+
+        self._keys = OrderedDict()  # wallet address -> VerifyKey
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.misses = 0
+
+    def get_verify_key(self, wallet_address: str) -> Optional[VerifyKey]:
+        """Get the cached VerifyKey for an address, decoding it on a miss."""
+        with self._lock:
+            key = self._keys.get(wallet_address)
+            if key is not None:
+                self._keys.move_to_end(wallet_address)
+                self.hits += 1
+                return key
+            self.misses += 1
+
+        public_key = decode_public_key(wallet_address)
+        if public_key is None:
+            return None
+        key = VerifyKey(public_key)
+
+        with self._lock:
+            self._keys[wallet_address] = key
+            self._keys.move_to_end(wallet_address)
+            while len(self._keys) > self.max_keys:
+                self._keys.popitem(last=False)
+        return key
+
+    def verify(self, wallet_address: str, message: str, signature: str) -> bool:
+        """
+        Check that signature is the wallet's signature of message.
+
+        Args:
+            wallet_address: The Solana public key (base58)
+            message: The message that was signed
+            signature: The signature (hex, base58 or base64)
+        """
+        key = self.get_verify_key(wallet_address)
+        if key is None:
+            return False
+
+        signature_bytes = decode_signature(signature)
+        if signature_bytes is None:
+            return False
+
+        try:
+            key.verify(message.encode('utf-8'), signature_bytes)
+        except BadSignatureError:
+            return False
+        return True
+
+    def verify_many(self, items: Iterable[tuple]) -> list:
+        """
+        Verify several signatures.
+
+        Args:
+            items: (wallet_address, message, signature) tuples
+
+        Returns list of booleans in the same order.
+        """
+        return [self.verify(wallet, message, signature) for wallet, message, signature in items]
+
+    def clear(self):
+        """Drop all cached keys."""
+        with self._lock:
+            self._keys.clear()
+
+    def stats(self) -> dict:
+        """Get cache counters for monitoring."""
+        with self._lock:
+            return {
+                'keys': len(self._keys),
+                'max_keys': self.max_keys,
+                'hits': self.hits,
+                'misses': self.misses
+            }
+
+
+@process_singleton
+def get_signature_verifier() -> SignatureVerifier:
+    """Get the process-wide signature verifier."""
+    return SignatureVerifier(
+        max_keys=current_app.config.get('WALLET_KEY_CACHE_SIZE', 4096)
+    )
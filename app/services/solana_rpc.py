@@ -0,0 +1,333 @@
+"""Pooled Solana JSON-RPC client with multi-endpoint failover."""
+import itertools
+import statistics
+import threading
+import time
+from collections import deque
+from typing import Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+from flask import current_app
+
+
+class RpcUnavailableError(Exception):
+    """Raised when no RPC endpoint could answer a request."""
+
+
+class RpcEndpoint:
+    """
+    Health tracking for a single RPC endpoint.
+
+    Keeps a rolling window of latencies and outcomes. An endpoint that
+    keeps failing or gets rate limited is ejected for a cooldown that
+    doubles on every ejection, and is re-admitted on its next success.
+    """
+
+    def __init__(self, url: str, window: int = 100, eject_after: int = 3,
+                 base_cooldown: float = 5.0, max_cooldown: float = 300.0):
+        self.url = url
+        self.eject_after = eject_after
+        self.base_cooldown = base_cooldown
+        self.max_cooldown = max_cooldown
+
+        self.latencies = deque(maxlen=window)
+        self.outcomes = deque(maxlen=window)  # True = success
+        self.rate_limited = 0
+        self.consecutive_failures = 0
+        self.ejections = 0
+        self.ejected_until = 0.0
+
+        self._lock = threading.Lock()
+
+    def is_available(self, now: float = None) -> bool:
+        """Check if endpoint may receive traffic."""
+        return (now or time.monotonic()) >= self.ejected_until
+
+    def percentile(self, pct: float) -> Optional[float]:
+        """Get a latency percentile in ms over the rolling window."""
+        with self._lock:
+            samples = sorted(self.latencies)
+        if not samples:
+            return None
+        index = min(len(samples) - 1, int(len(samples) * pct / 100))
+        return samples[index]
+
+    @property
+    def error_rate(self) -> float:
+        with self._lock:
+            if not self.outcomes:
+                return 0.0
+            return 1 - sum(self.outcomes) / len(self.outcomes)
+
+    @property
+    def is_measured(self) -> bool:
+        with self._lock:
+            return bool(self.latencies)
+
+    def score(self, neutral: float = 0.0) -> float:
+        """
+        Routing score, lower is better.
+
+        An endpoint without latency samples is scored as neutral (the
+        median of the measured endpoints) rather than best, so a new or
+        only-failing endpoint doesn't take all traffic until it answers.
+        """
+        p50 = self.percentile(50)
+        if p50 is None:
+            p50 = neutral
+        return p50 * (1 + 4 * self.error_rate)
+
+    def record_success(self, elapsed_ms: float):
+        with self._lock:
+            self.latencies.append(elapsed_ms)
+            self.outcomes.append(True)
+            self.consecutive_failures = 0
+            if self.ejections and time.monotonic() >= self.ejected_until:
+                # Re-admitted and healthy again
+                self.ejections = 0
+
+    def record_failure(self, rate_limited: bool = False, retry_after: float = None):
+        with self._lock:
+            self.outcomes.append(False)
+            self.consecutive_failures += 1
+            if rate_limited:
+                self.rate_limited += 1
+
+            if rate_limited or self.consecutive_failures >= self.eject_after:
+                self.ejections += 1
+                cooldown = min(
+                    self.base_cooldown * (2 ** (self.ejections - 1)),
+                    self.max_cooldown
+                )
+                if retry_after:
+                    cooldown = max(cooldown, retry_after)
+                self.ejected_until = time.monotonic() + cooldown
+                self.consecutive_failures = 0
+
+    def health(self) -> dict:
+        """Get health summary for monitoring."""
+        p50 = self.percentile(50)
+        p99 = self.percentile(99)
+        return {
+            'url': self.url,
+            'available': self.is_available(),
+            'p50_ms': round(p50, 2) if p50 is not None else None,
+            'p99_ms': round(p99, 2) if p99 is not None else None,
+            'error_rate': round(self.error_rate, 3),
+            'rate_limited': self.rate_limited,
+            'ejections': self.ejections
+        }
+
+
+class SolanaRpcClient:
+    """
+    JSON-RPC client with a keep-alive connection pool.
+
+    One instance is shared per process (see get_client), so TLS
+    handshakes are paid once instead of on every call. Each call is
+    routed to the fastest healthy endpoint and fails over to the next
+    one on connection errors, 5xx responses or rate limiting.
+    """
+
+    def __init__(self, rpc_urls, timeout: int = 30, pool_size: int = 10,
+                 eject_after: int = 3, cooldown: float = 5.0):
+        if isinstance(rpc_urls, str):
+            rpc_urls = [rpc_urls]
+        if not rpc_urls:
+            raise ValueError("At least one RPC URL is required")
+
+        self.endpoints = [
+            RpcEndpoint(url, eject_after=eject_after, base_cooldown=cooldown)
+            for url in rpc_urls
+        ]
+        self.timeout = timeout
+
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=len(self.endpoints), pool_maxsize=pool_size)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        self.session.headers.update({'Content-Type': 'application/json'})
+
+        self._ids = itertools.count(1)
+        self._stats = {}
+        self._stats_lock = threading.Lock()
+
+    @property
+    def rpc_url(self) -> str:
+        """URL of the endpoint currently preferred by routing."""
+        return self._route()[0].url
+
+    def _next_id(self) -> int:
+        return next(self._ids)
+
+    def _record(self, method: str, elapsed_ms: float, error: bool = False):
+        """Record latency for a method."""
+        with self._stats_lock:
+            stats = self._stats.setdefault(method, {
+                'count': 0,
+                'errors': 0,
+                'total_ms': 0.0,
+                'max_ms': 0.0
+            })
+            stats['count'] += 1
+            stats['total_ms'] += elapsed_ms
+            stats['max_ms'] = max(stats['max_ms'], elapsed_ms)
+            if error:
+                stats['errors'] += 1
+
+    def _route(self) -> list:
+        """Order endpoints for a call: healthy by score, then ejected by expiry."""
+        now = time.monotonic()
+        healthy = [e for e in self.endpoints if e.is_available(now)]
+        ejected = [e for e in self.endpoints if not e.is_available(now)]
+        measured = [e.score() for e in healthy if e.is_measured]
+        neutral = statistics.median(measured) if measured else 0.0
+        # On a tie the unmeasured endpoint goes first, so it gets sampled
+        healthy.sort(key=lambda e: (e.score(neutral), e.is_measured))
+        ejected.sort(key=lambda e: e.ejected_until)
+        return healthy + ejected
+
+    def _post(self, payload):
+        """POST a payload, failing over across endpoints."""
+        last_error = None
+
+        for endpoint in self._route():
+            start = time.perf_counter()
+            try:
+                response = self.session.post(endpoint.url, json=payload, timeout=self.timeout)
+            except requests.RequestException as e:
+                endpoint.record_failure()
+                last_error = e
+                continue
+
+            if response.status_code == 429:
+                retry_after = response.headers.get('Retry-After')
+                endpoint.record_failure(
+                    rate_limited=True,
+                    retry_after=float(retry_after) if retry_after and retry_after.isdigit() else None
+                )
+                last_error = requests.HTTPError(f"429 rate limited by {endpoint.url}")
+                continue
+
+            if response.status_code >= 500:
+                endpoint.record_failure()
+                last_error = requests.HTTPError(f"{response.status_code} from {endpoint.url}")
+                continue
+
+            try:
+                response.raise_for_status()
+                result = response.json()
+            except (requests.RequestException, ValueError) as e:
+                # Client errors won't be fixed by another endpoint
+                endpoint.record_failure()
+                raise RpcUnavailableError(str(e))
+
+            endpoint.record_success((time.perf_counter() - start) * 1000)
+            return result
+
+        raise RpcUnavailableError(str(last_error))
+
+    def request(self, method: str, params: list = None) -> Optional[dict]:
+        """Make a single JSON-RPC request. Returns the response or None."""
+        payload = {
+            "jsonrpc": "2.0",
+            "id": self._next_id(),
+            "method": method,
+            "params": params or []
+        }
+
+        start = time.perf_counter()
+        try:
+            result = self._post(payload)
+        except RpcUnavailableError as e:
+            self._record(method, (time.perf_counter() - start) * 1000, error=True)
+            current_app.logger.error(f"Solana RPC error: {e}")
+            return None
+
+        self._record(method, (time.perf_counter() - start) * 1000, error='error' in result)
+        return result
+
+    def batch(self, calls: list) -> list:
+        """
+        Send several calls in one HTTP round trip.
+
+        Args:
+            calls: List of (method, params) tuples
+
+        Returns:
+            List of responses in the same order as calls (None on failure)
+        """
+        if not calls:
+            return []
+
+        payload = []
+        for method, params in calls:
+            payload.append({
+                "jsonrpc": "2.0",
+                "id": self._next_id(),
+                "method": method,
+                "params": params or []
+            })
+
+        label = f"batch:{calls[0][0]}"
+        start = time.perf_counter()
+        try:
+            result = self._post(payload)
+        except RpcUnavailableError as e:
+            self._record(label, (time.perf_counter() - start) * 1000, error=True)
+            current_app.logger.error(f"Solana RPC batch error: {e}")
+            return [None] * len(calls)
+
+        self._record(label, (time.perf_counter() - start) * 1000)
+
+        # Servers may answer a batch with a single error object
+        if not isinstance(result, list):
+            current_app.logger.error(f"Solana RPC batch rejected: {result}")
+            return [None] * len(calls)
+
+        # Responses may come back in any order
+        by_id = {item.get('id'): item for item in result if isinstance(item, dict)}
+        return [by_id.get(item['id']) for item in payload]
+
+    def stats(self) -> dict:
+        """Get per-method call counts and latency."""
+        with self._stats_lock:
+            return {
+                method: {
+                    'count': s['count'],
+                    'errors': s['errors'],
+                    'avg_ms': round(s['total_ms'] / s['count'], 2) if s['count'] else 0,
+                    'max_ms': round(s['max_ms'], 2)
+                }
+                for method, s in self._stats.items()
+            }
+
+    def health(self) -> list:
+        """Get health of every endpoint."""
+        return [endpoint.health() for endpoint in self.endpoints]
+
+
+# Clients keyed by RPC URL list, created lazily after gunicorn forks
+_clients = {}
+_clients_lock = threading.Lock()
+
+
+def get_client(rpc_urls) -> SolanaRpcClient:
+    """Get the process-wide client for a list of RPC URLs."""
+    key = (rpc_urls,) if isinstance(rpc_urls, str) else tuple(rpc_urls)
+
+    client = _clients.get(key)
+    if client is None:
+        with _clients_lock:
+            client = _clients.get(key)
+            if client is None:
+                client = SolanaRpcClient(
+                    list(key),
+                    timeout=current_app.config.get('SOLANA_RPC_TIMEOUT', 30),
+                    pool_size=current_app.config.get('SOLANA_RPC_POOL_SIZE', 10),
+                    eject_after=current_app.config.get('SOLANA_RPC_EJECT_AFTER', 3),
+                    cooldown=current_app.config.get('SOLANA_RPC_EJECT_COOLDOWN', 5)
+                )
+                _clients[key] = client
+    return client
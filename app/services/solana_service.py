@@ -1,14 +1,18 @@
 """Solana blockchain service."""
 import base64
-import json
+import random
+import time
 from decimal import Decimal
 from typing import Optional
 
-import requests
 from flask import current_app
-from nacl.signing import VerifyKey
-from nacl.exceptions import BadSignatureError
-import base58
+
+from app.services.solana_rpc import get_client
+from app.services.tx_cache import get_tx_cache
+from app.services.priority_fees import get_compute_unit_price
+from app.services.tx_parser import find_transfers
+from app.services.signature_verifier import get_signature_verifier
+from app.utils.money import sol_to_lamports, lamports_to_sol
 
 
 def get_rpc_url():
@@ -18,29 +22,63 @@ def get_rpc_url():
     return current_app.config.get('SOLANA_RPC_URL', 'https://api.mainnet-beta.solana.com')
 
 
+def get_ws_url() -> str:
+    """
+    Get the WebSocket URL for subscriptions.
+
+    Defaults to the RPC URL with a ws(s) scheme; a local validator
+    serves WebSockets on the RPC port + 1.
+    """
+    if current_app.config.get('USE_DEVNET'):
+        ws_url = current_app.config.get('SOLANA_DEVNET_WS_URL', '')
+    else:
+        ws_url = current_app.config.get('SOLANA_WS_URL', '')
+    if ws_url:
+        return ws_url
+
+    rpc_url = get_rpc_url()
+    if rpc_url.startswith('https://'):
+        return 'wss://' + rpc_url[len('https://'):]
+    ws_url = 'ws://' + rpc_url[len('http://'):] if rpc_url.startswith('http://') else rpc_url
+    return ws_url.replace(':8899', ':8900')
+
+
+def get_rpc_urls() -> list:
+    """Get the primary RPC URL followed by configured fallbacks."""
+    if current_app.config.get('USE_DEVNET'):
+        fallbacks = current_app.config.get('SOLANA_DEVNET_RPC_FALLBACK_URLS', '')
+    else:
+        fallbacks = current_app.config.get('SOLANA_RPC_FALLBACK_URLS', '')
+
+    urls = [get_rpc_url()]
+    for url in fallbacks.split(','):
+        url = url.strip()
+        if url and url not in urls:
+            urls.append(url)
+    return urls
+
+
+def get_rpc_client():
+    """Get the pooled RPC client for the configured network."""
+    return get_client(get_rpc_urls())
+
+
 def rpc_request(method: str, params: list = None):
     """Make a JSON-RPC request to Solana."""
-    rpc_url = get_rpc_url()
+    return get_rpc_client().request(method, params)
 
-    payload = {
-        "jsonrpc": "2.0",
-        "id": 1,
-        "method": method,
-        "params": params or []
-    }
 
-    try:
-        response = requests.post(
-            rpc_url,
-            json=payload,
-            headers={'Content-Type': 'application/json'},
-            timeout=30
-        )
-        response.raise_for_status()
-        return response.json()
-    except requests.RequestException as e:
-        current_app.logger.error(f"Solana RPC error: {e}")
-        return None
+def rpc_batch(calls: list) -> list:
+    """
+    Make several JSON-RPC requests to Solana in one round trip.
+
+    Args:
+        calls: List of (method, params) tuples
+
+    Returns:
+        List of responses in call order (None for failed calls)
+    """
+    return get_rpc_client().batch(calls)
 
 
 def verify_wallet_signature(wallet_address: str, message: str, signature: str) -> bool:
@@ -50,122 +88,433 @@ def verify_wallet_signature(wallet_address: str, message: str, signature: str) -
     Args:
         wallet_address: The Solana public key (base58)
         message: The message that was signed
-        signature: The signature (base58 or base64)
+        signature: The signature (base58, base64 or hex)
     """
     try:
-        # Decode public key
-        public_key_bytes = base58.b58decode(wallet_address)
+        return get_signature_verifier().verify(wallet_address, message, signature)
+    except Exception as e:
+        current_app.logger.error(f"Signature verification error: {e}")
+        return False
 
-        # Decode signature (try base58 first, then base64)
-        try:
-            signature_bytes = base58.b58decode(signature)
-        except Exception:
-            try:
-                signature_bytes = base64.b64decode(signature)
-            except Exception:
-                return False
 
-        # Message bytes
-        message_bytes = message.encode('utf-8')
+# Commitment levels in increasing order of finality
+COMMITMENT_LEVELS = {'processed': 0, 'confirmed': 1, 'finalized': 2}
 
-        # Verify using Ed25519
-        verify_key = VerifyKey(public_key_bytes)
-        verify_key.verify(message_bytes, signature_bytes)
 
-        return True
+def wait_for_signature(
+    tx_signature: str,
+    commitment: str = None,
+    timeout: float = None
+) -> Optional[dict]:
+    """
+    Poll getSignatureStatuses until a signature reaches a commitment level.
 
-    except BadSignatureError:
-        return False
-    except Exception as e:
-        current_app.logger.error(f"Signature verification error: {e}")
-        return False
+    Uses exponential backoff with jitter between polls. The first poll
+    searches transaction history so older signatures are found too.
+
+    Returns the status value once reached (check its 'err'), or None if
+    the deadline passed first.
+    """
+    commitment = commitment or current_app.config.get('SOLANA_VERIFY_COMMITMENT', 'confirmed')
+    timeout = timeout if timeout is not None else current_app.config.get('SOLANA_VERIFY_TIMEOUT', 20)
+    delay = current_app.config.get('SOLANA_VERIFY_INITIAL_DELAY', 0.5)
+    max_delay = current_app.config.get('SOLANA_VERIFY_MAX_DELAY', 4)
+    target = COMMITMENT_LEVELS.get(commitment, COMMITMENT_LEVELS['confirmed'])
+
+    deadline = time.monotonic() + timeout
+    search_history = True
+
+    while True:
+        value = get_signature_statuses([tx_signature], search_history=search_history).get(tx_signature)
+        search_history = False
+
+        if value:
+            if value.get('err'):
+                return value
+            level = COMMITMENT_LEVELS.get(value.get('confirmationStatus'), -1)
+            if level >= target:
+                return value
+
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return None
+
+        time.sleep(min(delay * random.uniform(0.5, 1.5), remaining))
+        delay = min(delay * 2, max_delay)
+
+
+def get_parsed_transaction(tx_signature: str, commitment: str = 'confirmed') -> Optional[dict]:
+    """
+    Fetch a transaction with jsonParsed encoding.
+
+    Finalized transactions are served from the transaction cache.
+    """
+    cache = get_tx_cache()
+    tx = cache.get(tx_signature)
+    if tx is not None:
+        return tx
+
+    # getTransaction does not support 'processed'
+    if commitment == 'processed':
+        commitment = 'confirmed'
+
+    result = rpc_request("getTransaction", [
+        tx_signature,
+        {
+            "encoding": "jsonParsed",
+            "maxSupportedTransactionVersion": 0,
+            "commitment": commitment
+        }
+    ])
+
+    if not result or result.get('result') is None:
+        return None
+
+    tx = result['result']
+    if commitment == 'finalized':
+        cache.put(tx_signature, tx)
+    return tx
+
+
+def get_parsed_transactions(signatures: list, commitment: str = 'finalized') -> dict:
+    """
+    Fetch many transactions with jsonParsed encoding using batch requests.
+
+    Returns dict mapping signature to transaction (None if not found).
+    """
+    cache = get_tx_cache()
+    transactions = {}
+    missing = []
+
+    for signature in signatures:
+        tx = cache.get(signature)
+        if tx is not None:
+            transactions[signature] = tx
+        else:
+            missing.append(signature)
+
+    batch_size = current_app.config.get('SOLANA_RPC_BATCH_SIZE', 10)
+    options = {
+        "encoding": "jsonParsed",
+        "maxSupportedTransactionVersion": 0,
+        "commitment": commitment
+    }
+
+    for i in range(0, len(missing), batch_size):
+        chunk = missing[i:i + batch_size]
+        results = rpc_batch([("getTransaction", [signature, options]) for signature in chunk])
+        for signature, result in zip(chunk, results):
+            tx = result.get('result') if result else None
+            transactions[signature] = tx
+            if tx is not None and commitment == 'finalized':
+                cache.put(signature, tx)
+
+    return transactions
+
+
+def get_signatures_for_address(
+    address: str,
+    until: str = None,
+    before: str = None,
+    limit: int = 1000
+) -> Optional[list]:
+    """
+    Get confirmed signatures for an address, newest first.
+
+    Returns None if the RPC call failed.
+    """
+    options = {"limit": limit, "commitment": "finalized"}
+    if until:
+        options["until"] = until
+    if before:
+        options["before"] = before
+
+    result = rpc_request("getSignaturesForAddress", [address, options])
+    if result and 'result' in result:
+        return result['result']
+    return None
 
 
 def verify_transaction(
     tx_signature: str,
     expected_recipient: str,
-    expected_amount_sol: Decimal,
-    expected_sender: str
+    expected_lamports: int,
+    expected_sender: str,
+    commitment: str = None,
+    timeout: float = None
 ) -> dict:
     """
     Verify a transaction on the Solana blockchain.
 
+    Waits for the signature to reach the commitment level using cheap
+    status polls, then fetches the parsed transaction once.
+
     Returns dict with 'success' boolean and optional 'error' message.
+    'retryable' is set when the transaction may still verify later (not
+    landed yet, RPC trouble) rather than being definitely wrong.
     """
-    import time
+    commitment = commitment or current_app.config.get('SOLANA_VERIFY_COMMITMENT', 'confirmed')
 
-    # Retry logic - transaction may not be immediately visible
-    max_retries = 10
-    retry_delay = 2  # seconds
+    # Retries and re-verification of a finalized transaction skip the RPC entirely
+    tx = get_tx_cache().get(tx_signature)
 
-    tx = None
-    for attempt in range(max_retries):
-        # Get transaction details
-        result = rpc_request("getTransaction", [
-            tx_signature,
-            {
-                "encoding": "jsonParsed",
-                "maxSupportedTransactionVersion": 0
-            }
-        ])
+    if tx is None:
+        status = wait_for_signature(tx_signature, commitment=commitment, timeout=timeout)
+        if status is None:
+            return {'success': False, 'error': 'Transaction not found or not confirmed after retries', 'retryable': True}
+        if status.get('err'):
+            return {'success': False, 'error': 'Transaction failed'}
 
-        if result and 'result' in result and result['result'] is not None:
-            tx = result['result']
-            break
+        # The node answering may lag slightly behind the one that reported status
+        tx = get_parsed_transaction(tx_signature, commitment)
+        if tx is None:
+            time.sleep(1)
+            tx = get_parsed_transaction(tx_signature, commitment)
 
-        # Transaction not found yet, wait and retry
-        if attempt < max_retries - 1:
-            current_app.logger.info(f"Transaction {tx_signature} not found, retry {attempt + 1}/{max_retries}")
-            time.sleep(retry_delay)
+        if tx is None:
+            return {'success': False, 'error': 'Transaction not found or not confirmed after retries', 'retryable': True}
 
-    if tx is None:
-        return {'success': False, 'error': 'Transaction not found or not confirmed after retries'}
+        if status.get('confirmationStatus') == 'finalized':
+            get_tx_cache().put(tx_signature, tx)
 
     # Check if transaction was successful
     meta = tx.get('meta', {})
     if meta.get('err') is not None:
         return {'success': False, 'error': 'Transaction failed'}
 
-    # Parse transaction for SOL transfer
+    # Look for a matching system transfer, top-level or inner
     try:
-        message = tx.get('transaction', {}).get('message', {})
-        instructions = message.get('instructions', [])
+        matches = find_transfers(
+            tx,
+            destination=expected_recipient,
+            source=expected_sender,
+            lamports=expected_lamports
+        )
+        if matches:
+            return {'success': True}
 
-        # Look for system program transfer
-        for instruction in instructions:
-            program = instruction.get('program')
-            parsed = instruction.get('parsed', {})
+        return {'success': False, 'error': 'Transfer not found in transaction'}
 
-            if program == 'system' and parsed.get('type') == 'transfer':
-                info = parsed.get('info', {})
+    except Exception as e:
+        # The same transaction would fail to parse again, so don't retry
+        current_app.logger.error(f"Transaction parsing error: {e}")
+        return {'success': False, 'error': 'Transaction processing error'}
 
-                source = info.get('source', '')
-                destination = info.get('destination', '')
-                lamports = info.get('lamports', 0)
 
-                # Convert lamports to SOL
-                amount_sol = Decimal(str(lamports)) / Decimal('1000000000')
+# Maximum serialized transaction size accepted by the cluster
+MAX_TRANSACTION_SIZE = 1232
 
-                # Verify sender
-                if source != expected_sender:
-                    continue
 
-                # Verify recipient
-                if destination != expected_recipient:
-                    continue
+def get_latest_blockhash(commitment: str = 'finalized') -> Optional[dict]:
+    """
+    Get a recent blockhash.
 
-                # Verify amount (allow small tolerance for rounding)
-                tolerance = Decimal('0.000001')
-                if abs(amount_sol - expected_amount_sol) > tolerance:
-                    continue
+    Returns dict with 'blockhash' and 'last_valid_block_height', or None.
+    """
+    result = rpc_request("getLatestBlockhash", [{"commitment": commitment}])
+    if not result or 'result' not in result:
+        return None
 
-                return {'success': True}
+    value = result['result']['value']
+    return {
+        'blockhash': value['blockhash'],
+        'last_valid_block_height': value['lastValidBlockHeight']
+    }
 
-        return {'success': False, 'error': 'Transfer not found in transaction'}
 
-    except Exception as e:
-        current_app.logger.error(f"Transaction parsing error: {e}")
-        return {'success': False, 'error': 'Transaction processing error'}
+def get_block_height(commitment: str = 'confirmed') -> Optional[int]:
+    """Get the current block height."""
+    result = rpc_request("getBlockHeight", [{"commitment": commitment}])
+    if result and 'result' in result:
+        return result['result']
+    return None
+
+
+def is_blockhash_expired(last_valid_block_height: int) -> Optional[bool]:
+    """
+    Check if a transaction signed against a blockhash can no longer land.
+
+    Returns None if the block height is unavailable.
+    """
+    height = get_block_height()
+    if height is None:
+        return None
+    return height > last_valid_block_height
+
+
+def get_recent_prioritization_fees(accounts: list = None) -> Optional[list]:
+    """
+    Get per-slot minimum prioritization fees for recent slots.
+
+    Returns list of {'slot', 'prioritizationFee'} dicts, or None.
+    """
+    params = [accounts] if accounts else []
+    result = rpc_request("getRecentPrioritizationFees", params)
+    if result and 'result' in result:
+        return result['result']
+    return None
+
+
+# Compute units consumed per system transfer and by the two compute
+# budget instructions themselves
+TRANSFER_COMPUTE_UNITS = 150
+COMPUTE_BUDGET_COMPUTE_UNITS = 300
+
+
+def build_transfer_transaction(sender_keypair, transfers: list, blockhash: str,
+                               compute_unit_price: int = None):
+    """
+    Build and sign a transaction with one system transfer per recipient.
+
+    Args:
+        sender_keypair: solders Keypair paying for and signing the transfers
+        transfers: List of (recipient address, lamports) tuples
+        blockhash: Recent blockhash (base58)
+        compute_unit_price: Priority fee in micro-lamports per compute
+            unit. When given, compute unit limit and price instructions
+            are prepended, with the limit sized to the transfers.
+    """
+    from solders.pubkey import Pubkey
+    from solders.system_program import TransferParams, transfer
+    from solders.compute_budget import set_compute_unit_limit, set_compute_unit_price
+    from solders.transaction import Transaction
+    from solders.message import Message
+    from solders.hash import Hash
+
+    instructions = []
+    if compute_unit_price is not None:
+        instructions.append(set_compute_unit_limit(
+            COMPUTE_BUDGET_COMPUTE_UNITS + TRANSFER_COMPUTE_UNITS * len(transfers)
+        ))
+        instructions.append(set_compute_unit_price(compute_unit_price))
+
+    instructions.extend(
+        transfer(TransferParams(
+            from_pubkey=sender_keypair.pubkey(),
+            to_pubkey=Pubkey.from_string(recipient),
+            lamports=lamports
+        ))
+        for recipient, lamports in transfers
+    )
+
+    recent_blockhash = Hash.from_string(blockhash)
+    msg = Message.new_with_blockhash(instructions, sender_keypair.pubkey(), recent_blockhash)
+
+    tx = Transaction.new_unsigned(msg)
+    tx.sign([sender_keypair], recent_blockhash)
+    return tx
+
+
+def pack_transfers(sender_keypair, transfers: list, blockhash: str,
+                   compute_unit_price: int = None) -> list:
+    """
+    Split transfers into groups that each fit in one transaction.
+
+    Returns list of (transfers, signed transaction) tuples.
+    """
+    packed = []
+    group = []
+    group_tx = None
+
+    for item in transfers:
+        candidate = group + [item]
+        tx = build_transfer_transaction(sender_keypair, candidate, blockhash, compute_unit_price)
+
+        if len(bytes(tx)) > MAX_TRANSACTION_SIZE and group:
+            packed.append((group, group_tx))
+            group = [item]
+            group_tx = build_transfer_transaction(sender_keypair, group, blockhash, compute_unit_price)
+        else:
+            group = candidate
+            group_tx = tx
+
+    if group:
+        packed.append((group, group_tx))
+
+    return packed
+
+
+def send_transaction(tx) -> dict:
+    """
+    Submit a signed transaction.
+
+    Returns dict with 'success', 'signature' or 'error'.
+    """
+    return send_raw_transaction(base64.b64encode(bytes(tx)).decode('utf-8'))
+
+
+def send_raw_transaction(tx_base64: str) -> dict:
+    """
+    Submit a serialized, signed transaction (base64).
+
+    Returns dict with 'success', 'signature' or 'error'. 'rejected' is
+    set when the node refused the transaction, as opposed to no answer
+    at all, in which case it may still have been forwarded.
+    """
+    send_result = rpc_request("sendTransaction", [
+        tx_base64,
+        {"encoding": "base64", "preflightCommitment": "confirmed"}
+    ])
+
+    if send_result and 'result' in send_result:
+        return {
+            'success': True,
+            'signature': send_result['result']
+        }
+    elif send_result and 'error' in send_result:
+        return {
+            'success': False,
+            'rejected': True,
+            'error': send_result['error'].get('message', 'Unknown error')
+        }
+    else:
+        return {'success': False, 'error': 'Failed to send transaction'}
+
+
+def _is_blockhash_error(error: str) -> bool:
+    error = (error or '').lower()
+    return 'blockhash not found' in error or 'block height exceeded' in error
+
+
+def sign_and_send(build, max_attempts: int = 3, on_signed=None) -> dict:
+    """
+    Build a transaction against the cached blockhash and submit it.
+
+    If the cluster rejects the blockhash as expired, the cache is
+    invalidated and the transaction rebuilt on a fresh one.
+
+    Args:
+        build: Callable taking a blockhash and returning a signed transaction
+        max_attempts: Attempts before giving up on blockhash errors
+        on_signed: Optional callable(tx, latest) run before each broadcast,
+            e.g. to persist the signed transaction
+
+    Returns dict with 'success', 'signature' or 'error', plus the
+    'blockhash' and 'last_valid_block_height' used.
+    """
+    from app.services.blockhash_cache import get_blockhash_cache
+
+    cache = get_blockhash_cache()
+    result = {'success': False, 'error': 'Failed to get blockhash'}
+
+    for _ in range(max_attempts):
+        latest = cache.get()
+        if not latest:
+            return {'success': False, 'error': 'Failed to get blockhash'}
+
+        tx = build(latest['blockhash'])
+        if on_signed:
+            on_signed(tx, latest)
+
+        result = send_transaction(tx)
+        result.update(latest)
+        if result['success'] or not _is_blockhash_error(result.get('error')):
+            return result
+
+        current_app.logger.warning(f"Blockhash {latest['blockhash']} expired, rebuilding")
+        cache.invalidate(latest['blockhash'])
+
+    return result
 
 
 def send_sol(
@@ -181,71 +530,16 @@ def send_sol(
     """
     try:
         from solders.keypair import Keypair
-        from solders.pubkey import Pubkey
-        from solders.system_program import TransferParams, transfer
-        from solders.transaction import Transaction
-        from solders.message import Message
 
         # Decode sender keypair
         sender_keypair = Keypair.from_base58_string(sender_secret)
+        transfers = [(recipient, sol_to_lamports(amount_sol))]
+        price = get_compute_unit_price()
 
-        # Get recipient pubkey
-        recipient_pubkey = Pubkey.from_string(recipient)
-
-        # Convert SOL to lamports
-        lamports = int(amount_sol * Decimal('1000000000'))
-
-        # Get recent blockhash
-        blockhash_result = rpc_request("getLatestBlockhash", [{"commitment": "finalized"}])
-        if not blockhash_result or 'result' not in blockhash_result:
-            return {'success': False, 'error': 'Failed to get blockhash'}
-
-        blockhash = blockhash_result['result']['value']['blockhash']
-
-        # Create transfer instruction
-        transfer_ix = transfer(
-            TransferParams(
-                from_pubkey=sender_keypair.pubkey(),
-                to_pubkey=recipient_pubkey,
-                lamports=lamports
-            )
-        )
-
-        # Create and sign transaction
-        from solders.hash import Hash
-        recent_blockhash = Hash.from_string(blockhash)
-
-        msg = Message.new_with_blockhash(
-            [transfer_ix],
-            sender_keypair.pubkey(),
-            recent_blockhash
+        return sign_and_send(
+            lambda blockhash: build_transfer_transaction(sender_keypair, transfers, blockhash, price)
         )
 
-        tx = Transaction.new_unsigned(msg)
-        tx.sign([sender_keypair], recent_blockhash)
-
-        # Send transaction
-        tx_bytes = bytes(tx)
-        tx_base64 = base64.b64encode(tx_bytes).decode('utf-8')
-
-        send_result = rpc_request("sendTransaction", [
-            tx_base64,
-            {"encoding": "base64", "preflightCommitment": "confirmed"}
-        ])
-
-        if send_result and 'result' in send_result:
-            return {
-                'success': True,
-                'signature': send_result['result']
-            }
-        elif send_result and 'error' in send_result:
-            return {
-                'success': False,
-                'error': send_result['error'].get('message', 'Unknown error')
-            }
-        else:
-            return {'success': False, 'error': 'Failed to send transaction'}
-
     except ImportError:
         current_app.logger.error("solders library not installed")
         return {'success': False, 'error': 'Solana library not installed'}
@@ -260,22 +554,68 @@ def get_balance(wallet_address: str) -> Optional[Decimal]:
 
     if result and 'result' in result:
         lamports = result['result'].get('value', 0)
-        return Decimal(str(lamports)) / Decimal('1000000000')
+        return lamports_to_sol(lamports)
 
     return None
 
 
-def get_transaction_status(tx_signature: str) -> Optional[str]:
-    """Get the status of a transaction."""
-    result = rpc_request("getSignatureStatuses", [[tx_signature]])
+# getSignatureStatuses accepts at most 256 signatures per call
+SIGNATURE_STATUS_CHUNK = 256
 
-    if result and 'result' in result:
-        value = result['result'].get('value', [None])[0]
-        if value:
-            if value.get('err'):
-                return 'failed'
-            if value.get('confirmationStatus') == 'finalized':
-                return 'confirmed'
-            return 'pending'
 
-    return None
+def get_signature_statuses(signatures: list, search_history: bool = False) -> dict:
+    """
+    Get raw signature statuses for any number of signatures.
+
+    Signatures are split into chunks of 256 and several chunks are sent
+    per HTTP round trip as a JSON-RPC batch.
+
+    Returns dict mapping signature to its status value, or None if the
+    signature is unknown. Signatures whose lookup failed are left out.
+    """
+    signatures = list(dict.fromkeys(signatures))  # dedupe, keep order
+    chunks = [
+        signatures[i:i + SIGNATURE_STATUS_CHUNK]
+        for i in range(0, len(signatures), SIGNATURE_STATUS_CHUNK)
+    ]
+    chunks_per_batch = current_app.config.get('SOLANA_RPC_BATCH_SIZE', 10)
+
+    statuses = {}
+    for i in range(0, len(chunks), chunks_per_batch):
+        group = chunks[i:i + chunks_per_batch]
+        calls = [
+            ("getSignatureStatuses", [chunk, {"searchTransactionHistory": search_history}])
+            for chunk in group
+        ]
+        for chunk, result in zip(group, rpc_batch(calls)):
+            if not result or 'result' not in result:
+                continue
+            values = result['result'].get('value') or []
+            for index, signature in enumerate(chunk):
+                statuses[signature] = values[index] if index < len(values) else None
+
+    return statuses
+
+
+def _status_from_value(value: Optional[dict]) -> Optional[str]:
+    """Map a raw signature status to pending/confirmed/failed."""
+    if not value:
+        return None
+    if value.get('err'):
+        return 'failed'
+    if value.get('confirmationStatus') == 'finalized':
+        return 'confirmed'
+    return 'pending'
+
+
+def get_transaction_statuses(signatures: list, search_history: bool = False) -> dict:
+    """Get the status of many transactions in bulk."""
+    return {
+        signature: _status_from_value(value)
+        for signature, value in get_signature_statuses(signatures, search_history).items()
+    }
+
+
+def get_transaction_status(tx_signature: str) -> Optional[str]:
+    """Get the status of a transaction."""
+    return get_transaction_statuses([tx_signature]).get(tx_signature)
@@ -0,0 +1,131 @@
+"""Trending score: exponentially decayed donation velocity per project."""
+import math
+from datetime import datetime, timedelta
+
+from flask import current_app
+
+from app.extensions import db
+from app.models import Project, Donation
+from app.utils.money import LAMPORTS_PER_SOL
+
+# Each project's trending_score is valued as of its trending_at.
+# decay_trending_scores() periodically decays every score to the same
+# time, so between runs scores are compared on one scale; a donation is
+# added scaled up to that time rather than decaying its project alone.
+
+
+def _half_life() -> float:
+    return current_app.config.get('TRENDING_HALF_LIFE_HOURS', 24) * 3600
+
+
+def decay_factor(elapsed_seconds: float, half_life: float) -> float:
+    """Fraction of a score left after elapsed_seconds."""
+    return 0.5 ** (elapsed_seconds / half_life)
+
+
+def donation_weight(amount_lamports: int) -> float:
+    """
+    Trending weight of one donation.
+
+    Every donation counts 1 plus the log of its size in SOL, so many
+    backers outweigh a single large donation.
+    """
+    return 1.0 + math.log10(1 + (amount_lamports or 0) / LAMPORTS_PER_SOL)
+
+
+def _seconds_since_trending_at(now: datetime):
+    """SQL expression for the seconds from each row's trending_at to now."""
+    now = db.literal(now, db.DateTime)
+    if db.engine.dialect.name == 'postgresql':
+        return db.extract('epoch', now - Project.trending_at)
+    # SQLite
+    return (db.func.julianday(now) - db.func.julianday(Project.trending_at)) * 86400.0
+
+
+def trending_update(amount_lamports: int, now: datetime = None) -> dict:
+    """
+    Get the column updates that add a donation to a project's score.
+
+    Meant to be merged into the UPDATE that credits the donation. The
+    donation is scaled to the row's own trending_at in SQL, so neither a
+    concurrent confirmation nor a decay run in between loses it.
+    """
+    now = now or datetime.utcnow()
+    weight = donation_weight(amount_lamports)
+    growth = db.func.power(2.0, _seconds_since_trending_at(now) / _half_life())
+
+    # Nothing to keep: start the score at now
+    fresh = db.or_(Project.trending_at.is_(None), Project.trending_score == 0)
+    return {
+        'trending_score': db.case((fresh, weight), else_=Project.trending_score + weight * growth),
+        'trending_at': db.case((fresh, db.literal(now, db.DateTime)), else_=Project.trending_at)
+    }
+
+
+def decay_trending_scores(now: datetime = None) -> int:
+    """
+    Decay all trending scores to now.
+
+    Called by the scheduler. Projects share their trending_at after a
+    run, so this is usually a single UPDATE; scores that fall below
+    TRENDING_MIN_SCORE are reset to 0 and drop out of the trending sort.
+    Returns number of projects decayed.
+    """
+    now = now or datetime.utcnow()
+    half_life = _half_life()
+    min_score = current_app.config.get('TRENDING_MIN_SCORE', 0.01)
+
+    valued_at = [
+        row.trending_at for row in db.session.query(Project.trending_at).filter(
+            Project.trending_score > 0,
+            Project.trending_at < now
+        ).distinct()
+    ]
+
+    decayed = 0
+    for when in valued_at:
+        factor = decay_factor((now - when).total_seconds(), half_life)
+        score = Project.trending_score * factor
+        # Matching on trending_at skips rows another run already decayed
+        decayed += Project.query.filter(
+            Project.trending_score > 0,
+            Project.trending_at == when
+        ).update({
+            'trending_score': db.case((score < min_score, 0.0), else_=score),
+            'trending_at': now
+        }, synchronize_session=False)
+
+    db.session.commit()
+    return decayed
+
+
+def rebuild_trending_scores(now: datetime = None) -> int:
+    """
+    Recompute every trending score from confirmed donations.
+
+    Only needed to fill the scores on an existing database or after
+    donations were changed by hand; donations older than ten half-lives
+    are left out as they add next to nothing.
+    Returns number of projects with a score.
+    """
+    now = now or datetime.utcnow()
+    half_life = _half_life()
+    since = now - timedelta(seconds=half_life * 10)
+
+    scores = {}
+    rows = db.session.query(Donation.project_id, Donation.amount_lamports, Donation.created_at).filter(
+        Donation.status == 'confirmed',
+        Donation.created_at >= since
+    ).yield_per(1000)
+    for row in rows:
+        age = max(0.0, (now - row.created_at).total_seconds())
+        scores[row.project_id] = scores.get(row.project_id, 0.0) + (
+            donation_weight(row.amount_lamports) * decay_factor(age, half_life)
+        )
+
+    Project.query.update({'trending_score': 0.0, 'trending_at': now}, synchronize_session=False)
+    for project_id, score in scores.items():
+        Project.query.filter_by(id=project_id).update({'trending_score': score}, synchronize_session=False)
+    db.session.commit()
+
+    return len(scores)
@@ -0,0 +1,122 @@
+"""Cache of finalized Solana transactions keyed by signature."""
+import json
+import threading
+from collections import OrderedDict
+from typing import Optional
+
+from flask import current_app
+
+from app.utils.redis import connect_redis
+from app.utils.singleton import process_singleton
+
+
+class TransactionCache:
+    """
+    LRU cache of finalized getTransaction results.
+
+    Finalized transactions never change, so entries need no expiry in
+    memory; they are evicted least-recently-used once the total size of
+    cached JSON exceeds max_bytes. When a Redis client is given it is
+    used as a shared second tier across processes.
+    """
+
+    REDIS_PREFIX = 'solio:tx:'
+
+    def __init__(self, max_bytes: int = 32 * 1024 * 1024, redis_client=None,
+                 redis_ttl: int = 7 * 24 * 3600):
+        self.max_bytes = max_bytes
+        self.redis = redis_client
+        self.redis_ttl = redis_ttl
+
+        self._entries = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.redis_hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, signature: str) -> Optional[dict]:
+        """Get a cached transaction, or None."""
+        with self._lock:
+            raw = self._entries.get(signature)
+            if raw is not None:
+                self._entries.move_to_end(signature)
+                self.hits += 1
+
+        if raw is None and self.redis is not None:
+            try:
+                raw = self.redis.get(self.REDIS_PREFIX + signature)
+            except Exception as e:
+                current_app.logger.warning(f"Transaction cache Redis error: {e}")
+                raw = None
+            if raw is not None:
+                if isinstance(raw, bytes):
+                    raw = raw.decode('utf-8')
+                self._store(signature, raw)
+                with self._lock:
+                    self.redis_hits += 1
+
+        if raw is None:
+            with self._lock:
+                self.misses += 1
+            return None
+
+        # Hand out a fresh copy so callers can't mutate the cached entry
+        return json.loads(raw)
+
+    def put(self, signature: str, tx: dict):
+        """Cache a finalized transaction."""
+        raw = json.dumps(tx, separators=(',', ':'))
+        self._store(signature, raw)
+
+        if self.redis is not None:
+            try:
+                self.redis.set(self.REDIS_PREFIX + signature, raw, ex=self.redis_ttl)
+            except Exception as e:
+                current_app.logger.warning(f"Transaction cache Redis error: {e}")
+
+    def _store(self, signature: str, raw: str):
+        size = len(raw)
+        if size > self.max_bytes:
+            return
+
+        with self._lock:
+            previous = self._entries.pop(signature, None)
+            if previous is not None:
+                self._size -= len(previous)
+
+            self._entries[signature] = raw
+            self._size += size
+
+            while self._size > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self._size -= len(evicted)
+                self.evictions += 1
+
+    def stats(self) -> dict:
+        """Get hit/miss counters and memory use."""
+        with self._lock:
+            return {
+                'entries': len(self._entries),
+                'bytes': self._size,
+                'max_bytes': self.max_bytes,
+                'hits': self.hits,
+                'redis_hits': self.redis_hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'redis': self.redis is not None
+            }
+
+
+@process_singleton
+def get_tx_cache() -> TransactionCache:
+    """Get the process-wide transaction cache."""
+    return TransactionCache(
+        max_bytes=current_app.config.get('TX_CACHE_MAX_BYTES', 32 * 1024 * 1024),
+        redis_client=connect_redis(
+            current_app.config.get('TX_CACHE_REDIS_URL', ''),
+            purpose='transaction cache'
+        )
+    )
@@ -0,0 +1,117 @@
+"""Single-pass parsing of jsonParsed Solana transactions."""
+from typing import NamedTuple, Optional
+
+SYSTEM_TRANSFER_TYPES = frozenset(('transfer', 'transferWithSeed'))
+
+# Allowed difference between expected and transferred amounts (0.000001 SOL)
+AMOUNT_TOLERANCE_LAMPORTS = 1000
+
+
+class Transfer(NamedTuple):
+    """A system program SOL transfer."""
+    source: str
+    destination: str
+    lamports: int
+    inner: bool  # True if made through a CPI (meta.innerInstructions)
+
+
+def iter_transfers(tx: dict):
+    """
+    Yield every system transfer in a transaction.
+
+    Walks top-level instructions, then each inner instruction group,
+    without building intermediate lists.
+    """
+    message = (tx.get('transaction') or {}).get('message') or {}
+    groups = [(message.get('instructions') or [], False)]
+    for inner in (tx.get('meta') or {}).get('innerInstructions') or []:
+        groups.append((inner.get('instructions') or [], True))
+
+    for instructions, is_inner in groups:
+        for instruction in instructions:
+            if instruction.get('program') != 'system':
+                continue
+            parsed = instruction.get('parsed')
+            if not isinstance(parsed, dict) or parsed.get('type') not in SYSTEM_TRANSFER_TYPES:
+                continue
+            info = parsed.get('info') or {}
+            yield Transfer(
+                info.get('source', ''),
+                info.get('destination', ''),
+                int(info.get('lamports', 0)),
+                is_inner
+            )
+
+
+def find_transfers(tx: dict, destination: str = None, source: str = None,
+                   lamports: int = None, tolerance: int = AMOUNT_TOLERANCE_LAMPORTS) -> list:
+    """
+    Get all transfers matching the given filters.
+
+    Args:
+        destination: Only transfers to this address
+        source: Only transfers from this address
+        lamports: Only transfers within tolerance of this amount
+
+    Returns list of Transfer tuples in instruction order.
+    """
+    return [
+        transfer for transfer in iter_transfers(tx)
+        if (destination is None or transfer.destination == destination)
+        and (source is None or transfer.source == source)
+        and (lamports is None or abs(transfer.lamports - lamports) <= tolerance)
+    ]
+
+
+def find_transfers_many(transactions: dict, destination: str = None, source: str = None) -> dict:
+    """
+    Run find_transfers over many transactions.
+
+    Args:
+        transactions: Dict mapping signature to transaction (None skipped)
+
+    Returns dict mapping signature to its matching transfers, for
+    transactions with at least one match.
+    """
+    matches = {}
+    for signature, tx in transactions.items():
+        if tx is None:
+            continue
+        found = find_transfers(tx, destination=destination, source=source)
+        if found:
+            matches[signature] = found
+    return matches
+
+
+def _account_keys(tx: dict) -> list:
+    keys = ((tx.get('transaction') or {}).get('message') or {}).get('accountKeys') or []
+    # jsonParsed gives {'pubkey': ...} objects, json encoding plain strings
+    return [key['pubkey'] if isinstance(key, dict) else key for key in keys]
+
+
+def balance_deltas(tx: dict) -> dict:
+    """Get lamport balance change per account from pre/postBalances."""
+    meta = tx.get('meta') or {}
+    pre = meta.get('preBalances') or []
+    post = meta.get('postBalances') or []
+
+    return {
+        key: post[index] - pre[index]
+        for index, key in enumerate(_account_keys(tx))
+        if index < len(pre) and index < len(post)
+    }
+
+
+def balance_delta(tx: dict, account: str) -> Optional[int]:
+    """Get the lamport balance change of one account, or None if not in tx."""
+    keys = _account_keys(tx)
+    if account not in keys:
+        return None
+
+    index = keys.index(account)
+    meta = tx.get('meta') or {}
+    pre = meta.get('preBalances') or []
+    post = meta.get('postBalances') or []
+    if index >= len(pre) or index >= len(post):
+        return None
+    return post[index] - pre[index]
@@ -0,0 +1,51 @@
+"""Background worker pool for donation verification."""
+from concurrent.futures import ThreadPoolExecutor
+
+from flask import current_app
+
+from app.utils.singleton import process_singleton
+
+
+@process_singleton
+def _get_executor() -> ThreadPoolExecutor:
+    """Get the process-wide verification pool."""
+    return ThreadPoolExecutor(
+        max_workers=current_app.config.get('DONATION_VERIFY_WORKERS', 4),
+        thread_name_prefix='donation-verify'
+    )
+
+
+def _run_verification(app, donation_id: int):
+    """Verify a donation inside its own application context."""
+    from app.extensions import db
+    from app.services.donation_service import verify_pending_donation
+
+    with app.app_context():
+        try:
+            verify_pending_donation(donation_id)
+        except Exception as e:
+            app.logger.error(f"Donation {donation_id} verification worker error: {e}")
+            db.session.rollback()
+        finally:
+            db.session.remove()
+
+
+def enqueue_verification(donation_id: int):
+    """
+    Schedule verification of a pending donation.
+
+    Runs inline when DONATION_VERIFY_WORKERS is 0 (e.g. in tests). With
+    SIGNATURE_LISTENER_ENABLED the donation is left pending: the pool
+    would claim it straight away, hiding it from the listener, which
+    only watches pending donations.
+    """
+    app = current_app._get_current_object()
+    if app.config.get('SIGNATURE_LISTENER_ENABLED', False):
+        return
+
+    if app.config.get('DONATION_VERIFY_WORKERS', 4) <= 0:
+        from app.services.donation_service import verify_pending_donation
+        verify_pending_donation(donation_id)
+        return
+
+    _get_executor().submit(_run_verification, app, donation_id)
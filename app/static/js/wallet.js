@@ -423,7 +423,12 @@ async function makeDonation(projectId, amountSOL, message = '', rewardTierId = '
             throw new Error(error.error || 'Donation verification failed');
         }
 
-        const verifyResult = await verifyResponse.json();
+        let verifyResult = await verifyResponse.json();
+
+        // Backend verifies in the background - poll until it settles
+        if (verifyResponse.status === 202) {
+            verifyResult = await waitForDonationStatus(verifyResult.status_url);
+        }
 
         // Mark verify as completed
         setTxStep('verify');
@@ -517,6 +522,40 @@ async function confirmTransactionWithRetry(connection, signature, blockhash, las
     return false;
 }
 
+// ============================================
+// Donation Verification Status Polling
+// ============================================
+async function waitForDonationStatus(statusUrl) {
+    const maxAttempts = 40;
+    const pollIntervalMs = 1500;
+
+    for (let attempt = 0; attempt < maxAttempts; attempt++) {
+        await new Promise(resolve => setTimeout(resolve, pollIntervalMs));
+
+        let result;
+        try {
+            const response = await fetch(statusUrl);
+            if (!response.ok) {
+                continue;
+            }
+            result = await response.json();
+        } catch (pollError) {
+            console.warn(`Status poll attempt ${attempt + 1} failed:`, pollError.message);
+            continue;
+        }
+
+        if (result.status === 'confirmed') {
+            return result;
+        }
+
+        if (result.status === 'failed') {
+            throw new Error(result.error || 'Donation verification failed');
+        }
+    }
+
+    throw new Error('Donation is still being verified - it will appear on the project shortly');
+}
+
 // ============================================
 // Update Project Stats (after donation)
 // ============================================
@@ -0,0 +1,48 @@
+"""Lamport-integer money helpers.
+
+Amounts are stored and computed as integer lamports; SOL (Decimal) only
+appears at the edges: parsing user input and presenting values.
+"""
+from decimal import Decimal, ROUND_DOWN
+
+LAMPORTS_PER_SOL = 1_000_000_000
+
+_LAMPORT = Decimal('0.000000001')
+
+
+def sol_to_lamports(amount) -> int:
+    """Convert a SOL amount (Decimal, str, int) to lamports, truncating."""
+    if amount is None:
+        return 0
+    sol = Decimal(str(amount)).quantize(_LAMPORT, rounding=ROUND_DOWN)
+    return int(sol.scaleb(9))
+
+
+def lamports_to_sol(lamports) -> Decimal:
+    """Convert lamports to a SOL Decimal with nine decimal places."""
+    lamports = int(lamports or 0)
+    sign = '-' if lamports < 0 else ''
+    whole, frac = divmod(abs(lamports), LAMPORTS_PER_SOL)
+    return Decimal(f'{sign}{whole}.{frac:09d}')
+
+
+def percent_of(lamports: int, percent) -> int:
+    """Get percent of a lamport amount, rounded down."""
+    return int(Decimal(int(lamports or 0)) * Decimal(str(percent)) / 100)
+
+
+def sol_property(column: str, doc: str = None) -> property:
+    """
+    SOL view of a lamport column.
+
+    Reads return a Decimal for templates and to_dict; writes accept
+    anything Decimal() does and store lamports.
+    """
+    def getter(self):
+        value = getattr(self, column)
+        return None if value is None else lamports_to_sol(value)
+
+    def setter(self, value):
+        setattr(self, column, None if value is None else sol_to_lamports(value))
+
+    return property(getter, setter, doc=doc or f'{column} in SOL')
@@ -0,0 +1,189 @@
+"""Keyset (cursor) pagination for JSON list endpoints.
+
+Pages are fetched with WHERE (sort key, id) < (last sort key, last id)
+instead of OFFSET, so a page costs the same however deep it is and no
+COUNT(*) is needed. The cursor is an opaque token holding the sort
+values of the last row on the page.
+"""
+import base64
+import json
+from datetime import datetime
+from decimal import Decimal
+from typing import Optional
+
+from flask import request
+from sqlalchemy.sql import operators
+
+from app.extensions import db
+
+
+class InvalidCursor(ValueError):
+    """Raised for a cursor that wasn't issued for this listing."""
+
+
+def _encode_value(value):
+    if isinstance(value, datetime):
+        return {'t': value.isoformat()}
+    if isinstance(value, Decimal):
+        return {'d': str(value)}
+    return value
+
+
+def _decode_value(value):
+    if isinstance(value, dict):
+        if 't' in value:
+            return datetime.fromisoformat(value['t'])
+        return Decimal(value['d'])
+    return value
+
+
+def encode_cursor(values: list) -> str:
+    """Pack sort values into an opaque url-safe token."""
+    raw = json.dumps([_encode_value(value) for value in values], separators=(',', ':'))
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip('=')
+
+
+def decode_cursor(cursor: str) -> list:
+    """Unpack a token from encode_cursor. Raises InvalidCursor."""
+    try:
+        raw = base64.urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4))
+        values = json.loads(raw)
+        if not isinstance(values, list):
+            raise ValueError('not a list')
+        return [_decode_value(value) for value in values]
+    except (ValueError, TypeError, KeyError) as e:
+        raise InvalidCursor('Invalid cursor') from e
+
+
+def _sort_keys(order_by: list) -> list:
+    """Split order_by clauses into (expression, descending) pairs."""
+    keys = []
+    for clause in order_by:
+        modifier = getattr(clause, 'modifier', None)
+        if modifier in (operators.desc_op, operators.asc_op):
+            keys.append((clause.element, modifier is operators.desc_op))
+        else:
+            keys.append((clause, False))
+    return keys
+
+
+def _after(keys: list, values: list):
+    """Condition for rows that sort after values."""
+    conditions = []
+    for index, (expression, descending) in enumerate(keys):
+        earlier_equal = [keys[i][0] == values[i] for i in range(index)]
+        beyond = expression < values[index] if descending else expression > values[index]
+        conditions.append(db.and_(*earlier_equal, beyond))
+    return db.or_(*conditions)
+
+
+def estimate_count(query) -> int:
+    """
+    Approximate row count for query.
+
+    On PostgreSQL this is the planner's estimate, which costs no scan;
+    elsewhere it falls back to COUNT(*).
+    """
+    query = query.order_by(None)
+    if db.engine.dialect.name != 'postgresql':
+        return query.count()
+
+    compiled = query.statement.compile(dialect=db.engine.dialect)
+    plan = db.session.connection().exec_driver_sql(
+        f'EXPLAIN (FORMAT JSON) {compiled.string}', compiled.params
+    ).scalar()
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return int(plan[0]['Plan']['Plan Rows'])
+
+
+class KeysetPage:
+    """One page of a keyset-paginated query."""
+
+    def __init__(self, items: list, next_cursor: Optional[str], total: Optional[int] = None):
+        self.items = items
+        self.next_cursor = next_cursor
+        self.total = total
+
+    @property
+    def has_more(self) -> bool:
+        return self.next_cursor is not None
+
+
+def keyset_paginate(query, order_by: list, per_page: int, cursor: Optional[str] = None,
+                    with_total: bool = False, count=None) -> KeysetPage:
+    """
+    Get the page of query that follows cursor.
+
+    Args:
+        query: Query for a single entity, without ordering
+        order_by: asc()/desc() clauses on non-null columns, ending with
+            a unique one (usually the id) so every row has one position
+        per_page: Page size
+        cursor: next_cursor of the previous page, or None for the first
+        with_total: Also estimate the total row count
+        count: Callable returning the total, when a cheaper one is known
+
+    Raises InvalidCursor for a cursor that doesn't fit order_by.
+    """
+    keys = _sort_keys(order_by)
+    total = None
+    if with_total:
+        total = count() if count is not None else estimate_count(query)
+
+    if cursor:
+        values = decode_cursor(cursor)
+        if len(values) != len(keys):
+            raise InvalidCursor('Invalid cursor')
+        query = query.filter(_after(keys, values))
+
+    # Sort values are selected next to each row to build the next cursor
+    rows = query.add_columns(*[expression for expression, _ in keys]).order_by(None).order_by(
+        *order_by
+    ).limit(per_page + 1).all()
+
+    next_cursor = None
+    if len(rows) > per_page:
+        rows = rows[:per_page]
+        next_cursor = encode_cursor(list(rows[-1][1:]))
+
+    return KeysetPage([row[0] for row in rows], next_cursor, total)
+
+
+def paginate_request(query, order_by: list, per_page: int, count=None) -> tuple:
+    """
+    Paginate query for a JSON endpoint from the request arguments.
+
+    Pages by ?cursor= (keyset); ?include_total=true adds an approximate
+    total. Requests with ?page= and no cursor keep the old offset
+    pagination and its total/pages/current_page fields.
+
+    Returns (items, fields to merge into the response).
+    """
+    # ?per_page=0 or below would leave nothing to take a cursor from
+    per_page = max(1, per_page)
+
+    if 'page' in request.args and 'cursor' not in request.args:
+        page = request.args.get('page', 1, type=int)
+        pagination = query.order_by(None).order_by(*order_by).paginate(
+            page=page, per_page=per_page, error_out=False
+        )
+        return pagination.items, {
+            'total': pagination.total,
+            'pages': pagination.pages,
+            'current_page': page
+        }
+
+    page = keyset_paginate(
+        query,
+        order_by,
+        per_page,
+        cursor=request.args.get('cursor') or None,
+        with_total=request.args.get('include_total', 'false').lower() == 'true',
+        count=count
+    )
+
+    fields = {'next_cursor': page.next_cursor, 'has_more': page.has_more}
+    if page.total is not None:
+        fields['total'] = page.total
+    return page.items, fields
@@ -0,0 +1,19 @@
+"""Optional Redis connections for the shared caches and stores."""
+from flask import current_app
+
+
+def connect_redis(redis_url: str, purpose: str):
+    """
+    Connect to Redis if configured and the client library is installed.
+
+    purpose names the feature in the warning logged when the library is
+    missing. Returns None when Redis isn't used.
+    """
+    if not redis_url or not redis_url.startswith('redis'):
+        return None
+    try:
+        import redis
+    except ImportError:
+        current_app.logger.warning(f"redis library not installed, not using Redis for {purpose}")
+        return None
+    return redis.Redis.from_url(redis_url, socket_timeout=1)
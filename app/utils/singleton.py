@@ -0,0 +1,34 @@
+"""Lazily created process-wide service instances."""
+import functools
+import threading
+
+
+def process_singleton(factory):
+    """
+    Turn a factory into a getter for one instance per process.
+
+    The instance is created on the first call, not at import, so each
+    gunicorn worker builds its own after forking (with its own locks,
+    threads and connections) and the factory can read current_app.config.
+    The getter's reset() drops the instance so the next call builds a new
+    one, e.g. after a config change in tests.
+    """
+    instance = None
+    lock = threading.Lock()
+
+    @functools.wraps(factory)
+    def get():
+        nonlocal instance
+        if instance is None:
+            with lock:
+                if instance is None:
+                    instance = factory()
+        return instance
+
+    def reset():
+        nonlocal instance
+        with lock:
+            instance = None
+
+    get.reset = reset
+    return get
@@ -0,0 +1,32 @@
+"""donation retryable failure
+
+Revision ID: 3c1f9d2a7b64
+Revises: 5feddfaa14b8
+Create Date: 2026-10-17 23:32:10.418263
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '3c1f9d2a7b64'
+down_revision = '5feddfaa14b8'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('donations', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('retryable', sa.Boolean(), nullable=False, server_default=sa.false()))
+
+    # Failures from before the flag that came from giving up on verification
+    op.execute(
+        "UPDATE donations SET retryable = true WHERE status = 'failed' AND error_message IN "
+        "('Transaction not found', 'Transaction not found or not confirmed after retries')"
+    )
+
+
+def downgrade():
+    with op.batch_alter_table('donations', schema=None) as batch_op:
+        batch_op.drop_column('retryable')
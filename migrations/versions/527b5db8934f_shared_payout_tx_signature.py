@@ -0,0 +1,42 @@
+"""shared payout tx signature
+
+Revision ID: 527b5db8934f
+Revises: 45d4c6fb420b
+Create Date: 2026-10-17 23:15:27.768909
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '527b5db8934f'
+down_revision = '45d4c6fb420b'
+branch_labels = None
+depends_on = None
+
+# SQLite reflects the baseline constraint without a name; this names it
+# so the batch copy of the table can leave it out
+naming_convention = {'uq': 'uq_%(table_name)s_%(column_0_name)s'}
+
+
+def _tx_signature_unique_name():
+    for constraint in sa.inspect(op.get_bind()).get_unique_constraints('payouts'):
+        if constraint['column_names'] == ['tx_signature']:
+            return constraint['name'] or 'uq_payouts_tx_signature'
+    return None
+
+
+def upgrade():
+    # Several payouts can now share one batched transaction
+    name = _tx_signature_unique_name()
+    with op.batch_alter_table('payouts', schema=None, naming_convention=naming_convention) as batch_op:
+        if name:
+            batch_op.drop_constraint(name, type_='unique')
+        batch_op.create_index(batch_op.f('ix_payouts_tx_signature'), ['tx_signature'], unique=False)
+
+
+def downgrade():
+    with op.batch_alter_table('payouts', schema=None, naming_convention=naming_convention) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_payouts_tx_signature'))
+        batch_op.create_unique_constraint('uq_payouts_tx_signature', ['tx_signature'])
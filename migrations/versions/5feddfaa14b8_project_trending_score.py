@@ -0,0 +1,32 @@
+"""project trending score
+
+Revision ID: 5feddfaa14b8
+Revises: b9f16a392862
+Create Date: 2026-10-17 23:15:57.114953
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '5feddfaa14b8'
+down_revision = 'b9f16a392862'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('projects', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('trending_score', sa.Float(), nullable=False, server_default='0'))
+        batch_op.add_column(sa.Column('trending_at', sa.DateTime(), nullable=True))
+        batch_op.create_index('ix_projects_category_listing_trending_score', ['is_draft', 'status', 'category_id', 'trending_score', 'id'], unique=False)
+        batch_op.create_index('ix_projects_listing_trending_score', ['is_draft', 'status', 'trending_score', 'id'], unique=False)
+
+
+def downgrade():
+    with op.batch_alter_table('projects', schema=None) as batch_op:
+        batch_op.drop_index('ix_projects_listing_trending_score')
+        batch_op.drop_index('ix_projects_category_listing_trending_score')
+        batch_op.drop_column('trending_at')
+        batch_op.drop_column('trending_score')
@@ -0,0 +1,76 @@
+"""amounts in lamports
+
+Revision ID: aa663ee00b84
+Revises: 098457fbbb12
+Create Date: 2026-10-17 23:15:37.886712
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'aa663ee00b84'
+down_revision = '098457fbbb12'
+branch_labels = None
+depends_on = None
+
+LAMPORTS_PER_SOL = 1_000_000_000
+
+# table -> [(old Numeric(18, 9) SOL column, new BigInteger lamport column, nullable)]
+LAMPORT_COLUMNS = {
+    'projects': [
+        ('goal_sol', 'goal_lamports', False),
+        ('raised_sol', 'raised_lamports', True),
+    ],
+    'donations': [
+        ('amount_sol', 'amount_lamports', False),
+        ('platform_fee', 'platform_fee_lamports', True),
+    ],
+    'milestones': [
+        ('amount_sol', 'amount_lamports', False),
+    ],
+    'reward_tiers': [
+        ('min_amount_sol', 'min_amount_lamports', False),
+    ],
+    'payouts': [
+        ('total_raised', 'total_raised_lamports', False),
+        ('platform_fee', 'platform_fee_lamports', False),
+        ('net_amount', 'net_amount_lamports', False),
+    ],
+}
+
+
+def _convert(table, columns, to_type, backfill):
+    # Add the new columns as nullable, backfill them, then tighten them
+    # and drop the old ones
+    with op.batch_alter_table(table, schema=None) as batch_op:
+        for old, new, _ in columns:
+            batch_op.add_column(sa.Column(new, to_type, nullable=True))
+
+    for old, new, _ in columns:
+        op.execute(f'UPDATE {table} SET {new} = {backfill(old)} WHERE {old} IS NOT NULL')
+
+    with op.batch_alter_table(table, schema=None) as batch_op:
+        for old, new, nullable in columns:
+            if not nullable:
+                batch_op.alter_column(new, existing_type=to_type, nullable=False)
+            batch_op.drop_column(old)
+
+
+def upgrade():
+    for table, columns in LAMPORT_COLUMNS.items():
+        _convert(
+            table, columns,
+            sa.BigInteger(),
+            lambda old: f'CAST(ROUND({old} * {LAMPORTS_PER_SOL}) AS BIGINT)'
+        )
+
+
+def downgrade():
+    for table, columns in LAMPORT_COLUMNS.items():
+        _convert(
+            table, [(new, old, nullable) for old, new, nullable in columns],
+            sa.Numeric(precision=18, scale=9),
+            lambda new: f'{new} / {LAMPORTS_PER_SOL}.0'
+        )
@@ -0,0 +1,36 @@
+"""project donation counts
+
+Revision ID: b44eae919584
+Revises: 08a6c230017c
+Create Date: 2026-10-17 23:15:45.162846
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'b44eae919584'
+down_revision = '08a6c230017c'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('projects', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('donation_count', sa.Integer(), nullable=False, server_default='0'))
+        batch_op.add_column(sa.Column('donor_count', sa.Integer(), nullable=False, server_default='0'))
+
+    op.execute(
+        "UPDATE projects SET "
+        "donation_count = (SELECT COUNT(donations.id) FROM donations "
+        "WHERE donations.project_id = projects.id AND donations.status = 'confirmed'), "
+        "donor_count = (SELECT COUNT(DISTINCT donations.donor_wallet) FROM donations "
+        "WHERE donations.project_id = projects.id AND donations.status = 'confirmed')"
+    )
+
+
+def downgrade():
+    with op.batch_alter_table('projects', schema=None) as batch_op:
+        batch_op.drop_column('donor_count')
+        batch_op.drop_column('donation_count')
@@ -0,0 +1,50 @@
+"""project funded ratio
+
+Revision ID: b9f16a392862
+Revises: 12624c81fc0c
+Create Date: 2026-10-17 23:15:53.023908
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'b9f16a392862'
+down_revision = '12624c81fc0c'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('projects', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('funded_ratio', sa.Float(), nullable=False, server_default='0'))
+
+    op.execute(
+        'UPDATE projects SET funded_ratio = '
+        'CAST(COALESCE(raised_lamports, 0) AS FLOAT) / goal_lamports '
+        'WHERE goal_lamports > 0'
+    )
+
+    with op.batch_alter_table('projects', schema=None) as batch_op:
+        batch_op.create_index('ix_projects_category_listing_created_at', ['is_draft', 'status', 'category_id', 'created_at', 'id'], unique=False)
+        batch_op.create_index('ix_projects_category_listing_end_date', ['is_draft', 'status', 'category_id', 'end_date', 'id'], unique=False)
+        batch_op.create_index('ix_projects_category_listing_funded_ratio', ['is_draft', 'status', 'category_id', 'funded_ratio', 'id'], unique=False)
+        batch_op.create_index('ix_projects_category_listing_raised_lamports', ['is_draft', 'status', 'category_id', 'raised_lamports', 'id'], unique=False)
+        batch_op.create_index('ix_projects_listing_created_at', ['is_draft', 'status', 'created_at', 'id'], unique=False)
+        batch_op.create_index('ix_projects_listing_end_date', ['is_draft', 'status', 'end_date', 'id'], unique=False)
+        batch_op.create_index('ix_projects_listing_funded_ratio', ['is_draft', 'status', 'funded_ratio', 'id'], unique=False)
+        batch_op.create_index('ix_projects_listing_raised_lamports', ['is_draft', 'status', 'raised_lamports', 'id'], unique=False)
+
+
+def downgrade():
+    with op.batch_alter_table('projects', schema=None) as batch_op:
+        batch_op.drop_index('ix_projects_listing_raised_lamports')
+        batch_op.drop_index('ix_projects_listing_funded_ratio')
+        batch_op.drop_index('ix_projects_listing_end_date')
+        batch_op.drop_index('ix_projects_listing_created_at')
+        batch_op.drop_index('ix_projects_category_listing_raised_lamports')
+        batch_op.drop_index('ix_projects_category_listing_funded_ratio')
+        batch_op.drop_index('ix_projects_category_listing_end_date')
+        batch_op.drop_index('ix_projects_category_listing_created_at')
+        batch_op.drop_column('funded_ratio')
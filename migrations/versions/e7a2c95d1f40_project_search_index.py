@@ -0,0 +1,49 @@
+"""project search index
+
+Revision ID: e7a2c95d1f40
+Revises: 3c1f9d2a7b64
+Create Date: 2026-10-17 23:16:02.418377
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'e7a2c95d1f40'
+down_revision = '3c1f9d2a7b64'
+branch_labels = None
+depends_on = None
+
+# Not in the models: migrations/env.py keeps these out of autogenerate.
+# IF NOT EXISTS because `flask init-db` used to create them at runtime.
+# Fill them with `flask reindex-search`.
+PG_SEARCH_COLUMNS = ('search_vector', 'search_words')
+
+# FTS5 table -> tokenizer
+FTS_TABLES = {
+    'project_search': 'porter unicode61',
+    'project_search_words': 'unicode61',
+}
+
+
+def upgrade():
+    dialect = op.get_bind().dialect.name
+    if dialect == 'postgresql':
+        for column in PG_SEARCH_COLUMNS:
+            op.execute(f'ALTER TABLE projects ADD COLUMN IF NOT EXISTS {column} tsvector')
+            op.execute(f'CREATE INDEX IF NOT EXISTS ix_projects_{column} ON projects USING GIN ({column})')
+    elif dialect == 'sqlite':
+        for table, tokenize in FTS_TABLES.items():
+            op.execute(f"CREATE VIRTUAL TABLE IF NOT EXISTS {table} USING fts5(title, body, tokenize='{tokenize}')")
+
+
+def downgrade():
+    dialect = op.get_bind().dialect.name
+    if dialect == 'postgresql':
+        for column in PG_SEARCH_COLUMNS:
+            op.execute(f'DROP INDEX IF EXISTS ix_projects_{column}')
+            op.execute(f'ALTER TABLE projects DROP COLUMN IF EXISTS {column}')
+    elif dialect == 'sqlite':
+        for table in FTS_TABLES:
+            op.execute(f'DROP TABLE IF EXISTS {table}')
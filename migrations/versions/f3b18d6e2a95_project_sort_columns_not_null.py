@@ -0,0 +1,33 @@
+"""project sort columns not null
+
+Revision ID: f3b18d6e2a95
+Revises: e7a2c95d1f40
+Create Date: 2026-10-17 23:16:10.734102
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'f3b18d6e2a95'
+down_revision = 'e7a2c95d1f40'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Keyset cursors compare sort values with < and >, which never match
+    # NULL: such a project would drop out of the listing after page one
+    op.execute('UPDATE projects SET raised_lamports = 0 WHERE raised_lamports IS NULL')
+    op.execute('UPDATE projects SET created_at = COALESCE(updated_at, CURRENT_TIMESTAMP) WHERE created_at IS NULL')
+
+    with op.batch_alter_table('projects', schema=None) as batch_op:
+        batch_op.alter_column('raised_lamports', existing_type=sa.BigInteger(), nullable=False, server_default='0')
+        batch_op.alter_column('created_at', existing_type=sa.DateTime(), nullable=False)
+
+
+def downgrade():
+    with op.batch_alter_table('projects', schema=None) as batch_op:
+        batch_op.alter_column('created_at', existing_type=sa.DateTime(), nullable=True)
+        batch_op.alter_column('raised_lamports', existing_type=sa.BigInteger(), nullable=True, server_default=None)
@@ -0,0 +1,114 @@
+#!/usr/bin/env python
+"""
+Microbenchmarks for wallet signature verification.
+
+Compares the cached SignatureVerifier against decoding the key and
+building a VerifyKey per call, and the format-sniffing signature
+decoder against trying base58 then base64.
+
+Run with: python scripts/bench_signatures.py [--wallets N] [--rounds N]
+"""
+import argparse
+import base64
+import os
+import sys
+import timeit
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import base58
+from nacl.signing import SigningKey, VerifyKey
+
+from app.services.signature_verifier import SignatureVerifier, decode_signature
+
+MESSAGE = "Sign this message to authenticate with Solio.\n\nNonce: {}"
+
+
+def make_logins(wallets: int, per_wallet: int, encode) -> list:
+    """Signed (wallet, message, signature) tuples, per_wallet for each wallet."""
+    logins = []
+    for _ in range(wallets):
+        signing_key = SigningKey.generate()
+        wallet = base58.b58encode(bytes(signing_key.verify_key)).decode()
+        for attempt in range(per_wallet):
+            message = MESSAGE.format(os.urandom(16).hex())
+            signature = signing_key.sign(message.encode()).signature
+            logins.append((wallet, message, encode(signature)))
+    return logins
+
+
+def uncached_verify(wallet_address: str, message: str, signature: str) -> bool:
+    """Previous implementation: decode everything per call, fall through on exceptions."""
+    try:
+        public_key_bytes = base58.b58decode(wallet_address)
+        try:
+            signature_bytes = base58.b58decode(signature)
+        except Exception:
+            signature_bytes = base64.b64decode(signature)
+        VerifyKey(public_key_bytes).verify(message.encode('utf-8'), signature_bytes)
+        return True
+    except Exception:
+        return False
+
+
+def fallthrough_decode(signature: str):
+    try:
+        return base58.b58decode(signature)
+    except Exception:
+        try:
+            return base64.b64decode(signature)
+        except Exception:
+            return None
+
+
+def bench(name: str, func, count: int, rounds: int):
+    best = min(timeit.repeat(func, number=1, repeat=rounds))
+    print(f"  {name:<34} {best * 1000:9.2f} ms  {best / count * 1e6:8.1f} us/op")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--wallets', type=int, default=200)
+    parser.add_argument('--per-wallet', type=int, default=5)
+    parser.add_argument('--rounds', type=int, default=5)
+    args = parser.parse_args()
+
+    b58 = make_logins(args.wallets, args.per_wallet, lambda s: base58.b58encode(s).decode())
+    b64 = make_logins(args.wallets, args.per_wallet, lambda s: base64.b64encode(s).decode())
+    count = len(b58)
+
+    print(f"{args.wallets} wallets x {args.per_wallet} logins ({count} signatures)")
+
+    print("verify (base58 signatures)")
+    bench('uncached', lambda: [uncached_verify(*login) for login in b58], count, args.rounds)
+    verifier = SignatureVerifier()
+    bench('SignatureVerifier.verify', lambda: [verifier.verify(*login) for login in b58],
+          count, args.rounds)
+    verifier = SignatureVerifier()
+    bench('SignatureVerifier.verify_many', lambda: verifier.verify_many(b58), count, args.rounds)
+
+    print("verify (base64 signatures)")
+    bench('uncached', lambda: [uncached_verify(*login) for login in b64], count, args.rounds)
+    verifier = SignatureVerifier()
+    bench('SignatureVerifier.verify_many', lambda: verifier.verify_many(b64), count, args.rounds)
+
+    print("decode signature only")
+    b64_signatures = [signature for _, _, signature in b64]
+    bench('base58 then base64 by exception', lambda: [fallthrough_decode(s) for s in b64_signatures],
+          count, args.rounds)
+    bench('decode_signature', lambda: [decode_signature(s) for s in b64_signatures],
+          count, args.rounds)
+
+    print("decode public key only")
+    verifier = SignatureVerifier()
+    wallets = [wallet for wallet, _, _ in b58]
+    bench('VerifyKey(b58decode(address))', lambda: [VerifyKey(base58.b58decode(w)) for w in wallets],
+          count, args.rounds)
+    bench('SignatureVerifier.get_verify_key', lambda: [verifier.get_verify_key(w) for w in wallets],
+          count, args.rounds)
+    print(f"  cache: {verifier.stats()}")
+
+
+if __name__ == '__main__':
+    main()
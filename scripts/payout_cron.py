@@ -18,8 +18,11 @@ from apscheduler.schedulers.blocking import BlockingScheduler
 from apscheduler.triggers.interval import IntervalTrigger
 
 from app import create_app
-from app.services.payout_service import process_pending_payouts
-from app.models import WalletNonce
+from app.services.payout_service import process_pending_payouts, reconcile_payouts
+from app.services.donation_service import process_pending_donations
+from app.services.indexer_service import index_platform_wallet
+from app.services.nonce_store import get_nonce_store
+from app.services.trending_service import decay_trending_scores
 
 # Configure logging
 logging.basicConfig(
@@ -43,16 +46,51 @@ def process_payouts_job():
             logger.error(f'Payout processing error: {e}')
 
 
+def verify_donations_job():
+    """Job to verify donations left pending by web workers."""
+    with app.app_context():
+        try:
+            count = process_pending_donations()
+            if count > 0:
+                logger.info(f'Confirmed {count} pending donations')
+        except Exception as e:
+            logger.error(f'Donation verification error: {e}')
+
+
+def index_wallet_job():
+    """Job to reconcile donations from platform wallet history."""
+    with app.app_context():
+        try:
+            summary = index_platform_wallet()
+            if summary['credited'] or summary['unmatched']:
+                logger.info(
+                    f"Indexer credited {summary['credited']} donations, "
+                    f"{summary['unmatched']} unmatched transfers"
+                )
+        except Exception as e:
+            logger.error(f'Wallet indexer error: {e}')
+
+
 def cleanup_nonces_job():
     """Job to clean up expired wallet nonces."""
     with app.app_context():
         try:
-            WalletNonce.cleanup_expired()
-            logger.debug('Cleaned up expired nonces')
+            removed = get_nonce_store().cleanup()
+            logger.debug(f'Cleaned up {removed} expired nonces')
         except Exception as e:
             logger.error(f'Nonce cleanup error: {e}')
 
 
+def decay_trending_job():
+    """Job to decay project trending scores."""
+    with app.app_context():
+        try:
+            decayed = decay_trending_scores()
+            logger.debug(f'Decayed {decayed} trending scores')
+        except Exception as e:
+            logger.error(f'Trending decay error: {e}')
+
+
 def main():
     """Main entry point."""
     scheduler = BlockingScheduler()
@@ -66,6 +104,24 @@ def main():
         replace_existing=True
     )
 
+    # Sweep pending donations every minute
+    scheduler.add_job(
+        verify_donations_job,
+        IntervalTrigger(minutes=1),
+        id='verify_donations',
+        name='Verify pending donations',
+        replace_existing=True
+    )
+
+    # Reconcile platform wallet history every 2 minutes
+    scheduler.add_job(
+        index_wallet_job,
+        IntervalTrigger(minutes=2),
+        id='index_wallet',
+        name='Index platform wallet',
+        replace_existing=True
+    )
+
     # Clean up nonces every 15 minutes
     scheduler.add_job(
         cleanup_nonces_job,
@@ -75,6 +131,24 @@ def main():
         replace_existing=True
     )
 
+    # Decay trending scores
+    scheduler.add_job(
+        decay_trending_job,
+        IntervalTrigger(minutes=app.config.get('TRENDING_DECAY_MINUTES', 10)),
+        id='decay_trending',
+        name='Decay trending scores',
+        replace_existing=True
+    )
+
+    # Settle payouts a previous run may have left in flight
+    with app.app_context():
+        try:
+            count = reconcile_payouts()
+            if count > 0:
+                logger.info(f'Reconciled {count} in-flight payouts')
+        except Exception as e:
+            logger.error(f'Payout reconciliation error: {e}')
+
     logger.info('Payout scheduler started')
 
     try:
@@ -0,0 +1,50 @@
+#!/usr/bin/env python
+"""
+Donation signature listener.
+Keeps one Solana WebSocket connection open and confirms pending
+donations the moment the cluster reports their transactions.
+
+Run with: python scripts/signature_listener.py
+Run it alongside scripts/payout_cron.py as a systemd service.
+"""
+import os
+import sys
+import logging
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app import create_app
+from app.services.signature_listener import SignatureListener
+from app.services.solana_service import get_ws_url
+
+# Configure logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+# Create Flask app
+app = create_app(os.environ.get('FLASK_ENV', 'production'))
+
+
+def main():
+    """Main entry point."""
+    with app.app_context():
+        ws_url = get_ws_url()
+        commitment = app.config.get('SOLANA_VERIFY_COMMITMENT', 'confirmed')
+
+    listener = SignatureListener(app, ws_url, commitment=commitment)
+
+    logger.info('Signature listener started')
+
+    try:
+        listener.run()
+    except (KeyboardInterrupt, SystemExit):
+        listener.stop()
+        logger.info('Signature listener stopped')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,58 @@
+"""Shared fixtures: an app on the testing config with an empty in-memory database."""
+from datetime import datetime, timedelta
+
+import pytest
+
+from app import create_app
+from app.extensions import db
+from app.models import User, Project
+
+PLATFORM_WALLET = 'P' * 44
+CREATOR_WALLET = '9WzDXwBbmkg8ZTbNMqUxvQRAyrZzDsGYdLVL9zYtAWWM'
+
+
+@pytest.fixture
+def app():
+    app = create_app('testing')
+    app.config['PLATFORM_WALLET_ADDRESS'] = PLATFORM_WALLET
+
+    with app.app_context():
+        db.create_all()
+        yield app
+        db.session.remove()
+        db.drop_all()
+
+
+@pytest.fixture
+def creator(app):
+    user = User(email='creator@example.com', username='creator', auth_type='email',
+                wallet_address=CREATOR_WALLET)
+    db.session.add(user)
+    db.session.commit()
+    return user
+
+
+@pytest.fixture
+def make_project(creator):
+    """Factory for published, active projects."""
+    count = 0
+
+    def make(**fields):
+        nonlocal count
+        count += 1
+        values = {
+            'user_id': creator.id,
+            'title': f'Project {count}',
+            'slug': f'project-{count}',
+            'description': 'A project description',
+            'goal_lamports': 10_000_000_000,
+            'end_date': datetime.utcnow() + timedelta(days=7),
+            'images': [],
+        }
+        values.update(fields)
+        project = Project(**values)
+        db.session.add(project)
+        db.session.commit()
+        return project
+
+    return make
@@ -0,0 +1,50 @@
+"""Reuse of cached blockhashes until their last valid block height nears."""
+import pytest
+
+from app.services.blockhash_cache import BlockhashCache
+
+
+@pytest.fixture
+def chain():
+    class Chain:
+        height = 1000
+        fetched = 0
+
+        def latest_blockhash(self):
+            self.fetched += 1
+            return {'blockhash': f'hash-{self.fetched}', 'last_valid_block_height': self.height + 150}
+
+        def block_height(self):
+            return self.height
+
+    return Chain()
+
+
+@pytest.fixture
+def cache(app, chain):
+    return BlockhashCache(app, chain.latest_blockhash, chain.block_height,
+                          refresh_after=3600, max_age=3600, min_blocks_left=30)
+
+
+def test_reused_while_enough_blocks_are_left(cache, chain):
+    assert cache.get()['blockhash'] == 'hash-1'
+
+    chain.height += 120
+    assert cache.get()['blockhash'] == 'hash-1'
+    assert chain.fetched == 1
+
+
+def test_refetched_near_last_valid_block_height(cache, chain):
+    cache.get()
+
+    chain.height += 121
+    assert cache.get()['blockhash'] == 'hash-2'
+    assert cache.stats()['last_valid_block_height'] == chain.height + 150
+
+
+def test_falls_back_to_age_without_block_height(app, chain):
+    cache = BlockhashCache(app, chain.latest_blockhash, lambda: None,
+                           refresh_after=3600, max_age=0, min_blocks_left=30)
+    cache.get()
+
+    assert cache.get()['blockhash'] == 'hash-2'
@@ -0,0 +1,179 @@
+"""Donation verification: retries, giving up and resubmission."""
+from datetime import datetime, timedelta
+
+import pytest
+
+from app.extensions import db
+from app.models import Donation
+from app.services import donation_service
+from app.services.donation_service import process_pending_donations, verify_pending_donation
+
+DONOR_WALLET = 'D' * 44
+NOT_FOUND = {'success': False, 'error': 'Transaction not found', 'retryable': True}
+MISMATCH = {'success': False, 'error': 'Transfer not found in transaction'}
+
+
+@pytest.fixture
+def project(make_project):
+    return make_project()
+
+
+@pytest.fixture
+def make_donation(project):
+    def make(tx_signature, age=timedelta(0), **fields):
+        created_at = datetime.utcnow() - age
+        donation = Donation(
+            project_id=project.id,
+            amount_lamports=1_500_000_000,
+            tx_signature=tx_signature,
+            donor_wallet=DONOR_WALLET,
+            status='pending',
+            created_at=created_at,
+            updated_at=created_at,
+            **fields
+        )
+        db.session.add(donation)
+        db.session.commit()
+        return donation.id
+
+    return make
+
+
+@pytest.fixture
+def chain(monkeypatch):
+    """Stand-in for the cluster: set .result and .statuses per test."""
+    class Chain:
+        result = {'success': True}
+        statuses = {}
+
+        def verify_transaction(self, **kwargs):
+            if isinstance(self.result, Exception):
+                raise self.result
+            return self.result
+
+        def get_transaction_statuses(self, signatures, search_history=False):
+            return {sig: self.statuses[sig] for sig in signatures if sig in self.statuses}
+
+    chain = Chain()
+    monkeypatch.setattr(donation_service, 'verify_transaction', chain.verify_transaction)
+    monkeypatch.setattr(donation_service, 'get_transaction_statuses', chain.get_transaction_statuses)
+    return chain
+
+
+def _donation(donation_id):
+    db.session.expire_all()
+    return db.session.get(Donation, donation_id)
+
+
+def test_not_found_goes_back_to_the_queue(chain, make_donation):
+    donation_id = make_donation('fresh')
+    chain.result = NOT_FOUND
+
+    assert verify_pending_donation(donation_id) is False
+
+    donation = _donation(donation_id)
+    assert (donation.status, donation.error_message) == ('pending', 'Transaction not found')
+
+
+def test_rpc_error_goes_back_to_the_queue(chain, make_donation):
+    donation_id = make_donation('fresh')
+    chain.result = ConnectionError('node down')
+
+    verify_pending_donation(donation_id)
+
+    assert _donation(donation_id).status == 'pending'
+
+
+def test_not_found_past_give_up_time_fails_retryable(chain, make_donation):
+    donation_id = make_donation('old', age=timedelta(hours=2))
+    chain.result = NOT_FOUND
+
+    verify_pending_donation(donation_id)
+
+    donation = _donation(donation_id)
+    assert (donation.status, donation.retryable) == ('failed', True)
+
+
+def test_mismatch_fails_for_good(chain, make_donation):
+    donation_id = make_donation('wrong')
+    chain.result = MISMATCH
+
+    verify_pending_donation(donation_id)
+
+    donation = _donation(donation_id)
+    assert (donation.status, donation.retryable) == ('failed', False)
+    assert donation.error_message == MISMATCH['error']
+
+
+def test_confirmed_donation_credits_the_project(chain, make_donation, project):
+    donation_id = make_donation('good')
+
+    assert verify_pending_donation(donation_id) is True
+
+    assert _donation(donation_id).status == 'confirmed'
+    assert (project.raised_lamports, project.donation_count) == (1_500_000_000, 1)
+
+
+def test_sweep(chain, make_donation):
+    waiting = make_donation('waiting', age=timedelta(minutes=5))
+    given_up = make_donation('given-up', age=timedelta(hours=2))
+    failed = make_donation('failed', age=timedelta(minutes=5))
+    landed = make_donation('landed', age=timedelta(minutes=5))
+    unknown = make_donation('unknown', age=timedelta(minutes=5))
+    chain.statuses = {'waiting': None, 'given-up': None, 'failed': 'failed', 'landed': 'confirmed'}
+
+    assert process_pending_donations() == 1
+
+    assert _donation(waiting).status == 'pending'
+    assert (_donation(given_up).status, _donation(given_up).retryable) == ('failed', True)
+    assert (_donation(failed).status, _donation(failed).retryable) == ('failed', False)
+    assert _donation(landed).status == 'confirmed'
+    # The status lookup failed, so it is left as it was
+    assert _donation(unknown).status == 'pending'
+
+
+def test_sweep_tries_least_recently_tried_first(chain, make_donation):
+    first = make_donation('first', age=timedelta(minutes=9))
+    second = make_donation('second', age=timedelta(minutes=8))
+    chain.statuses = {'first': None, 'second': None}
+
+    process_pending_donations(limit=1)
+    assert _donation(first).updated_at > _donation(second).updated_at
+
+    # The next sweep reaches the donation the first one left out
+    chain.statuses = {'first': None, 'second': 'confirmed'}
+    assert process_pending_donations(limit=1) == 1
+    assert _donation(second).status == 'confirmed'
+
+
+def _submit(client, project, tx_signature):
+    return client.post('/donations/verify', json={
+        'project_id': project.id,
+        'tx_signature': tx_signature,
+        'amount_sol': '1.5',
+        'donor_wallet': DONOR_WALLET
+    })
+
+
+def test_resubmitting_a_definite_failure_returns_it(client, chain, project):
+    chain.result = MISMATCH
+    assert _submit(client, project, 'wrong').get_json()['status'] == 'failed'
+
+    chain.result = {'success': True}
+    response = _submit(client, project, 'wrong')
+
+    assert response.status_code == 400
+    assert response.get_json() == {'error': MISMATCH['error'], 'status': 'failed'}
+
+
+def test_resubmitting_a_given_up_donation_checks_again(client, chain, project, make_donation):
+    donation_id = make_donation('late', age=timedelta(hours=2))
+    chain.result = NOT_FOUND
+    verify_pending_donation(donation_id)
+    assert _donation(donation_id).retryable is True
+
+    chain.result = {'success': True}
+    response = _submit(client, project, 'late')
+
+    assert response.status_code == 202
+    assert response.get_json()['status'] == 'confirmed'
@@ -0,0 +1,76 @@
+"""Keyset pagination of the JSON list endpoints."""
+from datetime import datetime, timedelta
+
+from app.utils.pagination import encode_cursor
+
+
+def _walk(client, url):
+    """Follow next_cursor from url to the last page, returning every page."""
+    pages = [client.get(url).get_json()]
+    while pages[-1]['has_more']:
+        separator = '&' if '?' in url else '?'
+        response = client.get(f"{url}{separator}cursor={pages[-1]['next_cursor']}")
+        assert response.status_code == 200
+        pages.append(response.get_json())
+    return pages
+
+
+def test_cursor_round_trip_visits_every_project_once(client, make_project):
+    now = datetime.utcnow()
+    projects = [make_project(created_at=now - timedelta(hours=i)) for i in range(5)]
+
+    pages = _walk(client, '/projects/api/list?per_page=2')
+
+    assert [len(page['projects']) for page in pages] == [2, 2, 1]
+    assert pages[-1]['next_cursor'] is None
+    assert [p['id'] for page in pages for p in page['projects']] == [p.id for p in projects]
+    assert 'total' not in pages[0]
+
+
+def test_cursor_round_trip_with_tied_sort_values(client, make_project):
+    # Equal raised amounts are ordered by id, so ties never repeat or skip
+    projects = [make_project(raised_lamports=amount) for amount in (5, 7, 5, 5, 7)]
+
+    pages = _walk(client, '/projects/api/list?per_page=2&sort=popular')
+
+    ids = [p['id'] for page in pages for p in page['projects']]
+    expected = sorted(projects, key=lambda p: (p.raised_lamports, p.id), reverse=True)
+    assert ids == [p.id for p in expected]
+
+
+def test_include_total(client, make_project):
+    for _ in range(3):
+        make_project()
+
+    data = client.get('/projects/api/list?per_page=2&include_total=true').get_json()
+
+    assert data['total'] == 3
+    assert data['has_more'] is True
+
+
+def test_page_parameter_keeps_offset_fields(client, make_project):
+    for _ in range(3):
+        make_project()
+
+    data = client.get('/projects/api/list?per_page=2&page=2').get_json()
+
+    assert len(data['projects']) == 1
+    assert (data['total'], data['pages'], data['current_page']) == (3, 2, 2)
+
+
+def test_bad_cursor(client, make_project):
+    make_project()
+
+    response = client.get('/projects/api/list?cursor=not-a-cursor')
+
+    assert response.status_code == 400
+    assert response.get_json() == {'error': 'Invalid cursor'}
+
+
+def test_cursor_for_another_ordering(client, make_project):
+    make_project()
+
+    # Well formed, but with three sort values where the listing has two
+    response = client.get(f'/projects/api/list?cursor={encode_cursor([1, 2, 3])}')
+
+    assert response.status_code == 400
@@ -0,0 +1,132 @@
+"""Payout claims: leases held by one cron worker at a time."""
+from datetime import datetime, timedelta
+
+import pytest
+
+from app.extensions import db
+from app.models import Payout
+from app.services import payout_service
+from app.services.payout_service import claim_pending_payouts, release_payout_leases
+
+
+@pytest.fixture
+def make_payout(make_project, creator):
+    project = make_project(raised_lamports=2_000_000_000)
+
+    def make(**fields):
+        values = {
+            'project_id': project.id,
+            'total_raised_lamports': 2_000_000_000,
+            'platform_fee_lamports': 50_000_000,
+            'net_amount_lamports': 1_950_000_000,
+            'recipient_wallet': creator.wallet_address,
+            'status': 'pending',
+        }
+        values.update(fields)
+        payout = Payout(**values)
+        db.session.add(payout)
+        db.session.commit()
+        return payout.id
+
+    return make
+
+
+def _payout(payout_id):
+    db.session.expire_all()
+    return db.session.get(Payout, payout_id)
+
+
+def test_claim_leases_pending_payouts(app, make_payout):
+    pending = [make_payout() for _ in range(3)]
+    make_payout(status='processing')
+
+    claimed = claim_pending_payouts('worker-a', limit=2)
+
+    assert [payout.id for payout in claimed] == pending[:2]
+    assert all(payout.lease_owner == 'worker-a' for payout in claimed)
+    lease = claimed[0].lease_expires_at - datetime.utcnow()
+    assert timedelta(seconds=290) < lease <= timedelta(seconds=app.config['PAYOUT_LEASE_SECONDS'])
+
+
+def test_leased_payouts_are_not_claimed_twice(make_payout):
+    first, second = make_payout(), make_payout()
+    claim_pending_payouts('worker-a', limit=1)
+
+    claimed = claim_pending_payouts('worker-b', limit=10)
+
+    assert [payout.id for payout in claimed] == [second]
+    assert _payout(first).lease_owner == 'worker-a'
+
+
+def test_expired_lease_is_claimed_again(make_payout):
+    payout_id = make_payout(
+        lease_owner='crashed-worker',
+        lease_expires_at=datetime.utcnow() - timedelta(seconds=1)
+    )
+
+    claimed = claim_pending_payouts('worker-b', limit=10)
+
+    assert [payout.id for payout in claimed] == [payout_id]
+    assert _payout(payout_id).lease_owner == 'worker-b'
+
+
+def test_release_frees_only_unsigned_payouts(make_payout):
+    unsigned, signed = make_payout(), make_payout()
+    claim_pending_payouts('worker-a', limit=10)
+    Payout.query.filter_by(id=signed).update({'status': 'signed'})
+    db.session.commit()
+
+    release_payout_leases('worker-a')
+
+    assert (_payout(unsigned).lease_owner, _payout(unsigned).lease_expires_at) == (None, None)
+    assert _payout(signed).lease_owner == 'worker-a'
+    assert claim_pending_payouts('worker-b', limit=10)[0].id == unsigned
+
+
+class FakeTransaction:
+    signatures = ['fake-signature']
+
+    def __bytes__(self):
+        return b'signed transaction'
+
+
+@pytest.fixture
+def sent(monkeypatch):
+    """Replace the broadcast, recording the batches that got past on_signed."""
+    sent = []
+
+    def sign_and_send(build, on_signed=None):
+        on_signed(FakeTransaction(), {'blockhash': 'hash', 'last_valid_block_height': 100})
+        sent.append(True)
+        return {'success': True, 'signature': 'fake-signature'}
+
+    monkeypatch.setattr(payout_service, 'sign_and_send', sign_and_send)
+    return sent
+
+
+def test_lease_holder_signs_the_batch(app, make_payout, sent):
+    payout_id = make_payout()
+    claim_pending_payouts('worker-a', limit=10)
+
+    result = payout_service._submit_batch(app, None, 'worker-a', [payout_id], [], None)
+
+    assert result['success'] and sent
+    payout = _payout(payout_id)
+    assert (payout.status, payout.tx_signature, payout.last_valid_block_height) == (
+        'signed', 'fake-signature', 100
+    )
+
+
+def test_lost_lease_stops_the_batch(app, make_payout, sent):
+    payout_id = make_payout()
+    claim_pending_payouts('worker-a', limit=10)
+    # worker-a stalled past its lease and worker-b took the payout over
+    Payout.query.filter_by(id=payout_id).update({'lease_expires_at': datetime.utcnow() - timedelta(seconds=1)})
+    db.session.commit()
+    claim_pending_payouts('worker-b', limit=10)
+
+    result = payout_service._submit_batch(app, None, 'worker-a', [payout_id], [], None)
+
+    assert not result['success'] and not sent
+    payout = _payout(payout_id)
+    assert (payout.status, payout.tx_signature, payout.lease_owner) == ('pending', None, 'worker-b')
@@ -0,0 +1,69 @@
+"""Full-text project search on SQLite FTS5."""
+import pytest
+
+from app.models import Project
+from app.services import search_service
+from app.services.search_service import apply_search, ensure_search_index, reindex_projects
+
+
+@pytest.fixture
+def search_index(app):
+    ensure_search_index()
+    yield
+    # Every test database has the same URL, but not every one has the index
+    search_service._ready.clear()
+
+
+@pytest.fixture
+def projects(search_index, make_project):
+    made = {
+        'shoes': make_project(title='Running shoes', description='<p>Trail shoes for everyone</p>'),
+        'club': make_project(title='Neighbourhood club', description='<p>We run together every week</p>'),
+        'wallet': make_project(title='Solana wallet', description='<p>A friendly wallet</p>'),
+    }
+    reindex_projects()
+    return made
+
+
+def _search(search_query):
+    query, rank = apply_search(Project.query, search_query)
+    return {project.title for project in query.order_by(rank).all()}
+
+
+def test_complete_words_are_stemmed(projects):
+    assert _search('run') == {'Running shoes', 'Neighbourhood club'}
+    assert _search('runs') == {'Running shoes', 'Neighbourhood club'}
+
+
+def test_mid_word_prefix(projects):
+    # "runn" is not a prefix of the stem "run", only of the word "running"
+    assert _search('runn') == {'Running shoes'}
+    assert _search('solan') == {'Solana wallet'}
+
+
+def test_prefix_after_complete_words(projects):
+    assert _search('trail runn') == {'Running shoes'}
+    assert _search('week runn') == set()
+
+
+def test_markup_is_not_indexed(projects):
+    assert _search('p') == set()
+
+
+def test_api_ranks_title_matches_first(client, projects):
+    data = client.get('/projects/api/list?q=run').get_json()
+
+    assert [p['title'] for p in data['projects']] == ['Running shoes', 'Neighbourhood club']
+    assert '<mark>run</mark>' in data['projects'][1]['highlight']
+
+
+def test_index_created_after_first_check_is_used(app, make_project):
+    make_project(title='Running shoes')
+    assert not search_service.search_available()
+
+    ensure_search_index()
+    reindex_projects()
+    try:
+        assert _search('runn') == {'Running shoes'}
+    finally:
+        search_service._ready.clear()
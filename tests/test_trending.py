@@ -0,0 +1,26 @@
+"""Trending score updates, computed in SQL."""
+from datetime import datetime, timedelta
+
+import pytest
+
+from app.extensions import db
+from app.models import Project
+from app.services.trending_service import donation_weight, trending_update
+
+
+def test_power_is_available_on_sqlite(app):
+    assert db.session.execute(db.text('SELECT power(2.0, 0.5)')).scalar() == pytest.approx(2 ** 0.5)
+
+
+def test_donation_is_scaled_to_the_score_time(app, make_project):
+    now = datetime.utcnow()
+    half_life = timedelta(hours=app.config['TRENDING_HALF_LIFE_HOURS'])
+    project = make_project(trending_score=1.0, trending_at=now - half_life)
+
+    Project.query.filter_by(id=project.id).update(trending_update(1_000_000_000, now=now))
+    db.session.commit()
+    db.session.refresh(project)
+
+    # Valued as of trending_at, a donation made one half-life later counts double
+    assert project.trending_score == pytest.approx(1.0 + 2 * donation_weight(1_000_000_000))
+    assert project.trending_at == now - half_life